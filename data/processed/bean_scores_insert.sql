@@ -80,7 +80,7 @@ INSERT INTO bean_scores (
     (74, 8, 9, 7, 3, 8, 9, 8, 92, 'LIGHT'),
     (75, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (76, 8, 9, 5, 7, 8, 9, 8, 92, 'MEDIUM'),
-    (77, 8, 8, 7, 2, 9, 9, 8, 92, 'LIGHT'),
+    (77, 8, 8, 7, 3, 9, 9, 8, 92, 'LIGHT'),
     (78, 9, 8, 6, 2, 9, 9, 8, 93, 'LIGHT'),
     (79, 9, 9, 6, 3, 9, 9, 8, 94, 'LIGHT'),
     (80, 9, 9, 6, 6, 9, 9, 8, 94, 'MEDIUM'),
@@ -594,7 +594,7 @@ INSERT INTO bean_scores (
     (588, 9, 9, 6, 2, 9, 9, 9, 95, 'LIGHT'),
     (589, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (590, 7, 8, 7, 3, 8, 8, 7, 88, 'LIGHT'),
-    (591, 8, 9, 7, 2, 8, 8, 8, 91, 'LIGHT'),
+    (591, 8, 9, 7, 3, 8, 8, 8, 91, 'LIGHT'),
     (592, 8, 8, 6, 6, 9, 9, 8, 92, 'MEDIUM'),
     (593, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (594, 9, 8, 7, 3, 9, 9, 8, 93, 'LIGHT'),
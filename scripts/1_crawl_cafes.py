@@ -23,6 +23,10 @@ import random
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
+
+from id_registry import assign_ids, normalize_key, normalize_keys, registry_exists, seed_registry
+
 # 검색어 목록 (서울 전역)
 SEARCH_QUERIES = [
     # 광역
@@ -488,9 +492,64 @@ def is_target_area(address):
     return "서울" in address
 
 
+def seed_id_registries():
+    """레지스트리가 없으면 이전 크롤링 결과의 store/menu ID로 초기화"""
+    stores_path = os.path.join(OUTPUT_DIR, STORES_FILE)
+    menus_path = os.path.join(OUTPUT_DIR, MENUS_FILE)
+    if not os.path.exists(stores_path):
+        return
+
+    prev_stores = pd.read_csv(stores_path)
+    store_keys = normalize_keys(prev_stores['name'], prev_stores['address'])
+    if not registry_exists('stores'):
+        seed_registry('stores', store_keys, prev_stores['id'],
+                      tiebreak=normalize_keys(prev_stores['phone_number'], prev_stores['description']))
+
+    if not registry_exists('menus') and os.path.exists(menus_path):
+        prev_menus = pd.read_csv(menus_path)
+        menu_store_keys = prev_menus['store_id'].map(dict(zip(prev_stores['id'], store_keys)))
+        prev_menus = prev_menus[menu_store_keys.notna()]
+        menu_keys = menu_store_keys[prev_menus.index] + '|' + normalize_keys(prev_menus['name'])
+        seed_registry('menus', menu_keys, prev_menus['id'],
+                      tiebreak=normalize_keys(prev_menus['description'], prev_menus['price']))
+
+
+def assign_stable_ids(stores, all_menus):
+    """
+    자연 키(가게 이름+주소, 메뉴 이름) 기준으로 고정 ID를 부여합니다.
+
+    Returns:
+        (store_ids, menu_ids): 가게별 ID 리스트, 가게별 메뉴 ID 리스트의 리스트
+    """
+    seed_id_registries()
+
+    store_keys = pd.Series([normalize_key(s.get('name', ''), s.get('address', '')) for s in stores], dtype=object)
+    # 이름+주소가 같은 가게는 전화번호/설명으로 구분 (크롤링 순서와 무관)
+    store_tiebreak = pd.Series([normalize_key(s.get('phone', ''), s.get('description', '')) for s in stores],
+                               dtype=object)
+    store_ids = assign_ids(store_keys, 'stores', tiebreak=store_tiebreak).tolist()
+
+    menu_keys = pd.Series([
+        f"{store_key}|{normalize_key(menu.get('name', ''))}"
+        for store_key, menus in zip(store_keys, all_menus)
+        for menu in menus
+    ], dtype=object)
+    # 한 가게의 같은 이름 메뉴는 설명/가격으로 구분
+    menu_tiebreak = pd.Series([
+        normalize_key(menu.get('description', ''), menu.get('price', 0))
+        for menus in all_menus
+        for menu in menus
+    ], dtype=object)
+    flat_menu_ids = iter(assign_ids(menu_keys, 'menus', tiebreak=menu_tiebreak).tolist())
+    menu_ids = [[next(flat_menu_ids) for _ in menus] for menus in all_menus]
+
+    return store_ids, menu_ids
+
+
 def save_results(stores, all_menus):
-    """결과를 CSV로 저장"""
+    """결과를 CSV로 저장 (ID는 id_registry 기준으로 재실행 간 고정)"""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    store_ids, menu_ids = assign_stable_ids(stores, all_menus)
 
     # stores.csv
     stores_path = os.path.join(OUTPUT_DIR, STORES_FILE)
@@ -502,9 +561,9 @@ def save_results(stores, all_menus):
             'thumbnail_url', 'open_time', 'close_time'
         ])
 
-        for i, store in enumerate(stores, 1):
+        for store_id, store in zip(store_ids, stores):
             writer.writerow([
-                i, 1, '',
+                store_id, 1, '',
                 store.get('name', ''),
                 store.get('description', ''),
                 store.get('address', ''),
@@ -523,9 +582,9 @@ def save_results(stores, all_menus):
         writer = csv.writer(f)
         writer.writerow(['id', 'store_id', 'name', 'description', 'price', 'category', 'image_url'])
 
-        menu_id = 1
-        for store_id, menus in enumerate(all_menus, 1):
-            for menu in menus:
+        menu_count = 0
+        for store_id, menus, ids in zip(store_ids, all_menus, menu_ids):
+            for menu_id, menu in zip(ids, menus):
                 writer.writerow([
                     menu_id, store_id,
                     menu.get('name', ''),
@@ -533,9 +592,9 @@ def save_results(stores, all_menus):
                     menu.get('price', 0),
                     '', ''
                 ])
-                menu_id += 1
+                menu_count += 1
 
-    print(f"menus.csv 저장: {menu_id - 1}개")
+    print(f"menus.csv 저장: {menu_count}개")
 
 
 def main():
@@ -11,6 +11,9 @@ coffee_clean.csv 데이터셋을 처리하여 beans 관련 CSV 생성
     - data/beans.csv: 원두 기본 정보 (farm, variety, processing 포함)
     - data/bean_flavor_notes.csv: 원두-향미 매핑
     - data/bean_scores.csv: 원두별 맛 점수
+    - data/bean_descriptions.csv: 원두별 원문 향미 설명 (desc_1, desc_3)
+    - data/sampling_coverage.csv: 샘플링 커버리지 곡선 (coverage vs random)
+    - data/bean_clusters.csv: 근사 중복 클러스터 (행 index → 대표 행 index)
 """
 
 import os
@@ -22,6 +25,9 @@ from typing import Optional
 
 import pandas as pd
 
+from bean_dedup import find_duplicate_clusters, summarize_clusters
+from bean_sampling import select_diverse_sample, print_curve
+
 # LangChain import
 try:
     from langchain.chat_models import init_chat_model
@@ -55,9 +61,12 @@ ROAST_MAPPING = {
 REQUIRED_COLUMNS = ['name', 'roaster', 'origin', 'roast', 'desc_1', 'desc_3',
                     'rating', 'aroma', 'acid', 'body', 'flavor', 'aftertaste']
 
-# 랜덤 샘플링 개수
+# 샘플링 개수
 SAMPLE_SIZE = 1000
 
+# 샘플링 방식: 'coverage' (국가/가공법/로스팅/향미 커버리지 최대화) 또는 'random'
+SAMPLING_STRATEGY = 'coverage'
+
 # 원두 이름으로 부적절한 키워드 (영어)
 INVALID_NAME_KEYWORDS = [
     'Roasting', 'Roaster', 'Roasters', 'Coffee Co', 'Coffee Company',
@@ -225,6 +234,57 @@ JSON만 응답해주세요."""
         return None
 
 
+def append_bean_records(row, result: dict, beans_processed: list, bean_scores: list,
+                        bean_flavor_notes: list, bean_descriptions: list) -> int:
+    """LLM 결과와 원본 행의 점수로 beans/scores/flavor_notes/descriptions 레코드를 추가하고 bean_id 반환"""
+    # 1. Roastery 처리 - 고정 ID 사용
+    roastery_id = DEFAULT_ROASTERY_ID
+
+    # 2. Bean 처리 - 데이터셋의 roast 값을 1:1 매핑
+    roast_original = row.get('roast', 'Medium-Light')
+    roasting_level = ROAST_MAPPING.get(roast_original, 'MEDIUM')
+
+    bean_id = len(beans_processed) + 1
+
+    beans_processed.append({
+        "id": bean_id,
+        "roastery_id": roastery_id,
+        "name": result.get('name', row['name']),
+        "country": result.get('country', ''),
+        "farm": result.get('farm', ''),
+        "variety": result.get('variety', ''),
+        "processing_method": result.get('processing_method', ''),
+        "roasting_level": roasting_level,
+    })
+
+    # 점수 저장 (중복 클러스터 멤버도 자신의 리뷰 점수 사용)
+    bean_scores.append({
+        "bean_id": bean_id,
+        "rating": row.get('rating', None),
+        "aroma": row.get('aroma', None),
+        "acidity": row.get('acid', None),
+        "body": row.get('body', None),
+        "flavor": row.get('flavor', None),
+        "aftertaste": row.get('aftertaste', None),
+    })
+
+    # flavor 매핑
+    for flavor_id in result.get('flavor_ids', []):
+        bean_flavor_notes.append({
+            "bean_id": bean_id,
+            "flavor_id": flavor_id,
+        })
+
+    # 원문 향미 설명 (flavor_embeddings.py 임베딩용)
+    bean_descriptions.append({
+        "bean_id": bean_id,
+        "desc_1": row.get('desc_1', None),
+        "desc_3": row.get('desc_3', None),
+    })
+
+    return bean_id
+
+
 # ============================================================================
 # 메인 함수
 # ============================================================================
@@ -276,10 +336,24 @@ def main():
     df = df[~df['name'].str.contains(pattern, case=False, na=False)]
     print(f"  - 부적절한 이름 제외 후: {len(df)}개")
 
-    # 랜덤 샘플링 (토큰 비용 절감)
+    # 샘플링 (토큰 비용 절감)
     if len(df) > SAMPLE_SIZE:
-        df = df.sample(n=SAMPLE_SIZE, random_state=42)
-        print(f"  - 랜덤 샘플링: {SAMPLE_SIZE}개")
+        if SAMPLING_STRATEGY == 'coverage':
+            df, curve_df = select_diverse_sample(df, SAMPLE_SIZE, COFFEE_COUNTRIES)
+            curve_df.to_csv(DATA_DIR / 'sampling_coverage.csv', index=False, encoding='utf-8-sig')
+            print(f"  - 커버리지 기반 샘플링: {SAMPLE_SIZE}개")
+            print_curve(curve_df)
+        else:
+            df = df.sample(n=SAMPLE_SIZE, random_state=42)
+            print(f"  - 랜덤 샘플링: {SAMPLE_SIZE}개")
+
+    # 근사 중복 클러스터링 (대표 원두만 LLM 호출, 결과는 멤버에 복사)
+    cluster_rep = find_duplicate_clusters(df)
+    cluster_members = cluster_rep.groupby(cluster_rep).groups
+    cluster_stats = summarize_clusters(cluster_rep)
+    print(f"  - 근사 중복 클러스터: {cluster_stats['duplicate_clusters']}개 "
+          f"(LLM 호출 {cluster_stats['saved_calls']}개 절감)")
+    cluster_rep.to_csv(DATA_DIR / 'bean_clusters.csv', index_label='index', encoding='utf-8-sig')
 
     # 2. LangChain 설정
     print("\n[2/4] GPT-4o-mini 설정...")
@@ -298,11 +372,13 @@ def main():
     beans_path = DATA_DIR / 'beans.csv'
     bean_flavor_path = DATA_DIR / 'bean_flavor_notes.csv'
     bean_scores_path = DATA_DIR / 'bean_scores.csv'
+    bean_descriptions_path = DATA_DIR / 'bean_descriptions.csv'
     processed_path = DATA_DIR / 'processed_indices.json'
 
     beans_processed = []
     bean_flavor_notes = []
     bean_scores = []
+    bean_descriptions = []
     processed_indices = set()
 
     if processed_path.exists():
@@ -320,68 +396,45 @@ def main():
         if bean_scores_path.exists():
             existing_scores = pd.read_csv(bean_scores_path)
             bean_scores = existing_scores.to_dict('records')
+        if bean_descriptions_path.exists():
+            existing_descriptions = pd.read_csv(bean_descriptions_path)
+            bean_descriptions = existing_descriptions.to_dict('records')
 
     skipped_count = 0
+    llm_calls = 0
 
     for idx, row in df.iterrows():
         # 이미 처리된 원두는 스킵
         if idx in processed_indices:
             continue
 
+        # 클러스터 멤버는 대표 원두 처리 시 함께 채워짐
+        if cluster_rep[idx] != idx:
+            continue
+
         print(f"  처리 중: {len(processed_indices)+1}/{len(df)} - {row['name'][:40]}...", end='\r')
 
         result = process_bean_with_langchain(model, row.to_dict())
+        llm_calls += 1
+        members = cluster_members[idx]
 
         if result is None:
-            skipped_count += 1
-            processed_indices.add(idx)
+            skipped_count += len(members)
+            processed_indices.update(members)
             continue
 
-        # 1. Roastery 처리 - 고정 ID 사용
-        roastery_id = DEFAULT_ROASTERY_ID
-
-        # 2. Bean 처리 - 데이터셋의 roast 값을 1:1 매핑
-        roast_original = row.get('roast', 'Medium-Light')
-        roasting_level = ROAST_MAPPING.get(roast_original, 'MEDIUM')
-
-        bean_id = len(beans_processed) + 1
-
-        beans_processed.append({
-            "id": bean_id,
-            "roastery_id": roastery_id,
-            "name": result.get('name', row['name']),
-            "country": result.get('country', ''),
-            "farm": result.get('farm', ''),
-            "variety": result.get('variety', ''),
-            "processing_method": result.get('processing_method', ''),
-            "roasting_level": roasting_level,
-        })
-
-        # 점수 저장
-        bean_scores.append({
-            "bean_id": bean_id,
-            "rating": row.get('rating', None),
-            "aroma": row.get('aroma', None),
-            "acidity": row.get('acid', None),
-            "body": row.get('body', None),
-            "flavor": row.get('flavor', None),
-            "aftertaste": row.get('aftertaste', None),
-        })
-
-        # flavor 매핑
-        for flavor_id in result.get('flavor_ids', []):
-            bean_flavor_notes.append({
-                "bean_id": bean_id,
-                "flavor_id": flavor_id,
-            })
-
-        processed_indices.add(idx)
+        # 대표 원두의 LLM 결과를 클러스터 전체에 fan-out
+        for member_idx in members:
+            append_bean_records(df.loc[member_idx], result, beans_processed,
+                                bean_scores, bean_flavor_notes, bean_descriptions)
+            processed_indices.add(member_idx)
 
         # 중간 저장
-        if len(processed_indices) % SAVE_INTERVAL == 0:
+        if llm_calls % SAVE_INTERVAL == 0:
             pd.DataFrame(beans_processed).to_csv(beans_path, index=False, encoding='utf-8-sig')
             pd.DataFrame(bean_flavor_notes).to_csv(bean_flavor_path, index=False, encoding='utf-8-sig')
             pd.DataFrame(bean_scores).to_csv(bean_scores_path, index=False, encoding='utf-8-sig')
+            pd.DataFrame(bean_descriptions).to_csv(bean_descriptions_path, index=False, encoding='utf-8-sig')
             with open(processed_path, 'w') as f:
                 json.dump(list(processed_indices), f)
             print(f"\n  [중간 저장] {len(beans_processed)}개 원두 처리됨")
@@ -410,6 +463,10 @@ def main():
     bean_scores_df.to_csv(bean_scores_path, index=False, encoding='utf-8-sig')
     print(f"  - {bean_scores_path}")
 
+    bean_descriptions_df = pd.DataFrame(bean_descriptions)
+    bean_descriptions_df.to_csv(bean_descriptions_path, index=False, encoding='utf-8-sig')
+    print(f"  - {bean_descriptions_path}")
+
     print("\n" + "=" * 60)
     print("완료!")
     print("=" * 60)
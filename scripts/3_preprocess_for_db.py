@@ -4,12 +4,19 @@ crawlers_v3 데이터를 schema.sql에 맞게 전처리하는 스크립트
 생성 파일:
 - roasteries.csv: 로스터리(브랜드) 테이블
 - stores_final.csv: roastery_id가 매핑된 stores 테이블
+- franchise_candidates.csv: 자동 탐지된 프랜차이즈 후보 (approved=True로 승인 시 반영)
 """
 
+import re
+from functools import lru_cache
+
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 
+from franchise_discovery import discover_franchises, load_approved_brands, save_candidates
+from id_registry import REGISTRY_DIR, assign_ids, normalize_keys, registry_exists, seed_registry
+
 # 프랜차이즈 브랜드 목록 (2개 이상 매장이 있는 브랜드)
 FRANCHISE_BRANDS = [
     '테라로사',
@@ -24,83 +31,128 @@ FRANCHISE_BRANDS = [
     '원유로 스페셜티',
 ]
 
+# Admin Roastery (Kaggle 원두 등 출처 미상, beans.roastery_id 기본값)
+ADMIN_ROASTERY_ID = 1
+ADMIN_ROASTERY_NAME = 'Admin Roastery'
+
+
+@lru_cache(maxsize=None)
+def compile_brand_pattern(brands: tuple) -> re.Pattern:
+    """브랜드 목록을 하나의 정규식으로 컴파일 (대소문자 무시, 목록별로 한 번만 컴파일)"""
+    return re.compile('(' + '|'.join(re.escape(brand) for brand in brands) + ')', re.IGNORECASE)
 
-def extract_brand_from_name(store_name: str) -> Optional[str]:
+
+def extract_brand_from_name(store_name: str, brands=FRANCHISE_BRANDS) -> Optional[str]:
     """
     가게 이름에서 프랜차이즈 브랜드를 추출합니다.
 
+    영문 브랜드는 대소문자를 무시하고 비교합니다. ("5to7" → "5TO7&구욱희씨"도 일치)
+
     Returns:
-        프랜차이즈 브랜드명 또는 None (독립 카페인 경우)
+        프랜차이즈 브랜드명 (brands에 적힌 표기) 또는 None (독립 카페인 경우)
     """
-    for brand in FRANCHISE_BRANDS:
-        if brand in store_name:
+    name = store_name.casefold()
+    for brand in brands:
+        if brand.casefold() in name:
             return brand
     return None
 
 
-def create_roasteries(stores_df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+def extract_brands(names: pd.Series, brands=FRANCHISE_BRANDS) -> pd.Series:
+    """
+    가게 이름 Series에서 프랜차이즈 브랜드를 한 번에 추출합니다.
+
+    정규식은 가장 왼쪽 매칭을 반환하므로, 브랜드가 2개 이상 포함된 (드문) 이름만
+    extract_brand_from_name으로 다시 계산해 brands 목록 순서 우선 규칙을 유지합니다.
+
+    Returns:
+        브랜드명 Series (brands에 적힌 표기, 독립 카페는 NaN)
+    """
+    pattern = compile_brand_pattern(tuple(brands))
+    names = names.astype('string')
+    # 대소문자를 무시하고 찾은 원문("5TO7") → brands 표기("5to7"), 같은 브랜드는 같은 roastery_key
+    canonical = {}
+    for brand in brands:
+        canonical.setdefault(brand.casefold(), brand)
+    extracted = names.str.extract(pattern, expand=False).str.casefold().map(canonical)
+
+    ambiguous = names.str.count(pattern) > 1
+    if ambiguous.any():
+        extracted[ambiguous] = names[ambiguous].map(lambda name: extract_brand_from_name(name, brands))
+
+    return extracted
+
+
+def add_roastery_keys(stores_df: pd.DataFrame, brands=FRANCHISE_BRANDS) -> pd.DataFrame:
+    """
+    brand, roastery_key 컬럼을 추가합니다.
+
+    roastery_key: 프랜차이즈는 브랜드명, 독립 카페는 store_{id}
+    """
+    stores_df = stores_df.copy()
+    stores_df['brand'] = extract_brands(stores_df['name'], brands)
+    stores_df['roastery_key'] = stores_df['brand'].fillna('store_' + stores_df['id'].astype(str))
+    return stores_df
+
+
+def create_roasteries(stores_df: pd.DataFrame, brands=FRANCHISE_BRANDS,
+                      registry_dir: Path = REGISTRY_DIR) -> tuple[pd.DataFrame, dict]:
     """
     roasteries 테이블 데이터를 생성합니다.
 
+    ID는 roastery_key 기준 레지스트리(id_registry)에서 가져오므로 재실행해도 유지됩니다.
+    새 roastery는 프랜차이즈 브랜드(brands 순서) → 독립 카페(가게 순서)로 다음 번호를 받습니다.
+    id=1은 Admin Roastery로 예약되어 있습니다.
+
     Returns:
         (roasteries_df, brand_to_roastery_id): roasteries 데이터프레임과 브랜드-ID 매핑
     """
-    roasteries = []
-    brand_to_roastery_id = {}
-    roastery_id = 1
-
-    # 1. 프랜차이즈 브랜드 먼저 추가
-    for brand in FRANCHISE_BRANDS:
-        # 해당 브랜드 매장이 실제로 있는지 확인
-        has_stores = stores_df['name'].str.contains(brand, na=False).any()
-        if has_stores:
-            roasteries.append({
-                'id': roastery_id,
-                'name': brand,
-                'logo_url': '',
-                'website_url': '',
-            })
-            brand_to_roastery_id[brand] = roastery_id
-            roastery_id += 1
-
-    # 2. 독립 카페 추가 (프랜차이즈가 아닌 가게들)
-    for _, store in stores_df.iterrows():
-        store_name = store['name']
-        brand = extract_brand_from_name(store_name)
-
-        if brand is None:  # 독립 카페
-            roasteries.append({
-                'id': roastery_id,
-                'name': store_name,
-                'logo_url': '',
-                'website_url': '',
-            })
-            # store_id를 키로 사용하여 나중에 매핑
-            brand_to_roastery_id[f"store_{store['id']}"] = roastery_id
-            roastery_id += 1
-
-    roasteries_df = pd.DataFrame(roasteries)
+    if 'roastery_key' not in stores_df.columns:
+        stores_df = add_roastery_keys(stores_df, brands)
+
+    # 프랜차이즈는 목록 순서, 독립 카페는 맨 뒤에 가게 순서 유지 (stable sort)
+    brand_rank = {brand: rank for rank, brand in enumerate(brands)}
+    rank = stores_df['brand'].map(brand_rank).fillna(len(brands))
+    ordered = stores_df.iloc[rank.argsort(kind='stable')]
+
+    codes, keys = pd.factorize(ordered['roastery_key'])
+    display_names = ordered['brand'].fillna(ordered['name'])
+    first_rows = pd.Series(codes).drop_duplicates().index
+
+    roastery_ids = assign_ids(normalize_keys(pd.Series(keys)), 'roasteries',
+                              reserved=ADMIN_ROASTERY_ID, registry_dir=registry_dir)
+
+    roasteries_df = pd.DataFrame({
+        'id': [ADMIN_ROASTERY_ID] + roastery_ids.tolist(),
+        'name': [ADMIN_ROASTERY_NAME] + display_names.iloc[first_rows].tolist(),
+        'logo_url': '',
+        'website_url': '',
+    })
+    brand_to_roastery_id = dict(zip(keys, roastery_ids))
     return roasteries_df, brand_to_roastery_id
 
 
-def update_stores_with_roastery_id(stores_df: pd.DataFrame, brand_to_roastery_id: dict) -> pd.DataFrame:
+def seed_roastery_registry(final_stores_path: Path, brands=FRANCHISE_BRANDS,
+                           registry_dir: Path = REGISTRY_DIR):
+    """레지스트리가 없으면 기존 최종 stores.csv의 roastery_id로 초기화 (현재 DB의 ID 유지)"""
+    if registry_exists('roasteries', registry_dir) or not final_stores_path.exists():
+        return
+    final_stores = add_roastery_keys(pd.read_csv(final_stores_path), brands)
+    seed_registry('roasteries', normalize_keys(final_stores['roastery_key']),
+                  final_stores['roastery_id'], registry_dir)
+    print(f"  - roastery ID 레지스트리 초기화: {final_stores_path}")
+
+
+def update_stores_with_roastery_id(stores_df: pd.DataFrame, brand_to_roastery_id: dict,
+                                   brands=FRANCHISE_BRANDS) -> pd.DataFrame:
     """
     stores 데이터프레임에 올바른 roastery_id를 매핑합니다.
     """
-    def get_roastery_id(row):
-        store_name = row['name']
-        store_id = row['id']
-
-        # 프랜차이즈인지 확인
-        brand = extract_brand_from_name(store_name)
-        if brand:
-            return brand_to_roastery_id[brand]
-        else:
-            # 독립 카페
-            return brand_to_roastery_id[f"store_{store_id}"]
+    if 'roastery_key' not in stores_df.columns:
+        stores_df = add_roastery_keys(stores_df, brands)
 
     stores_df = stores_df.copy()
-    stores_df['roastery_id'] = stores_df.apply(get_roastery_id, axis=1)
+    stores_df['roastery_id'] = stores_df['roastery_key'].map(brand_to_roastery_id)
 
     # schema에 맞게 누락된 컬럼 추가 (기본값 설정)
     stores_df['average_rating'] = 0.0
@@ -137,13 +189,30 @@ def main():
     stores_df = pd.read_csv(stores_path)
     print(f"  - 총 {len(stores_df)}개 stores 로드됨")
 
+    # 프랜차이즈 후보 탐지 (검토 파일에서 approved=True인 브랜드만 반영)
+    review_path = data_dir / 'franchise_candidates.csv'
+    approved_brands = load_approved_brands(review_path)
+    brands = FRANCHISE_BRANDS + [b for b in approved_brands if b not in FRANCHISE_BRANDS]
+
+    candidates = discover_franchises(stores_df, brands)
+    save_candidates(candidates, review_path)
+    new_candidates = candidates[~candidates['in_franchise_list']]
+    print(f"  - 승인된 추가 브랜드: {len(brands) - len(FRANCHISE_BRANDS)}개")
+    print(f"  - 새 프랜차이즈 후보: {len(new_candidates)}개 (검토: {review_path})")
+    for _, candidate in new_candidates.iterrows():
+        print(f"    ? {candidate['brand']} ({candidate['store_count']}개 매장): {candidate['example_names']}")
+
+    # 브랜드 추출은 여기서 한 번만 수행 (이후 단계는 roastery_key 컬럼 재사용)
+    stores_df = add_roastery_keys(stores_df, brands)
+
     # 2. roasteries 생성
     print("\n[2/4] roasteries 테이블 생성 중...")
-    roasteries_df, brand_to_roastery_id = create_roasteries(stores_df)
+    seed_roastery_registry(data_dir / 'final' / 'stores.csv', brands)
+    roasteries_df, brand_to_roastery_id = create_roasteries(stores_df, brands)
 
     # 프랜차이즈 수 계산
     franchise_count = len([b for b in brand_to_roastery_id.keys() if not b.startswith('store_')])
-    independent_count = len(roasteries_df) - franchise_count
+    independent_count = len(brand_to_roastery_id) - franchise_count
 
     print(f"  - 프랜차이즈 브랜드: {franchise_count}개")
     print(f"  - 독립 카페: {independent_count}개")
@@ -151,11 +220,11 @@ def main():
 
     # 3. stores에 roastery_id 매핑
     print("\n[3/4] stores에 roastery_id 매핑 중...")
-    stores_final_df = update_stores_with_roastery_id(stores_df, brand_to_roastery_id)
+    stores_final_df = update_stores_with_roastery_id(stores_df, brand_to_roastery_id, brands)
 
     # 프랜차이즈별 매핑 확인
     print("\n  프랜차이즈 매핑 결과:")
-    for brand in FRANCHISE_BRANDS:
+    for brand in brands:
         if brand in brand_to_roastery_id:
             roastery_id = brand_to_roastery_id[brand]
             count = (stores_final_df['roastery_id'] == roastery_id).sum()
@@ -2,128 +2,45 @@
 메뉴-원두 매핑 스크립트 v2
 
 매핑 전략:
-1. 가게 description에서 국가명 추출 → 그 가게의 전체 메뉴에 해당 국가 대표 원두 매핑
+1. 가게 description에서 국가명 추출 → 그 가게의 전체 메뉴에 해당 국가 원두 매핑
 2. 메뉴명에 원두 정보(국가/지역/품종)가 있으면 더 정확한 개별 매핑
-3. 국가별 대표 원두 + 세부 키워드 매칭으로 적절한 원두 선택
+3. 해당 국가의 모든 원두를 향미 유사도 + 세부 키워드 + 평점으로 랭킹하여 선택 (bean_ranking.py)
+   국가 → 키워드 → 원두 인덱스는 beans.csv에서 생성하여 캐시 (country_bean_index.py)
+4. 메뉴명에 여러 원산지가 있으면 블렌드로 보고 원산지마다 매핑 (is_blended=True)
+5. 매핑마다 신뢰도(confidence) 기록: 메뉴명 > 가게 설명,
+   기준 미만은 검토 파일(menu_bean_mappings_review.csv)로 분리
+가게 설명 추출 결과는 설명 해시 기준으로 캐시하여 바뀐 가게만 다시 분석 (store_origin_index.py)
 """
 
+import numpy as np
 import pandas as pd
-import re
 from pathlib import Path
 
+from bean_ranking import build_ranker, rank_beans, score_components
+from country_bean_index import build_country_bean_index, keyword_bean_ids, load_country_bean_index
+from keyword_trie import build_trie_pattern
+from origin_matcher import build_origin_matcher, match_origin_terms
+from store_origin_index import build_store_origin_index, load_store_origin_index
+
 # 경로 설정
 DATA_DIR = Path(__file__).parent.parent / "data"
 STORES_DIR = DATA_DIR / "stores"
 BEANS_DIR = DATA_DIR / "beans"
 
+# 디버그 파일에 기록할 후보 원두 수
+TOP_K_CANDIDATES = 3
 
-# === 국가별 대표 원두 사전 ===
-# 각 국가의 default 원두 ID와 키워드별 원두 ID
-# 키워드가 매칭되면 해당 원두를, 아니면 default 원두 사용
-
-COUNTRY_BEANS = {
-    "에티오피아": {
-        "default": [4, 36, 68],  # 구지 함벨라, 예가체프 내추럴, 구지
-        "구지": [4, 29, 33, 56, 66],  # 구지 관련 원두들
-        "예가체프": [36, 42, 70, 156, 204],  # 예가체프 관련
-        "시다모": [65, 81, 128, 337],  # 시다모 관련 (65: 시다마 74110)
-        "시다마": [65, 81, 128, 337],
-        "함벨라": [4, 30, 167, 305],  # 함벨라 관련
-        "하라르": [585],
-        "하라": [585],
-        "게이샤": [4, 36],  # 에티오피아 게이샤는 일반적이지 않으므로 default
-        "게샤": [4, 36],
-    },
-    "콜롬비아": {
-        "default": [1, 11, 85],  # 플라나다스, 안티오키아, 산 페드로
-        "게이샤": [94, 168, 215, 301, 321],  # 게이샤 품종
-        "게샤": [25, 50, 52, 346, 412],  # 게샤 품종
-        "핑크": [63, 150, 252, 401],  # 핑크 부르봉
-        "부르봉": [63, 719, 969],
-        "나리뇨": [301],  # 나리뇨 지역
-    },
-    "케냐": {
-        "default": [2, 28, 47],  # 키안두, 투이킷 AA, 키리니아가
-        "AA": [28, 83, 86],  # AA 등급
-        "피베리": [2, 71],  # 피베리
-    },
-    "과테말라": {
-        "default": [5, 9, 10],  # 5a 포니엔테, 발렌톤, 캄파멘토 알토
-        "안티구아": [77],  # 안티구아 지역 (77: 안티구아 5a 수르)
-        "아카테낭고": [87],  # 아카테낭고
-        "파카마라": [13, 37, 87],  # 파카마라 품종
-    },
-    "코스타리카": {
-        "default": [18, 44, 62],  # 타라주, 아네로빅, 루이스 캄포스
-        "타라주": [18, 149, 653, 701],
-        "아네로빅": [44, 62, 885],
-        "게이샤": [39, 149],  # 볼칸 아줄 게이샤, 타라주 게이샤
-        "게샤": [39, 149],
-    },
-    "파나마": {
-        "default": [31, 32, 79],  # 에스메랄다, 부에노스 아이레스 게이샤, 핀카 라스 누베스
-        "게이샤": [32, 79, 84],
-        "게샤": [32, 79, 84],
-        "에스메랄다": [31, 32],
-        "보케테": [84],  # 엘리다 에스테이트
-    },
-    "인도네시아": {
-        "default": [17, 46, 185],  # 가요 아체, 수마트라 아체 가요, 케린치
-        "수마트라": [17, 46, 185, 193, 273],
-        "만델링": [752],
-        "자바": [898],
-        "아체": [17, 46, 839],
-        "가요": [17, 46, 839],
-    },
-    "하와이": {
-        "default": [20, 41, 43],  # 코나 락틱, 코나 모카, 코나 내추럴스
-        "코나": [20, 41, 43, 75],
-    },
-    "브라질": {
-        "default": [38, 113, 289],  # 레드 카투아이, 세라도
-        "세라도": [289],
-        "카투아이": [38],
-    },
-    "르완다": {
-        "default": [22, 74, 97, 98],  # 니루지사, 키부 벨트, 칸주, 르완다
-    },
-    "페루": {
-        "default": [35, 93],  # 피우라, 파스코
-        "게이샤": [93],
-        "게샤": [93],
-    },
-    "에콰도르": {
-        "default": [7, 60, 91],  # 크루즈 로마, 라 호세피나, 라 호르미가
-    },
-    "엘살바도르": {
-        "default": [16, 40, 92],  # 마리오 아길라, 파카마라, 핀카 라스 두아나스
-        "파카마라": [40, 92],
-    },
-    "온두라스": {
-        "default": [12],  # 허니 온두라스 콤사
-    },
-    "예멘": {
-        "default": [127, 354],  # 예멘 원두 IDs (확인 필요)
-        "모카": [127],
-    },
-    "멕시코": {
-        "default": [14, 59],  # 알투라, 게이샤 베라크루즈
-        "게이샤": [59],
-        "게샤": [59],
-    },
-    "니카라과": {
-        "default": [37],  # 미에리쉬 핀카
-    },
-    "베트남": {
-        "default": [799],  # 베트남 로부스타
-    },
-    "부룬디": {
-        "default": [131, 333],
-    },
-    "타이완": {
-        "default": [78],  # 올루링 센트
-    },
+# === 매핑 신뢰도 ===
+# 매칭 출처별 기본 신뢰도
+SOURCE_CONFIDENCE = {
+    'menu_name': 0.7,
+    'store_description': 0.4,
 }
+# 선택된 원두와의 근거(향미 유사도 또는 지역/품종 키워드 일치, 0~1)에 따른 가산
+EVIDENCE_WEIGHT = 0.3
+# 이 값 미만인 매핑은 검토 파일로 분리
+REVIEW_THRESHOLD = 0.4
+
 
 # 국가명 변형 처리 (변형 -> 정규화된 이름)
 COUNTRY_ALIASES = {
@@ -162,6 +79,7 @@ COUNTRY_ALIASES = {
 
     # 케냐
     "케니아": "케냐",
+    "켄야": "케냐",
 
     # 콜롬비아
     "콜럼비아": "콜롬비아",
@@ -180,12 +98,64 @@ COUNTRY_ALIASES = {
     # 엘살바도르
     "엘 살바도르": "엘살바도르",
 
+    # 에콰도르 / 르완다 / 타이완
+    "에쿠아도르": "에콰도르",
+    "루완다": "르완다",
+    "대만": "타이완",
+
     # 예멘
     "모카": "예멘",
 }
 
-# beans.csv에 있는 실제 국가명 목록
-BEAN_COUNTRIES = list(COUNTRY_BEANS.keys())
+
+# === 원두 국가 목록 ===
+# 국가 → 키워드 → 원두 ID 인덱스(COUNTRY_BEANS 역할)는 beans.csv에서 생성 (country_bean_index.py)
+# 국가 목록도 같은 beans.csv에서 만들므로 메뉴에서 찾은 국가에는 항상 랭킹 후보 원두가 있음
+
+# 가게 설명에서 원산지가 아닌 뜻으로 주로 쓰이는 국가명 (예: "미국 커피 품질 학회(CQI)", "미국 로스터리")
+NON_ORIGIN_COUNTRIES = {"미국"}
+
+
+def load_bean_countries(paths=(BEANS_DIR / "beans.csv", DATA_DIR / "final" / "beans.csv")) -> list:
+    """
+    beans.csv의 국가 목록 (COUNTRY_ALIASES로 표기 통일, 원두 수 내림차순 = 키워드 우선순위)
+
+    처음으로 존재하는 경로를 사용하고, 여러 국가가 섞인 표기("아이티; 에티오피아")와
+    NON_ORIGIN_COUNTRIES는 키워드로 쓰지 않습니다.
+    """
+    path = next((path for path in paths if path.exists()), None)
+    if path is None:
+        return []
+    countries = pd.read_csv(path, usecols=['country'])['country'].dropna().astype(str).str.strip()
+    countries = countries.map(lambda country: COUNTRY_ALIASES.get(country, country))
+    keep = (countries != '') & ~countries.str.contains(r'[;/]') & ~countries.isin(NON_ORIGIN_COUNTRIES)
+    counts = countries[keep].value_counts()
+    return sorted(counts.index, key=lambda country: (-counts[country], country))
+
+
+BEAN_COUNTRIES = load_bean_countries()
+
+# 품종명/메뉴명으로도 쓰이는 지역명 (자바 품종, 카페 모카)
+# 메뉴명에 다른 원산지가 함께 있으면 원산지로 보지 않음 (블렌드 오판 방지)
+VARIETY_ALIASES = {"자바", "모카"}
+
+# 추가 키워드 (품종/등급, 가공법)
+VARIETY_KEYWORDS = ["게이샤", "게샤", "파카마라", "부르봉", "핑크", "AA", "피베리"]
+PROCESSING_KEYWORDS = ["내추럴", "워시드", "허니", "아네로빅"]
+EXTRA_KEYWORDS = VARIETY_KEYWORDS + PROCESSING_KEYWORDS
+
+# 검색 대상 전체 키워드 (국가명 + 지역명 + 품종명), 순서 = 우선순위
+ALL_TERMS = list(dict.fromkeys(BEAN_COUNTRIES + list(COUNTRY_ALIASES.keys()) + EXTRA_KEYWORDS))
+TERM_PRIORITY = {term: i for i, term in enumerate(ALL_TERMS)}
+
+# 국가 내 원두를 좁히는 세부 키워드 (지역명 + 품종/가공법)
+DETAIL_TERMS = [term for term in ALL_TERMS if term not in BEAN_COUNTRIES]
+
+
+KEYWORD_PATTERN = build_trie_pattern(ALL_TERMS)
+
+# 영문/약어/오타/띄어쓰기 변형 근사 매처 ("Ethiopia Guji", "ETH 구지", "코스타 리카")
+ORIGIN_MATCHER = build_origin_matcher(ALL_TERMS)
 
 
 def load_data():
@@ -193,9 +163,15 @@ def load_data():
     stores = pd.read_csv(STORES_DIR / "stores_final.csv")
     menus = pd.read_csv(STORES_DIR / "menus.csv")
     beans = pd.read_csv(BEANS_DIR / "beans.csv")
+    flavor_notes = pd.read_csv(BEANS_DIR / "bean_flavor_notes.csv")
+
+    # 평점은 랭킹의 보조 항이므로 없으면 생략
+    scores_path = BEANS_DIR / "bean_scores.csv"
+    bean_scores = pd.read_csv(scores_path) if scores_path.exists() else None
 
-    print(f"Loaded: {len(stores)} stores, {len(menus)} menus, {len(beans)} beans")
-    return stores, menus, beans
+    print(f"Loaded: {len(stores)} stores, {len(menus)} menus, {len(beans)} beans, "
+          f"{len(flavor_notes)} flavor notes")
+    return stores, menus, beans, flavor_notes, bean_scores
 
 
 def normalize_country(text):
@@ -216,29 +192,37 @@ def normalize_country(text):
     return None
 
 
-def extract_keywords_from_text(text):
-    """텍스트에서 국가명 및 세부 키워드 추출"""
+def find_keyword_hits(text):
+    """
+    텍스트에서 키워드 매칭 위치를 한 번의 스캔으로 찾습니다.
+
+    겹치는 키워드는 가장 긴 것만 남습니다. (예: "하라르"에서 "하라"는 따로 잡히지 않음)
+
+    Returns:
+        [(keyword, start, end), ...] (텍스트 등장 순서)
+    """
     if not text or pd.isna(text):
         return []
+    return [(m.group(), m.start(), m.end()) for m in KEYWORD_PATTERN.finditer(str(text))]
 
-    text = str(text)
-    found = []
 
-    # 모든 키워드 검색 (국가명 + 지역명 + 품종명)
-    all_terms = list(BEAN_COUNTRIES) + list(COUNTRY_ALIASES.keys())
-
-    # 추가 키워드 (품종, 등급 등)
-    extra_keywords = [
-        "게이샤", "게샤", "파카마라", "부르봉", "핑크", "AA",
-        "피베리", "내추럴", "워시드", "허니", "아네로빅"
-    ]
-    all_terms.extend(extra_keywords)
+def extract_keywords_from_text(text):
+    """텍스트에서 국가명 및 세부 키워드 추출 (중복 제거, ALL_TERMS 우선순위 순서)"""
+    if not text or pd.isna(text):
+        return []
+    terms = KEYWORD_PATTERN.findall(str(text))
+    if len(terms) <= 1:
+        return terms
+    return sorted(set(terms), key=TERM_PRIORITY.__getitem__)
 
-    for term in all_terms:
-        if term in text:
-            found.append(term)
 
-    return found
+def extract_origin_keywords(text):
+    """정확 매칭 + 근사 매칭 키워드 (중복 제거, ALL_TERMS 우선순위 순서)"""
+    terms = extract_keywords_from_text(text)
+    fuzzy_terms = match_origin_terms(ORIGIN_MATCHER, text)
+    if not fuzzy_terms:
+        return terms
+    return sorted(set(terms) | fuzzy_terms, key=TERM_PRIORITY.__getitem__)
 
 
 def get_country_from_keywords(keywords):
@@ -252,156 +236,245 @@ def get_country_from_keywords(keywords):
     return None
 
 
-def select_bean_for_country(country, keywords):
-    """국가와 키워드에 맞는 대표 원두 선택"""
-    if country not in COUNTRY_BEANS:
-        return None
+def normalize_bean_countries(beans):
+    """beans.csv의 국가명 표기 변형을 매핑용 국가명으로 통일 (예: 대만 → 타이완)"""
+    return beans['country'].fillna('').astype(str).map(lambda c: normalize_country(c) or c.strip())
 
-    country_data = COUNTRY_BEANS[country]
-
-    # 세부 키워드가 있으면 해당 원두 사용
-    for kw in keywords:
-        kw_lower = kw.lower() if kw else ""
-        if kw in country_data:
-            bean_ids = country_data[kw]
-            return bean_ids[0] if bean_ids else None
 
-    # 키워드 매칭 안되면 default 사용
-    default_beans = country_data.get("default", [])
-    return default_beans[0] if default_beans else None
+# 키워드 → 국가 (국가명이 아닌 품종/가공법 키워드는 None)
+KEYWORD_COUNTRY = {term: normalize_country(term) for term in ALL_TERMS}
 
 
-def extract_countries_from_store_description(description):
-    """가게 설명에서 원두 국가 정보 추출"""
-    if not description or pd.isna(description):
-        return set()
+def extract_store_origins(text):
+    """가게 설명 → 키워드/국가/품종/가공법 (store_origin_index.py 캐시 단위)"""
+    keywords = extract_origin_keywords(text)
+    return {
+        'keywords': keywords,
+        'countries': list(dict.fromkeys(KEYWORD_COUNTRY[kw] for kw in keywords if KEYWORD_COUNTRY[kw])),
+        'varieties': [kw for kw in keywords if kw in VARIETY_KEYWORDS],
+        'processing_methods': [kw for kw in keywords if kw in PROCESSING_KEYWORDS],
+    }
 
-    keywords = extract_keywords_from_text(description)
-    countries = set()
 
-    for kw in keywords:
-        country = normalize_country(kw)
-        if country:
-            countries.add(country)
-        elif kw in BEAN_COUNTRIES:
-            countries.add(kw)
+# extract_store_origins가 참조하는 표 (store_origin_index.py 캐시 서명에 포함)
+STORE_ORIGIN_RULES = {
+    'keyword_country': KEYWORD_COUNTRY,
+    'varieties': VARIETY_KEYWORDS,
+    'processing_methods': PROCESSING_KEYWORDS,
+}
 
-    return countries
 
+def extract_keyword_column(texts):
+    """텍스트 Series → 키워드 리스트 Series (같은 텍스트는 한 번만 추출)"""
+    codes, uniques = pd.factorize(texts.astype(object).where(texts.notna(), None))
+    extracted = [extract_origin_keywords(text) for text in uniques] + [[]]
+    return pd.Series([extracted[code] for code in codes], index=texts.index, dtype=object)
+
+
+def explode_keyword_countries(frame, key):
+    """(key, keywords) → (key, keyword, match_country) 행으로 펼침 (국가가 있는 키워드만, 키워드 우선순위 순서)"""
+    exploded = frame[[key, 'keywords']].explode('keywords').rename(columns={'keywords': 'keyword'})
+    exploded['match_country'] = exploded['keyword'].map(KEYWORD_COUNTRY)
+    return exploded.dropna(subset=['match_country'])
+
+
+def menu_origin_countries(menu_frame):
+    """
+    메뉴명의 원산지 국가 테이블 (position, match_country, country_order, is_blended)
+
+    VARIETY_ALIASES 키워드는 다른 원산지 키워드가 없을 때만 국가로 인정하고,
+    서로 다른 국가가 2개 이상이면 블렌드로 표시합니다.
+    """
+    countries = explode_keyword_countries(menu_frame, 'position')
+    variety_alias = countries['keyword'].isin(VARIETY_ALIASES)
+    has_origin = (~variety_alias).groupby(level=0).transform('any')
+    countries = countries[~(variety_alias & has_origin)]
+
+    countries = countries.reset_index(drop=True).drop_duplicates(['position', 'match_country'])
+    grouped = countries.groupby('position')
+    return countries.assign(
+        country_order=grouped.cumcount(),
+        is_blended=grouped['match_country'].transform('size') > 1,
+    )
+
+
+def join_text(*columns):
+    """텍스트 컬럼을 공백으로 결합 (결측값은 빈 문자열)"""
+    joined = columns[0].fillna('').astype(str)
+    for column in columns[1:]:
+        joined = joined + ' ' + column.fillna('').astype(str)
+    return joined.str.strip()
+
+
+def rank_mapping_candidates(ranker, candidates):
+    """
+    매핑 후보 DataFrame(match_country, keywords, query_text)을 한 번에 랭킹하여
+    bean_id, rank_score, candidate_bean_ids 컬럼을 추가합니다.
+
+    국가 목록과 랭커가 같은 beans.csv에서 만들어지므로, 랭킹 후보가 없는 후보는
+    (원두가 없는 국가의 별칭만 매칭된 경우) 제외합니다.
+    """
+    top_ids, top_scores = rank_beans(
+        ranker, candidates['match_country'].tolist(), candidates['keywords'].tolist(),
+        candidates['query_text'].tolist(), k=TOP_K_CANDIDATES,
+    )
+
+    ranked = top_ids[:, 0] > 0
+    candidates = candidates.assign(
+        bean_id=top_ids[:, 0],
+        rank_score=pd.Series(top_scores[:, 0], index=candidates.index).round(4),
+        candidate_bean_ids=[','.join(map(str, ids[ids > 0])) for ids in top_ids],
+    )
+    return candidates[ranked].astype({'bean_id': 'int64'})
+
+
+def mapping_confidence(ranker, mappings):
+    """
+    매핑별 신뢰도 (0~1, 소수 둘째 자리)
+
+        SOURCE_CONFIDENCE[match_source] / 가게 국가 수 + EVIDENCE_WEIGHT × max(향미 유사도, 키워드 일치)
+
+    가게 설명에 여러 국가가 있으면 메뉴가 그중 어느 원두를 쓰는지 알 수 없으므로 국가 수로 나눕니다.
+    """
+    similarity, keyword_match = score_components(
+        ranker, mappings['bean_id'].to_numpy(), mappings['keywords'].tolist(), mappings['query_text'].tolist()
+    )
+    base = mappings['match_source'].map(SOURCE_CONFIDENCE) / mappings['store_country_count']
+    evidence = pd.Series(np.maximum(similarity, keyword_match), index=mappings.index)
+    return (base + EVIDENCE_WEIGHT * evidence).clip(upper=1.0).round(2)
+
+
+def create_menu_bean_mappings(stores, menus, beans, flavor_notes, bean_scores=None, country_beans=None,
+                              store_origins=None):
+    """
+    메뉴-원두 매핑 생성 (컬럼 단위 파이프라인)
+
+    1. 메뉴명 키워드 컬럼 → explode → 원산지 국가마다 메뉴명 기반 후보 (2개국 이상이면 블렌드)
+    2. 가게 원산지 인덱스의 국가 → 가게별 국가 테이블 → 미매핑 메뉴와 merge하여 가게 기반 후보
+    3. 후보 전체를 랭킹 후 (menu_id, bean_id) drop_duplicates, 신뢰도 계산
+
+    Returns:
+        (mappings_df, stats): 메뉴 순서대로 정렬된 매핑 DataFrame과 통계
+        (country_beans / store_origins가 없으면 beans / stores로 인덱스를 바로 생성)
+    """
+    bean_countries = normalize_bean_countries(beans)
+    if country_beans is None:
+        country_beans = build_country_bean_index(beans, bean_countries, bean_scores, DETAIL_TERMS)
+
+    # 국가명 자체는 같은 국가 원두 모두에 해당하므로 지역/품종 키워드만 가산점 대상
+    ranker = build_ranker(beans, flavor_notes, bean_countries, bean_scores, keyword_bean_ids(country_beans))
+
+    menus = menus.reset_index(drop=True)
+    menu_frame = pd.DataFrame({
+        'position': menus.index,
+        'menu_id': menus['id'],
+        'store_id': menus['store_id'],
+        'keywords': extract_keyword_column(menus['name']),
+        'menu_text': join_text(menus['name'], menus['description'] if 'description' in menus.columns
+                               else pd.Series('', index=menus.index)),
+    })
+
+    # 가게 description에서 추출한 국가 (가게별 키워드 우선순위 순서)
+    if store_origins is None:
+        store_origins, _ = build_store_origin_index(stores, extract_store_origins)
+    store_frame = pd.DataFrame({
+        'store_id': stores['id'].to_numpy(),
+        'store_description': stores['description'].to_numpy(),
+    })
+    store_countries = store_origins[['store_id', 'countries']].explode('countries').dropna()
+    store_countries = store_countries.rename(columns={'countries': 'match_country'})
+    store_countries = store_countries.assign(
+        country_order=store_countries.groupby('store_id').cumcount(),
+        store_country_count=store_countries.groupby('store_id')['match_country'].transform('size'),
+    )
+
+    print(f"\n가게 description에서 원두 정보 발견: {store_countries['store_id'].nunique()}개 가게")
+
+    # 1. 메뉴명 기반 후보: 메뉴명의 원산지 국가마다 (여러 개면 블렌드)
+    menu_countries = menu_origin_countries(menu_frame)
+    name_candidates = menu_frame.merge(
+        menu_countries[['position', 'match_country', 'country_order', 'is_blended']], on='position', how='inner'
+    ).assign(
+        match_source='menu_name',
+        query_text=lambda df: df['menu_text'],
+        store_country_count=1,
+    )
+    name_candidates = rank_mapping_candidates(ranker, name_candidates)
+
+    # 2. 가게 기반 후보: 메뉴명 매핑이 없는 메뉴 × 가게 국가
+    unmapped = menu_frame[~menu_frame['position'].isin(name_candidates['position'])]
+    store_candidates = unmapped.drop(columns='keywords').merge(
+        store_countries[['store_id', 'match_country', 'country_order', 'store_country_count']],
+        on='store_id', how='inner'
+    ).merge(store_frame[['store_id', 'store_description']], on='store_id', how='left')
+    store_candidates = store_candidates.assign(
+        match_source='store_description',
+        is_blended=False,
+        keywords=[[] for _ in range(len(store_candidates))],
+        query_text=join_text(store_candidates['menu_text'], store_candidates['store_description']),
+    )
+    store_candidates = rank_mapping_candidates(ranker, store_candidates)
+
+    # 메뉴 순서대로 정렬 (같은 메뉴 안에서는 원산지/가게 설명의 국가 순서) 후 중복 제거
+    mappings = pd.concat([name_candidates, store_candidates], ignore_index=True)
+    mappings = mappings.sort_values(['position', 'country_order'], kind='stable')
+    mappings = mappings.drop_duplicates(['menu_id', 'bean_id'], ignore_index=True)
+
+    # 랭킹 후보가 없어 빠진 원산지가 있으면 한 원산지만 남은 메뉴는 블렌드가 아니므로 최종 매핑 기준으로 다시 계산
+    from_name = mappings['match_source'] == 'menu_name'
+    origin_count = mappings['match_country'].where(from_name).groupby(mappings['menu_id']).transform('nunique')
+    mappings = mappings.assign(is_blended=from_name & (origin_count > 1))
+    mappings = mappings.assign(
+        confidence=mapping_confidence(ranker, mappings),
+        match_keywords=mappings['keywords'].str.join(','),
+    )
 
-def create_menu_bean_mappings(stores, menus, beans):
-    """메뉴-원두 매핑 생성"""
-    mappings = []
     stats = {
         'total_menus': len(menus),
-        'menus_with_country_in_name': 0,
-        'menus_mapped_by_store': 0,
-        'stores_with_bean_info': 0,
-        'total_mappings': 0,
+        'menus_with_country_in_name': menu_countries['position'].nunique(),
+        'blended_menus': mappings.loc[mappings['is_blended'], 'menu_id'].nunique(),
+        'menus_mapped_by_store': len(store_candidates),
+        'stores_with_bean_info': store_countries['store_id'].nunique(),
+        'total_mappings': len(name_candidates) + len(store_candidates),
+        'low_confidence_mappings': int((mappings['confidence'] < REVIEW_THRESHOLD).sum()),
     }
 
-    # store_id -> description 매핑
-    store_descriptions = dict(zip(stores['id'], stores['description']))
-
-    # 각 store의 description에서 추출한 국가 정보
-    store_countries = {}
-    for store_id, desc in store_descriptions.items():
-        countries = extract_countries_from_store_description(desc)
-        if countries:
-            store_countries[store_id] = countries
-
-    stats['stores_with_bean_info'] = len(store_countries)
-    print(f"\n가게 description에서 원두 정보 발견: {len(store_countries)}개 가게")
-
-    # 메뉴별 매핑
-    mapped_menus = set()  # 이미 매핑된 메뉴 추적
-
-    for _, menu in menus.iterrows():
-        menu_id = menu['id']
-        store_id = menu['store_id']
-        menu_name = menu['name']
-
-        # 1. 메뉴 이름에서 국가명/키워드 추출
-        menu_keywords = extract_keywords_from_text(menu_name)
-        menu_country = get_country_from_keywords(menu_keywords)
-
-        if menu_country:
-            stats['menus_with_country_in_name'] += 1
-            bean_id = select_bean_for_country(menu_country, menu_keywords)
-
-            if bean_id:
-                mappings.append({
-                    'menu_id': menu_id,
-                    'bean_id': bean_id,
-                    'is_blended': False,
-                    'match_source': 'menu_name',
-                    'match_country': menu_country,
-                    'match_keywords': ','.join(menu_keywords),
-                })
-                mapped_menus.add(menu_id)
-
-        # 2. 가게에 원두 정보가 있고, 아직 매핑 안된 메뉴면 가게 기반 매핑
-        if menu_id not in mapped_menus and store_id in store_countries:
-            for country in store_countries[store_id]:
-                bean_id = select_bean_for_country(country, [])
-                if bean_id:
-                    mappings.append({
-                        'menu_id': menu_id,
-                        'bean_id': bean_id,
-                        'is_blended': False,
-                        'match_source': 'store_description',
-                        'match_country': country,
-                        'match_keywords': '',
-                    })
-                    stats['menus_mapped_by_store'] += 1
-
-    stats['total_mappings'] = len(mappings)
-
-    return mappings, stats
-
-
-def deduplicate_mappings(mappings):
-    """중복 매핑 제거 (같은 menu_id, bean_id 조합)"""
-    seen = set()
-    unique_mappings = []
-
-    for m in mappings:
-        key = (m['menu_id'], m['bean_id'])
-        if key not in seen:
-            seen.add(key)
-            unique_mappings.append(m)
-
-    return unique_mappings
+    columns = ['menu_id', 'bean_id', 'is_blended', 'confidence', 'match_source', 'match_country',
+               'match_keywords', 'rank_score', 'candidate_bean_ids']
+    return mappings[columns], stats
 
 
 def main():
     print("=== 메뉴-원두 매핑 v2 시작 ===\n")
 
     # 데이터 로드
-    stores, menus, beans = load_data()
+    stores, menus, beans, flavor_notes, bean_scores = load_data()
 
-    # 매핑 생성
-    mappings, stats = create_menu_bean_mappings(stores, menus, beans)
+    # 국가 → 키워드 → 원두 인덱스 (beans.csv가 바뀐 경우에만 재생성)
+    country_beans = load_country_bean_index(
+        BEANS_DIR / "beans.csv", BEANS_DIR / "bean_scores.csv", normalize_bean_countries, DETAIL_TERMS
+    )
 
-    # 중복 제거
-    mappings = deduplicate_mappings(mappings)
+    # 가게 설명 → 원산지/품종/가공법 (설명이 바뀐 가게만 다시 분석)
+    store_origins = load_store_origin_index(stores, extract_store_origins, ALL_TERMS, STORE_ORIGIN_RULES)
+
+    # 매핑 생성 (중복 제거 포함)
+    mappings_df, stats = create_menu_bean_mappings(stores, menus, beans, flavor_notes, bean_scores,
+                                                   country_beans, store_origins)
 
     # 통계 출력
     print(f"\n=== 매핑 통계 ===")
     print(f"전체 메뉴 수: {stats['total_menus']}")
-    print(f"메뉴명에 국가명 포함: {stats['menus_with_country_in_name']}")
+    print(f"메뉴명에 국가명 포함: {stats['menus_with_country_in_name']} (블렌드 {stats['blended_menus']})")
     print(f"가게 기반 매핑: {stats['menus_mapped_by_store']}")
     print(f"원두 정보 있는 가게 수: {stats['stores_with_bean_info']}")
-    print(f"총 매핑 수 (중복 제거 후): {len(mappings)}")
-
-    # DataFrame 생성
-    if mappings:
-        mappings_df = pd.DataFrame(mappings)
+    print(f"총 매핑 수 (중복 제거 후): {len(mappings_df)}")
+    print(f"검토 필요 (신뢰도 {REVIEW_THRESHOLD} 미만): {stats['low_confidence_mappings']}")
 
+    if len(mappings_df) > 0:
         # DB 스키마에 맞게 컬럼 정리
-        output_df = mappings_df[['menu_id', 'bean_id', 'is_blended']].copy()
-        output_df['id'] = range(1, len(output_df) + 1)
-        output_df = output_df[['id', 'menu_id', 'bean_id', 'is_blended']]
+        mappings_df['id'] = range(1, len(mappings_df) + 1)
+        output_df = mappings_df[['id', 'menu_id', 'bean_id', 'is_blended', 'confidence']]
 
         # 저장
         output_path = STORES_DIR / "menu_bean_mappings.csv"
@@ -410,23 +483,34 @@ def main():
 
         # 디버그용 상세 정보 저장
         debug_path = STORES_DIR / "menu_bean_mappings_debug.csv"
-        mappings_df['id'] = range(1, len(mappings_df) + 1)
         mappings_df.to_csv(debug_path, index=False)
         print(f"디버그 정보 저장: {debug_path}")
 
-        # 샘플 출력
+        # 낮은 신뢰도 매핑은 메뉴/가게/원두 이름과 함께 검토 파일로 (신뢰도 오름차순)
+        review_df = mappings_df[mappings_df['confidence'] < REVIEW_THRESHOLD].merge(
+            menus[['id', 'store_id', 'name']].rename(columns={'id': 'menu_id', 'name': 'menu_name'}), on='menu_id'
+        ).merge(
+            stores[['id', 'name']].rename(columns={'id': 'store_id', 'name': 'store_name'}), on='store_id', how='left'
+        ).merge(
+            beans[['id', 'name']].rename(columns={'id': 'bean_id', 'name': 'bean_name'}), on='bean_id'
+        ).sort_values(['confidence', 'id'], kind='stable')
+        review_path = STORES_DIR / "menu_bean_mappings_review.csv"
+        review_df[['id', 'confidence', 'store_name', 'menu_id', 'menu_name', 'bean_id', 'bean_name',
+                   'match_source', 'match_country', 'match_keywords', 'candidate_bean_ids']].to_csv(
+            review_path, index=False)
+        print(f"검토 대상 저장: {review_path} ({len(review_df)}개)")
+
+        # 샘플 출력 (메뉴/원두 이름은 join으로 한 번에 조회)
         print(f"\n=== 매핑 샘플 (처음 15개) ===")
-        sample = mappings_df.head(15)
-        for _, row in sample.iterrows():
-            menu_row = menus[menus['id'] == row['menu_id']]
-            bean_row = beans[beans['id'] == row['bean_id']]
-
-            if len(menu_row) > 0 and len(bean_row) > 0:
-                menu_name = menu_row['name'].values[0]
-                bean_name = bean_row['name'].values[0]
-                print(f"  메뉴 [{row['menu_id']}] {menu_name}")
-                print(f"    -> 원두 [{row['bean_id']}] {bean_name}")
-                print(f"       ({row['match_source']}, {row['match_country']})")
+        sample = mappings_df.head(15).merge(
+            menus[['id', 'name']].rename(columns={'id': 'menu_id', 'name': 'menu_name'}), on='menu_id'
+        ).merge(
+            beans[['id', 'name']].rename(columns={'id': 'bean_id', 'name': 'bean_name'}), on='bean_id'
+        )
+        for row in sample.itertuples(index=False):
+            print(f"  메뉴 [{row.menu_id}] {row.menu_name}")
+            print(f"    -> 원두 [{row.bean_id}] {row.bean_name}")
+            print(f"       ({row.match_source}, {row.match_country}, 신뢰도 {row.confidence})")
     else:
         print("\n매핑된 결과가 없습니다.")
 
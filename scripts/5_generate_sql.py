@@ -3,17 +3,83 @@ CSV to SQL INSERT 변환 스크립트
 
 data/final/ 폴더의 CSV 파일들을 SQL INSERT 문으로 변환합니다.
 외래키 의존성을 고려한 순서로 생성합니다.
+
+사용법:
+    python scripts/5_generate_sql.py          # 전체 데이터 (data_import.sql + LOAD DATA용 TSV)
+    python scripts/5_generate_sql.py --diff   # 마지막 생성 이후 바뀐 행만 (data_diff.sql)
+    python scripts/5_generate_sql.py --gzip   # 파트 / 결과 SQL을 gzip으로 (.sql.gz)
+    python scripts/5_generate_sql.py --skip-integrity   # 참조 무결성 위반이 있어도 SQL 생성
+    python scripts/5_generate_sql.py --mark-applied     # 생성한 SQL을 DB에 적용한 뒤, 다음 --diff의 기준으로 확정
+
+SQL을 만들기 전에 참조 무결성(외래키 / 유니크 키 / NOT NULL)을 검사하고 (integrity_check.py),
+위반이 있으면 보고서(data/processed/integrity_report.json)만 남기고 종료 코드 1로 중단합니다.
+
+테이블별 SQL은 워커 프로세스에서 sql/parts/에 파일로 나눠 쓰고,
+manifest.json의 외래키 의존성 순서대로 이어 붙여 최종 SQL 파일을 만듭니다.
 """
 
+import gzip
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import re
 from collections import Counter
 
+from load_data_export import (
+    build_load_data_script, load_data_statement, null_mask, number_text, ordered_columns, read_load_data_tsv,
+    schema_columns, write_table_tsv,
+)
+from integrity_check import REPORT_PATH, check_integrity, flavor_ids, format_violation, save_report
+from sql_diff import (
+    PENDING_SNAPSHOT_PATH, changed_rows, diff_key_columns, diff_table, load_snapshot, previous_digests,
+    promote_pending_snapshot, row_digests, save_snapshot,
+)
+
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "final"
 OUTPUT_DIR = PROJECT_ROOT / "sql"
+SCHEMA_PATH = OUTPUT_DIR / "schema.sql"
+TSV_DIR = OUTPUT_DIR / "tsv"
+PARTS_DIR = OUTPUT_DIR / "parts"
+
+# 테이블별 SQL 파트를 만드는 워커 프로세스 수 (테이블 수만큼까지만 사용, 1이면 현재 프로세스에서 순차 생성)
+PARALLEL_WORKERS = os.cpu_count() or 1
+
+# 워커가 한 번에 SQL 리터럴로 변환하는 행 수 (테이블 크기와 관계없이 메모리 사용량 제한)
+PART_CHUNK_ROWS = 100_000
+
+# ============================================================================
+# INSERT 배치 설정
+# ============================================================================
+# 한 INSERT 문이 MySQL max_allowed_packet(5.7 기본 4MB)을 넘지 않도록
+# 행 수와 바이트 크기(UTF-8) 중 먼저 도달하는 기준으로 나눔
+BATCH_MAX_ROWS = 1000
+BATCH_MAX_BYTES = 1024 * 1024
+
+# 배치마다 START TRANSACTION / COMMIT으로 감싸기
+WRAP_TRANSACTIONS = True
+
+# 대량 적재용: 테이블별 ALTER TABLE ... DISABLE KEYS / ENABLE KEYS, 세션 UNIQUE_CHECKS = 0
+# (DISABLE KEYS는 MyISAM 비고유 인덱스에만 적용, InnoDB에서는 경고만 발생)
+DISABLE_KEYS = False
+
+# ============================================================================
+# 차분 SQL 설정 (--diff)
+# ============================================================================
+# 삭제된 행: deleted_at 컬럼이 있는 테이블(stores, beans, menus)은 soft delete,
+# 나머지 테이블과 SOFT_DELETE = False이면 DELETE
+SOFT_DELETE = True
+
+# 차분 비교/UPSERT에서 빼는 컬럼 (menu_bean_mappings.id는 매 실행 다시 매겨지므로 DB 자동 증가에 맡김)
+DIFF_OMIT_COLUMNS = {'menu_bean_mappings': ['id']}
 
 # ============================================================================
 # Category enum 정의 (Java enum과 동일)
@@ -71,44 +137,57 @@ CATEGORY_RULES = [
 CATEGORY_KEYWORDS = {cat: keywords for cat, keywords in CATEGORY_RULES}
 
 
+# 카테고리 분류용 단일 정규식: 위치마다 우선순위 순 alternation을 lookahead로 시도하므로
+# 각 위치에서 시작하는 키워드 중 가장 높은 우선순위 카테고리가 그룹 이름(lastgroup)으로 잡힘
+CATEGORY_PRIORITY = {category: i for i, (category, _) in enumerate(CATEGORY_RULES)}
+CATEGORY_PATTERN = re.compile('(?=' + '|'.join(
+    f"(?P<{category}>{'|'.join(re.escape(keyword.lower()) for keyword in keywords)})"
+    for category, keywords in CATEGORY_RULES
+) + ')')
+
+
 def classify_menu_category(menu_name):
     """메뉴 이름을 기반으로 카테고리 분류 (우선순위 기반)"""
     if pd.isna(menu_name) or menu_name == '':
         return None
 
-    menu_name_lower = str(menu_name).lower()
+    # 텍스트에 포함된 키워드 중 CATEGORY_RULES 순서가 가장 앞선 카테고리
+    best = None
+    for match in CATEGORY_PATTERN.finditer(str(menu_name).lower()):
+        priority = CATEGORY_PRIORITY[match.lastgroup]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
 
-    # 우선순위 순서대로 체크 (CATEGORY_RULES 순서)
-    for category, keywords in CATEGORY_RULES:
-        for keyword in keywords:
-            if keyword.lower() in menu_name_lower:
-                return category
+    return CATEGORY_RULES[best][0] if best is not None else None
 
-    return None
 
+def classify_menu_categories(names):
+    """메뉴 이름 Series → 카테고리 Series (같은 이름은 한 번만 분류)"""
+    codes, uniques = pd.factorize(names)
+    categories = [classify_menu_category(name) for name in uniques] + [None]
+    return pd.Series([categories[code] for code in codes], index=names.index, dtype=object)
 
-def calculate_store_categories(menus_df):
-    """각 가게별 가장 많은 카테고리 계산"""
-    store_categories = {}
 
+def calculate_store_categories(menus_df):
+    """각 가게별 가장 많은 카테고리 계산 (동률이면 가게 메뉴에서 먼저 나온 카테고리)"""
     # 각 메뉴에 카테고리 할당
-    menus_df['classified_category'] = menus_df['name'].apply(classify_menu_category)
-
-    # 가게별로 카테고리 카운트
-    for store_id in menus_df['store_id'].unique():
-        store_menus = menus_df[menus_df['store_id'] == store_id]
-        categories = store_menus['classified_category'].dropna().tolist()
-
-        if categories:
-            # 가장 많이 나온 카테고리 선택
-            category_counts = Counter(categories)
-            most_common_category = category_counts.most_common(1)[0][0]
-            store_categories[store_id] = most_common_category
-        else:
-            # 카테고리가 없으면 기본값 (enum 값)
-            store_categories[store_id] = 'AMERICANO'
+    menus_df['classified_category'] = classify_menu_categories(menus_df['name'])
+
+    # 가게 × 카테고리별 메뉴 수와 첫 등장 위치 → 가게별 최빈 카테고리
+    classified = pd.DataFrame({
+        'store_id': menus_df['store_id'].to_numpy(),
+        'category': menus_df['classified_category'].to_numpy(),
+        'position': range(len(menus_df)),
+    }).dropna(subset=['category'])
+    counts = classified.groupby(['store_id', 'category'], sort=False)['position'].agg(['size', 'min']).reset_index()
+    counts = counts.sort_values(['store_id', 'size', 'min'], ascending=[True, False, True], kind='stable')
+    most_common = counts.drop_duplicates('store_id').set_index('store_id')['category']
 
-    return store_categories
+    # 카테고리가 없으면 기본값 (enum 값), 가게 순서는 메뉴에 처음 나온 순서
+    store_ids = menus_df['store_id'].unique()
+    return dict(zip(store_ids, most_common.reindex(store_ids).fillna('AMERICANO')))
 
 
 def escape_sql_string(value):
@@ -141,183 +220,591 @@ def format_value(value, column_type='string'):
         return escape_sql_string(value)
 
 
-def generate_roasteries_sql(df):
-    """roasteries 테이블 INSERT 문 생성"""
-    lines = ["-- Roasteries", "INSERT INTO roasteries (id, name, logo_url, website_url) VALUES"]
-    values = []
+def sql_column(series, column_type='string'):
+    """
+    Series 전체를 컬럼 타입에 따라 SQL 리터럴로 변환합니다.
 
-    for _, row in df.iterrows():
-        val = f"({format_value(row['id'], 'int')}, {format_value(row['name'])}, {format_value(row['logo_url'])}, {format_value(row['website_url'])})"
-        values.append(val)
+    format_value를 셀마다 호출한 것과 같은 결과를 컬럼 단위 연산으로 만듭니다.
+    """
+    is_null = null_mask(series)
+    values = series[~is_null]
 
-    lines.append(",\n".join(values) + ";")
-    return "\n".join(lines)
+    if column_type in ('int', 'float'):
+        values = number_text(values, column_type)
+    elif column_type == 'bool':
+        values = values.astype(str).str.lower().isin(['true', '1', 'yes']).map({True: 'TRUE', False: 'FALSE'}).tolist()
+    else:
+        # escape_sql_string과 같은 순서 (작은따옴표 → 백슬래시), 이스케이프할 문자가 있는 행만 치환
+        values = values.astype(str)
+        needs_escape = values.str.contains("['\\\\]", regex=True)
+        if needs_escape.any():
+            escaped = values[needs_escape].str.replace("'", "''", regex=False)
+            values = values.copy()
+            values[needs_escape] = escaped.str.replace("\\", "\\\\", regex=False)
+        values = [f"'{value}'" for value in values.tolist()]
+
+    literals = np.full(len(series), 'NULL', dtype=object)
+    literals[~is_null.to_numpy()] = values
+    return pd.Series(literals, index=series.index)
 
 
-def generate_stores_sql(df, store_categories=None):
-    """stores 테이블 INSERT 문 생성
+def batch_values(values, max_rows=BATCH_MAX_ROWS, max_bytes=BATCH_MAX_BYTES, header_bytes=0):
+    """
+    VALUES 튜플 문자열 목록을 행 수 / 바이트 예산 안의 배치로 나눕니다.
+
+    한 행이 max_bytes보다 크면 그 행만 단독 배치가 됩니다.
+    """
+    batch, batch_bytes = [], header_bytes
+    for value in values:
+        value_bytes = len(value.encode('utf-8')) + 2  # ",\n" 또는 ";\n"
+        if batch and (len(batch) >= max_rows or batch_bytes + value_bytes > max_bytes):
+            yield batch
+            batch, batch_bytes = [], header_bytes
+        batch.append(value)
+        batch_bytes += value_bytes
+    if batch:
+        yield batch
+
+
+def build_insert_sql(title, table, columns, values, suffix=''):
+    """테이블 INSERT 문을 배치 단위로 생성합니다. (insert_sql_lines를 한 문자열로)"""
+    return "\n".join(insert_sql_lines(title, table, columns, values, suffix))
+
+
+def insert_sql_lines(title, table, columns, values, suffix=''):
+    """
+    테이블 INSERT 문을 배치 단위로 한 줄(배치)씩 생성합니다. (WRAP_TRANSACTIONS / DISABLE_KEYS 설정 적용)
 
     Args:
-        df: stores DataFrame
-        store_categories: 가게 ID -> 카테고리 매핑 딕셔너리
+        title: 주석에 쓸 이름 (예: "Roasteries")
+        table: 테이블명
+        columns: 컬럼 목록 문자열 (예: "id, name")
+        values: "(1, 'a')" 형태의 행 문자열 목록
+        suffix: 배치마다 VALUES 뒤에 붙일 절 (예: "\nON DUPLICATE KEY UPDATE ...")
     """
-    lines = ["-- Stores", "INSERT INTO stores (id, roastery_id, owner_id, name, description, address, latitude, longitude, phone_number, category, thumbnail_url, open_time, close_time, average_rating, review_count, visit_count, is_closed) VALUES"]
-    values = []
+    header = f"INSERT INTO {table} ({columns}) VALUES"
+    yield f"-- {title}"
+    if DISABLE_KEYS:
+        yield f"ALTER TABLE {table} DISABLE KEYS;"
 
-    for _, row in df.iterrows():
-        # 메뉴 기반 카테고리 사용 (없으면 기본값 'AMERICANO')
-        store_id = int(row['id'])
-        category = store_categories.get(store_id, 'AMERICANO') if store_categories else row['category']
+    header_bytes = len(header.encode('utf-8')) + len(suffix.encode('utf-8')) + 1
+    for batch in batch_values(values, BATCH_MAX_ROWS, BATCH_MAX_BYTES, header_bytes):
+        if WRAP_TRANSACTIONS:
+            yield "START TRANSACTION;"
+        yield header
+        yield ",\n".join(batch) + suffix + ";"
+        if WRAP_TRANSACTIONS:
+            yield "COMMIT;"
 
-        val = f"({format_value(row['id'], 'int')}, {format_value(row['roastery_id'], 'int')}, {format_value(row['owner_id'], 'int') if pd.notna(row.get('owner_id')) else 'NULL'}, {format_value(row['name'])}, {format_value(row['description'])}, {format_value(row['address'])}, {format_value(row['latitude'], 'float')}, {format_value(row['longitude'], 'float')}, {format_value(row['phone_number'])}, {format_value(category)}, {format_value(row['thumbnail_url'])}, {format_value(row['open_time']) if pd.notna(row.get('open_time')) and row.get('open_time') != '' else 'NULL'}, {format_value(row['close_time']) if pd.notna(row.get('close_time')) and row.get('close_time') != '' else 'NULL'}, {format_value(row['average_rating'], 'float')}, {format_value(row['review_count'], 'int')}, {format_value(row['visit_count'], 'int')}, {format_value(row['is_closed'], 'bool')})"
-        values.append(val)
+    if DISABLE_KEYS:
+        yield f"ALTER TABLE {table} ENABLE KEYS;"
 
-    lines.append(",\n".join(values) + ";")
-    return "\n".join(lines)
 
+# ============================================================================
+# 테이블별 INSERT 컬럼 타입 (schema.sql 컬럼 순서)
+# ============================================================================
 
-def generate_beans_sql(df):
-    """beans 테이블 INSERT 문 생성"""
-    lines = ["-- Beans", "INSERT INTO beans (id, roastery_id, name, country, farm, variety, processing_method, roasting_level) VALUES"]
-    values = []
+TABLE_COLUMN_TYPES = {
+    'roasteries': {'id': 'int', 'name': 'string', 'logo_url': 'string', 'website_url': 'string'},
+    'stores': {
+        'id': 'int', 'roastery_id': 'int', 'owner_id': 'int', 'name': 'string', 'description': 'string',
+        'address': 'string', 'latitude': 'float', 'longitude': 'float', 'phone_number': 'string',
+        'category': 'string', 'thumbnail_url': 'string', 'open_time': 'string', 'close_time': 'string',
+        'average_rating': 'float', 'review_count': 'int', 'visit_count': 'int', 'is_closed': 'bool',
+    },
+    'beans': {
+        'id': 'int', 'roastery_id': 'int', 'name': 'string', 'country': 'string', 'farm': 'string',
+        'variety': 'string', 'processing_method': 'string', 'roasting_level': 'string',
+    },
+    'menus': {
+        'id': 'int', 'store_id': 'int', 'name': 'string', 'description': 'string', 'price': 'int',
+        'category': 'string', 'image_url': 'string',
+    },
+    'bean_flavor_notes': {'bean_id': 'int', 'flavor_id': 'int'},
+    'menu_bean_mappings': {'id': 'int', 'menu_id': 'int', 'bean_id': 'int', 'is_blended': 'bool', 'confidence': 'float'},
+}
+
+# CSV에 없으면 생략하는 컬럼 (DB 기본값 사용, 예: confidence가 없는 이전 매핑 CSV는 NULL = 신뢰도 미상)
+OPTIONAL_COLUMNS = {'menu_bean_mappings': ['confidence']}
+
+
+def table_frame(table, df):
+    """TABLE_COLUMN_TYPES 순서로 INSERT할 컬럼만 선택"""
+    optional = OPTIONAL_COLUMNS.get(table, [])
+    columns = [column for column in TABLE_COLUMN_TYPES[table] if column in df.columns or column not in optional]
+    return df[columns]
+
+
+def prepare_stores(df, store_categories=None):
+    """stores INSERT 데이터 (메뉴 기반 카테고리 적용, 없으면 기본값 'AMERICANO')"""
+    df = df.copy()
+    if store_categories:
+        df['category'] = df['id'].astype(int).map(store_categories).fillna('AMERICANO')
+    return table_frame('stores', df)
+
+
+def prepare_menus(df):
+    """menus INSERT 데이터 (가격 기본값, 카테고리 자동 분류 적용)"""
+    df = df.copy()
+
+    # price가 0이거나 비어있으면 0으로 설정
+    price = df['price']
+    df['price'] = price.mask(price.isna() | (price == '') | (price == 0), 0)
+
+    # 카테고리 자동 분류 (이미 분류되어 있으면 사용, 없으면 분류)
+    if 'classified_category' in df.columns:
+        df['category'] = [category or classify_menu_category(name)
+                          for category, name in zip(df['classified_category'], df['name'])]
+    else:
+        df['category'] = classify_menu_categories(df['name'])
+    return table_frame('menus', df)
 
-    for _, row in df.iterrows():
-        val = f"({format_value(row['id'], 'int')}, {format_value(row['roastery_id'], 'int')}, {format_value(row['name'])}, {format_value(row['country'])}, {format_value(row['farm'])}, {format_value(row['variety'])}, {format_value(row['processing_method'])}, {format_value(row['roasting_level'])})"
-        values.append(val)
 
-    lines.append(",\n".join(values) + ";")
-    return "\n".join(lines)
+# 외래키 의존성 순서: roasteries -> stores, beans -> menus -> bean_flavor_notes, menu_bean_mappings
+TABLE_TITLES = {
+    'roasteries': "Roasteries",
+    'stores': "Stores",
+    'beans': "Beans",
+    'menus': "Menus",
+    'bean_flavor_notes': "Bean Flavor Notes",
+    'menu_bean_mappings': "Menu Bean Mappings",
+}
+
+
+def prepare_tables(data_dir=DATA_DIR):
+    """
+    data/final/*.csv를 읽어 테이블별 적재 데이터를 준비합니다.
 
+    Returns:
+        (tables, store_categories): [(테이블명, 준비된 DataFrame), ...] (TABLE_TITLES 순서),
+        가게 ID -> 카테고리 매핑
+    """
+    # 메뉴를 먼저 읽어서 가게별 카테고리 계산 (menus 테이블에서 재사용)
+    menus_df = pd.read_csv(data_dir / "menus.csv")
+    store_categories = calculate_store_categories(menus_df)
 
-def generate_menus_sql(df):
-    """menus 테이블 INSERT 문 생성 (카테고리 자동 분류 적용)"""
-    lines = ["-- Menus", "INSERT INTO menus (id, store_id, name, description, price, category, image_url) VALUES"]
-    values = []
+    tables = []
+    for table in TABLE_TITLES:
+        if table == 'menus':
+            frame = prepare_menus(menus_df)
+        elif table == 'stores':
+            frame = prepare_stores(pd.read_csv(data_dir / "stores.csv"), store_categories)
+        else:
+            frame = table_frame(table, pd.read_csv(data_dir / f"{table}.csv"))
+        tables.append((table, frame))
+    return tables, store_categories
 
-    for _, row in df.iterrows():
-        price = row['price']
-        # price가 0이거나 비어있으면 0으로 설정
-        if pd.isna(price) or price == '' or price == 0:
-            price = 0
 
-        # 카테고리 자동 분류 (이미 분류되어 있으면 사용, 없으면 분류)
-        category = row.get('classified_category') or classify_menu_category(row['name'])
+def literal_frame(table, frame):
+    """준비된 테이블 데이터 → 컬럼별 SQL 리터럴 DataFrame (컬럼 타입은 TABLE_COLUMN_TYPES)"""
+    column_types = TABLE_COLUMN_TYPES[table]
+    return pd.DataFrame({column: sql_column(frame[column], column_types[column]) for column in frame.columns},
+                        index=frame.index)
 
-        val = f"({format_value(row['id'], 'int')}, {format_value(row['store_id'], 'int')}, {format_value(row['name'])}, {format_value(row['description'])}, {format_value(price, 'int')}, {format_value(category)}, {format_value(row['image_url'])})"
-        values.append(val)
 
-    lines.append(",\n".join(values) + ";")
-    return "\n".join(lines)
+def literal_rows(literals):
+    """SQL 리터럴 DataFrame → "(v1, v2, ...)" 행 문자열 목록 (컬럼 목록을 zip 후 한 번에 결합)"""
+    columns = [literals[column].tolist() for column in literals.columns]
+    return [f"({row})" for row in map(", ".join, zip(*columns))]
+
+
+def sql_rows(table, frame):
+    """준비된 테이블 데이터 → "(v1, v2, ...)" 행 문자열 목록"""
+    return literal_rows(literal_frame(table, frame))
+
+
+def generate_table_sql(title, table, frame):
+    """준비된 테이블 데이터의 INSERT 문 생성 (컬럼 타입은 TABLE_COLUMN_TYPES)"""
+    return build_insert_sql(title, table, ", ".join(frame.columns), sql_rows(table, frame))
+
+
+# ============================================================================
+# 차분 SQL (--diff)
+# ============================================================================
+
+def soft_delete_tables(schema_path=SCHEMA_PATH):
+    """삭제된 행을 deleted_at으로 표시할 테이블 (schema.sql에 deleted_at 컬럼이 있는 테이블)"""
+    if not SOFT_DELETE:
+        return set()
+    return {table for table, columns in schema_columns(schema_path).items() if 'deleted_at' in columns}
 
 
-def generate_bean_flavor_notes_sql(df):
-    """bean_flavor_notes 테이블 INSERT 문 생성"""
-    lines = ["-- Bean Flavor Notes", "INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES"]
-    values = []
+def upsert_sql_lines(title, table, columns, values, soft_delete=False):
+    """
+    추가/변경 행의 INSERT ... ON DUPLICATE KEY UPDATE 문을 배치 단위로 생성
+
+    키가 아닌 컬럼을 새 값으로 갱신하고, soft delete 테이블은 deleted_at도 NULL로 되돌립니다.
+
+    Args:
+        columns: 컬럼 목록 (DIFF_OMIT_COLUMNS 제외)
+        values: "(1, 'a')" 형태의 행 문자열 (이터레이터 가능)
+    """
+    key_columns = diff_key_columns(table)
+    update_columns = [column for column in columns if column not in key_columns and column != 'id']
+    assignments = [f"{column} = VALUES({column})" for column in update_columns or key_columns]
+    if soft_delete:
+        assignments.append("deleted_at = NULL")
+
+    suffix = "\nON DUPLICATE KEY UPDATE " + ", ".join(assignments)
+    return insert_sql_lines(title, table, ", ".join(columns), values, suffix)
 
-    for _, row in df.iterrows():
-        val = f"({format_value(row['bean_id'], 'int')}, {format_value(row['flavor_id'], 'int')})"
-        values.append(val)
 
-    lines.append(",\n".join(values) + ";")
+def generate_delete_sql(title, table, keys, soft_delete=False):
+    """
+    삭제된 키의 DELETE (soft delete 테이블은 UPDATE ... SET deleted_at) 문을 BATCH_MAX_ROWS개씩 생성
+
+    Args:
+        keys: 키 리터럴 목록 (복합 키는 "3, 80101" 형태)
+    """
+    key_columns = diff_key_columns(table)
+    if len(key_columns) == 1:
+        target, values = key_columns[0], keys
+    else:
+        target, values = f"({', '.join(key_columns)})", [f"({key})" for key in keys]
+
+    lines = [f"-- {title} (삭제)"]
+    for i in range(0, len(values), BATCH_MAX_ROWS):
+        condition = f"{target} IN ({', '.join(values[i:i + BATCH_MAX_ROWS])})"
+        if WRAP_TRANSACTIONS:
+            lines.append("START TRANSACTION;")
+        if soft_delete:
+            lines.append(f"UPDATE {table} SET deleted_at = CURRENT_TIMESTAMP WHERE {condition} AND deleted_at IS NULL;")
+        else:
+            lines.append(f"DELETE FROM {table} WHERE {condition};")
+        if WRAP_TRANSACTIONS:
+            lines.append("COMMIT;")
     return "\n".join(lines)
 
 
-def generate_menu_bean_mappings_sql(df):
-    """menu_bean_mappings 테이블 INSERT 문 생성"""
-    lines = ["-- Menu Bean Mappings", "INSERT INTO menu_bean_mappings (id, menu_id, bean_id, is_blended) VALUES"]
-    values = []
+# ============================================================================
+# LOAD DATA용 TSV 내보내기
+# ============================================================================
+
+def sql_literals_to_text(literals):
+    """SQL 리터럴 Series → LOAD DATA가 읽어야 할 값 (NULL은 None, BOOLEAN은 1/0)"""
+    quoted = literals.str.startswith("'")
+    text = literals.where(~quoted, literals.str[1:-1].str.replace("''", "'", regex=False)
+                          .str.replace("\\\\", "\\", regex=False))
+    text = text.mask(literals == 'TRUE', '1').mask(literals == 'FALSE', '0')
+    return text.mask(literals == 'NULL', None)
+
+
+def verify_tsv(table, frame, tsv_path):
+    """TSV를 LOAD DATA 규칙으로 다시 읽어 INSERT 값과 비교하고 불일치 행 수를 반환"""
+    column_types = TABLE_COLUMN_TYPES[table]
+    actual = read_load_data_tsv(tsv_path)
+    if len(actual) != len(frame):
+        return max(len(actual), len(frame))
+
+    mismatched = pd.Series(False, index=range(len(frame)))
+    for column in actual.columns:
+        expected = sql_literals_to_text(sql_column(frame[column], column_types[column])).reset_index(drop=True)
+        values = actual[column]
+        mismatched |= ~((values == expected) | (values.isna() & expected.isna()))
+    return int(mismatched.sum())
+
+
+def export_table_tsv(table, frame, output_dir=TSV_DIR, schema_path=SCHEMA_PATH):
+    """
+    테이블 하나의 TSV를 쓰고 검증합니다.
+
+    Returns:
+        (LOAD DATA 문, 행 수)
+    """
+    columns = ordered_columns(table, list(frame.columns), schema_columns(schema_path))
+    tsv_path = output_dir / f"{table}.tsv"
+    count = write_table_tsv(frame, TABLE_COLUMN_TYPES[table], columns, tsv_path)
+    mismatches = verify_tsv(table, frame, tsv_path)
+    if mismatches:
+        raise ValueError(f"{table}.tsv: INSERT 값과 다른 행 {mismatches}개")
+    return load_data_statement(table, columns, tsv_path.relative_to(PROJECT_ROOT).as_posix()), count
+
+
+def write_load_data_script(statements, output_dir=TSV_DIR):
+    """LOAD DATA 문 목록(외래키 의존성 순서)으로 로더 SQL(load_data.sql) 저장"""
+    loader_path = output_dir / "load_data.sql"
+    with open(loader_path, 'w', encoding='utf-8') as f:
+        f.write(build_load_data_script(statements))
+    return loader_path
+
+
+# ============================================================================
+# 테이블별 SQL 파트 (병렬 생성 + manifest 순서로 이어 붙이기)
+# ============================================================================
 
-    for _, row in df.iterrows():
-        val = f"({format_value(row['id'], 'int')}, {format_value(row['menu_id'], 'int')}, {format_value(row['bean_id'], 'int')}, {format_value(row['is_blended'], 'bool')})"
-        values.append(val)
+def open_part(path, compress=False):
+    """파트 파일 쓰기 핸들 (compress면 gzip, gzip 멤버는 이어 붙여도 하나의 유효한 gzip)"""
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
 
-    lines.append(",\n".join(values) + ";")
+
+def write_part(path, lines, compress=False):
+    """줄 단위로 파트 파일에 스트리밍 저장하고 파일 크기를 반환"""
+    with open_part(path, compress) as f:
+        for line in lines:
+            f.write(line + "\n")
+    return path.stat().st_size
+
+
+def table_part_rows(table, frame, previous_rows=None, digests=None):
+    """
+    PART_CHUNK_ROWS 행씩 SQL 리터럴로 변환해 "(v1, v2, ...)" 행 문자열을 하나씩 내보냅니다.
+
+    Args:
+        previous_rows: 이전 스냅샷의 키별 다이제스트. 지정하면 추가/변경 행만 (DIFF_OMIT_COLUMNS 제외 컬럼)
+        digests: 청크별 행 다이제스트를 모을 리스트 (스냅샷용)
+    """
+    key_columns = diff_key_columns(table)
+    omit = DIFF_OMIT_COLUMNS.get(table, [])
+    for start in range(0, len(frame), PART_CHUNK_ROWS):
+        # INSERT / 차분 비교가 같은 리터럴을 사용 (차분은 DIFF_OMIT_COLUMNS 제외)
+        literals = literal_frame(table, frame.iloc[start:start + PART_CHUNK_ROWS])
+        diff_source = literals.drop(columns=omit)
+        chunk_digests = row_digests(diff_source, key_columns)
+        if digests is not None:
+            digests.append(chunk_digests)
+
+        if previous_rows is None:
+            yield from literal_rows(literals)
+        else:
+            yield from literal_rows(diff_source[changed_rows(chunk_digests, previous_rows)])
+
+
+def write_table_part(table, frame, part_path, compress=False, previous=None, diff_mode=False,
+                     soft_delete=False, tsv_dir=None):
+    """
+    (워커 프로세스) 테이블 하나의 SQL 파트를 생성합니다.
+
+    전체 모드는 INSERT, 차분 모드는 추가/변경 행의 UPSERT를 PART_CHUNK_ROWS 행 단위로 변환하면서
+    배치마다 파일에 바로 쓰므로 SQL 문자열 전체를 메모리에 만들지 않습니다.
+    (테이블 DataFrame 자체와 TSV 생성/검증은 테이블 전체 단위)
+
+    Args:
+        previous: 이전 스냅샷의 이 테이블 항목 (차분 비교 기준)
+        soft_delete: 차분 모드 UPSERT에서 deleted_at도 되돌릴지
+        tsv_dir: 지정하면 LOAD DATA용 TSV도 생성
+
+    Returns:
+        {table, file, rows, bytes, inserted, updated, deleted, snapshot, load_data}
+    """
+    title = TABLE_TITLES[table]
+    diff_columns = [column for column in frame.columns if column not in DIFF_OMIT_COLUMNS.get(table, [])]
+    digests = []
+
+    if diff_mode:
+        rows = table_part_rows(table, frame, previous_digests(previous, diff_columns), digests)
+        first = next(rows, None)
+        # 바뀐 행이 없는 테이블은 빈 파트
+        lines = [] if first is None else [*upsert_sql_lines(title, table, diff_columns, chain([first], rows),
+                                                             soft_delete), ""]
+    else:
+        rows = table_part_rows(table, frame, None, digests)
+        lines = chain(insert_sql_lines(title, table, ", ".join(frame.columns), rows), [""])
+    size = write_part(part_path, lines, compress)
+
+    diff = diff_table(pd.concat(digests) if digests else pd.Series(dtype=object), diff_columns, previous)
+    return {
+        'table': table,
+        'file': part_path.name,
+        'rows': len(frame),
+        'bytes': size,
+        'inserted': int(diff['inserted'].sum()),
+        'updated': int(diff['updated'].sum()),
+        'deleted': diff['deleted'],
+        'snapshot': diff['snapshot'],
+        'load_data': export_table_tsv(table, frame, tsv_dir) if tsv_dir is not None else None,
+    }
+
+
+def generate_table_parts(tables, parts_dir=PARTS_DIR, compress=False, snapshot=None, diff_mode=False,
+                         soft_tables=(), tsv_dir=None, workers=PARALLEL_WORKERS):
+    """
+    테이블별 SQL 파트를 워커 프로세스에서 동시에 생성합니다.
+
+    파트 파일명은 외래키 의존성 순서 번호로 시작 (01_roasteries.sql, ...)
+    테이블 DataFrame은 통째로 pickle되어 워커에 전달되므로, 메인 프로세스와 워커가 각자 사본을 가집니다.
+
+    Returns:
+        write_table_part() 결과 목록 (tables 순서)
+    """
+    extension = '.sql.gz' if compress else '.sql'
+    jobs = [
+        (table, frame, parts_dir / f"{i:02d}_{table}{extension}", compress, (snapshot or {}).get(table),
+         diff_mode, table in soft_tables, tsv_dir)
+        for i, (table, frame) in enumerate(tables, 1)
+    ]
+
+    if workers <= 1:
+        return [write_table_part(*job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        # 큰 테이블부터 제출해서 마지막에 큰 테이블 하나만 남아 기다리는 일을 줄임
+        futures = {job[0]: executor.submit(write_table_part, *job)
+                   for job in sorted(jobs, key=lambda job: len(job[1]), reverse=True)}
+        return [futures[table].result() for table, _ in tables]
+
+
+def stitch_parts(manifest_path, output_path):
+    """manifest.json의 파트 파일을 순서대로 바이트 단위로 이어 붙여 최종 SQL 파일 생성"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    with open(output_path, 'wb') as out:
+        for part in manifest['parts']:
+            with open(manifest_path.parent / part['file'], 'rb') as f:
+                shutil.copyfileobj(f, out)
+    return output_path
+
+
+def sql_header_lines(title):
+    """SQL 파일 머리말 (외래키 / 유니크 검사 해제)"""
+    lines = [
+        f"-- {title}",
+        "-- Generated from data/final/*.csv",
+        "-- 외래키 의존성 순서: roasteries -> stores, beans -> menus -> bean_flavor_notes, menu_bean_mappings",
+        "",
+        "SET FOREIGN_KEY_CHECKS = 0;",
+    ]
+    if DISABLE_KEYS:
+        lines.append("SET UNIQUE_CHECKS = 0;")
+    lines.append("")
+    return lines
+
+
+def sql_footer_text():
+    """SQL 파일 꼬리말 (검사 복원, 마지막 줄바꿈 없음)"""
+    lines = []
+    if DISABLE_KEYS:
+        lines.append("SET UNIQUE_CHECKS = 1;")
+    lines.append("SET FOREIGN_KEY_CHECKS = 1;")
+    lines.append("")
+    lines.append("-- Import complete!")
     return "\n".join(lines)
 
 
 def main():
-    print("=== CSV to SQL 변환 시작 ===\n")
+    if '--mark-applied' in sys.argv[1:]:
+        # 생성 시 대기 파일에 저장한 스냅샷을 다음 --diff의 비교 기준으로 확정
+        if promote_pending_snapshot():
+            print("✓ 적용 확인: 대기 스냅샷을 다음 --diff의 비교 기준으로 확정했습니다.")
+        else:
+            print(f"적용 대기 중인 스냅샷이 없습니다: {PENDING_SNAPSHOT_PATH}")
+        return
+
+    diff_mode = '--diff' in sys.argv[1:]
+    compress = '--gzip' in sys.argv[1:]
+    skip_integrity = '--skip-integrity' in sys.argv[1:]
+    print(f"=== CSV to SQL 변환 시작{' (차분 모드)' if diff_mode else ''} ===\n")
 
-    # 출력 디렉토리 생성
+    # 출력 디렉토리 생성 (이전 파트 파일 정리)
     OUTPUT_DIR.mkdir(exist_ok=True)
+    PARTS_DIR.mkdir(exist_ok=True)
+    for old_part in PARTS_DIR.glob('*.sql*'):
+        old_part.unlink()
 
-    sql_parts = []
-    sql_parts.append("-- Comeet Data Import SQL")
-    sql_parts.append("-- Generated from data/final/*.csv")
-    sql_parts.append("-- 외래키 의존성 순서: roasteries -> stores, beans -> menus -> bean_flavor_notes, menu_bean_mappings")
-    sql_parts.append("")
-    sql_parts.append("SET FOREIGN_KEY_CHECKS = 0;")
-    sql_parts.append("")
+    snapshot = load_snapshot() if diff_mode else None
+    if diff_mode and snapshot is None:
+        print("이전 스냅샷이 없어 전체 SQL을 생성합니다.\n")
+        diff_mode = False
 
     # 먼저 메뉴 데이터를 읽어서 가게별 카테고리 계산
     print("0. 메뉴 기반 가게 카테고리 계산 중...")
-    menus_df = pd.read_csv(DATA_DIR / "menus.csv")
-    store_categories = calculate_store_categories(menus_df)
+    tables, store_categories = prepare_tables()
 
     # 카테고리 분포 출력
     category_distribution = Counter(store_categories.values())
     print(f"   -> 카테고리 분포: {dict(category_distribution)}")
     print("")
 
-    # 1. Roasteries
-    print("1. roasteries.csv 처리 중...")
-    roasteries_df = pd.read_csv(DATA_DIR / "roasteries.csv")
-    sql_parts.append(generate_roasteries_sql(roasteries_df))
-    sql_parts.append("")
-    print(f"   -> {len(roasteries_df)}개 레코드")
-
-    # 2. Stores (메뉴 기반 카테고리 적용)
-    print("2. stores.csv 처리 중...")
-    stores_df = pd.read_csv(DATA_DIR / "stores.csv")
-    sql_parts.append(generate_stores_sql(stores_df, store_categories))
-    sql_parts.append("")
-    print(f"   -> {len(stores_df)}개 레코드")
-
-    # 3. Beans
-    print("3. beans.csv 처리 중...")
-    beans_df = pd.read_csv(DATA_DIR / "beans.csv")
-    sql_parts.append(generate_beans_sql(beans_df))
-    sql_parts.append("")
-    print(f"   -> {len(beans_df)}개 레코드")
-
-    # 4. Menus (이미 위에서 읽었으므로 재사용)
-    print("4. menus.csv 처리 중...")
-    sql_parts.append(generate_menus_sql(menus_df))
-    sql_parts.append("")
-    print(f"   -> {len(menus_df)}개 레코드")
-
-    # 5. Bean Flavor Notes
-    print("5. bean_flavor_notes.csv 처리 중...")
-    bean_flavor_notes_df = pd.read_csv(DATA_DIR / "bean_flavor_notes.csv")
-    sql_parts.append(generate_bean_flavor_notes_sql(bean_flavor_notes_df))
-    sql_parts.append("")
-    print(f"   -> {len(bean_flavor_notes_df)}개 레코드")
-
-    # 6. Menu Bean Mappings
-    print("6. menu_bean_mappings.csv 처리 중...")
-    menu_bean_mappings_df = pd.read_csv(DATA_DIR / "menu_bean_mappings.csv")
-    sql_parts.append(generate_menu_bean_mappings_sql(menu_bean_mappings_df))
-    sql_parts.append("")
-    print(f"   -> {len(menu_bean_mappings_df)}개 레코드")
-
-    sql_parts.append("SET FOREIGN_KEY_CHECKS = 1;")
-    sql_parts.append("")
-    sql_parts.append("-- Import complete!")
-
-    # SQL 파일 저장
-    output_path = OUTPUT_DIR / "data_import.sql"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(sql_parts))
-
-    print(f"\n✓ SQL 파일 생성 완료: {output_path}")
-
-    # 통계
-    total_records = (
-        len(roasteries_df) + len(stores_df) + len(beans_df) +
-        len(menus_df) + len(bean_flavor_notes_df) + len(menu_bean_mappings_df)
-    )
-    print(f"✓ 총 {total_records}개 레코드")
+    # 외래키 검사를 끈 채로 적재되므로 SQL을 만들기 전에 참조 무결성 확인
+    print("참조 무결성 검사 중...")
+    report = check_integrity(tables, {'flavors': flavor_ids()}, SCHEMA_PATH)
+    save_report(report)
+    checked = report['checked']
+    print(f"   -> 외래키 {checked['foreign_keys']}개, 유니크 키 {checked['unique_keys']}개, "
+          f"NOT NULL {checked['not_null']}개 검사 (건너뜀: {', '.join(report['skipped']) or '없음'})")
+    for violation in report['violations']:
+        print(f"   ✗ {format_violation(violation)}")
+    if report['violations']:
+        if not skip_integrity:
+            print(f"\n✗ 참조 무결성 위반으로 중단합니다. 보고서: {REPORT_PATH}")
+            print("  (위반을 알고도 생성하려면 --skip-integrity)")
+            sys.exit(1)
+        print("   -> --skip-integrity: 위반을 무시하고 계속 진행")
+    print("")
+
+    # 테이블별 SQL 파트 (+ 전체 모드는 LOAD DATA용 TSV) 병렬 생성
+    workers = min(PARALLEL_WORKERS, len(tables))
+    print(f"1-{len(tables)}. 테이블별 SQL 파트 생성 중... (워커 {workers}개)")
+    soft_tables = soft_delete_tables() if diff_mode else set()
+    results = generate_table_parts(tables, PARTS_DIR, compress, snapshot, diff_mode, soft_tables,
+                                   tsv_dir=None if diff_mode else TSV_DIR, workers=workers)
+    for i, result in enumerate(results, 1):
+        if diff_mode:
+            print(f"{i}. {result['table']}.csv -> {result['rows']}개 레코드 (추가 {result['inserted']}, "
+                  f"변경 {result['updated']}, 삭제 {len(result['deleted'])})")
+        else:
+            print(f"{i}. {result['table']}.csv -> {result['rows']}개 레코드 ({result['file']}, "
+                  f"{result['bytes'] / 1024:.1f}KB)")
+
+    # 머리말 / (차분 모드) 삭제 / 꼬리말 파트
+    extension = '.sql.gz' if compress else '.sql'
+    title = "Comeet Data Diff SQL (마지막 생성 이후 바뀐 행만)" if diff_mode else "Comeet Data Import SQL"
+    header_path = PARTS_DIR / f"00_header{extension}"
+    parts = [{'table': None, 'file': header_path.name, 'rows': 0,
+              'bytes': write_part(header_path, sql_header_lines(title), compress)}]
+    parts += [{key: result[key] for key in ('table', 'file', 'rows', 'bytes')} for result in results]
+
+    if diff_mode:
+        # 삭제는 자식 테이블부터
+        delete_lines = []
+        for result in reversed(results):
+            if result['deleted']:
+                table = result['table']
+                delete_lines += [generate_delete_sql(TABLE_TITLES[table], table, result['deleted'],
+                                                     table in soft_tables), ""]
+        delete_path = PARTS_DIR / f"{len(results) + 1:02d}_deletes{extension}"
+        parts.append({'table': None, 'file': delete_path.name,
+                      'rows': sum(len(result['deleted']) for result in results),
+                      'bytes': write_part(delete_path, delete_lines, compress)})
+
+    footer_path = PARTS_DIR / f"99_footer{extension}"
+    with open_part(footer_path, compress) as f:
+        f.write(sql_footer_text())
+    parts.append({'table': None, 'file': footer_path.name, 'rows': 0, 'bytes': footer_path.stat().st_size})
+
+    # manifest 순서대로 이어 붙여 최종 SQL 파일 생성
+    output_path = OUTPUT_DIR / (("data_diff" if diff_mode else "data_import") + extension)
+    manifest_path = PARTS_DIR / "manifest.json"
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'mode': 'diff' if diff_mode else 'full', 'compress': compress,
+                   'output': output_path.name, 'parts': parts}, f, ensure_ascii=False, indent=2)
+    stitch_parts(manifest_path, output_path)
+
+    print(f"\n✓ SQL 파일 생성 완료: {output_path} (파트 {len(parts)}개, {manifest_path.name})")
+
+    if diff_mode:
+        diff_rows = sum(result['inserted'] + result['updated'] + len(result['deleted']) for result in results)
+        total_rows = sum(result['rows'] for result in results)
+        print(f"✓ 차분: {diff_rows}개 행 / 전체 {total_rows}개 ({diff_rows / max(total_rows, 1):.1%}), "
+              f"{output_path.stat().st_size / 1024:.1f}KB")
+    else:
+        # LOAD DATA용 TSV + 로더 SQL (TSV는 워커에서 테이블별로 생성/검증)
+        print("\n7. LOAD DATA용 TSV 생성 완료")
+        for result in results:
+            print(f"   -> {result['table']}.tsv: {result['load_data'][1]}개 행 (검증 완료)")
+        loader_path = write_load_data_script([result['load_data'][0] for result in results], TSV_DIR)
+        print(f"✓ 로더 SQL 생성 완료: {loader_path}")
+
+        # 통계
+        total_records = sum(result['rows'] for result in results)
+        print(f"✓ 총 {total_records}개 레코드")
+
+    # 다음 --diff 실행의 비교 기준은 DB 적용 확인(--mark-applied) 후에 교체
+    save_snapshot({result['table']: result['snapshot'] for result in results}, PENDING_SNAPSHOT_PATH)
+    print(f"\n스냅샷 대기 중: {PENDING_SNAPSHOT_PATH.name} "
+          f"(DB에 적용한 뒤 --mark-applied로 확정, 그 전의 --diff는 이전 기준과 비교)")
 
 
 if __name__ == "__main__":
@@ -12,9 +12,12 @@
     python scripts/import_bean_scores.py
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from flavor_hierarchy import load_hierarchy
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent
 INPUT_SCORES = BASE_DIR / "data" / "debug" / "bean_scores.csv"
@@ -27,21 +30,19 @@ OUTPUT_PATH = OUTPUT_DIR / "bean_scores_import.csv"
 # Flavor ID 분류 (SCA Flavor Wheel 기반)
 # ============================================================================
 
-# SWEET 관련 flavor_id (8xx 계열)
-SWEET_FLAVOR_IDS = {
+# SWEET / BITTER로 보는 flavor: 아래 flavor와 그 하위 flavor 전체 (flavor_hierarchy.py 계층 closure)
+SWEET_FLAVOR_ROOTS = [
     8,      # SWEET (대분류)
-    801, 802, 803, 804, 805,  # 중분류
-    80101, 80102, 80103, 80104,  # 소분류: Molasses, Maple, Caramel, Honey
-}
+]
 
-# BITTERNESS 관련 flavor_id
-BITTER_FLAVOR_IDS = {
-    5,      # ROASTED (대분류)
-    501, 502, 503, 504,  # 중분류: Tobacco, Burnt, Cereal
-    50301, 50302, 50303, 50304,  # 소분류: Acrid, Ashy, Smoky, Brown Roast
+BITTER_FLAVOR_ROOTS = [
+    5,      # ROASTED (대분류): Tobacco, Burnt, Cereal 등
     40201,  # BITTER (화학적 쓴맛)
-    70201, 70202,  # Dark Chocolate (약간의 쓴맛)
-}
+    70201, 70202,  # Chocolate, Dark Chocolate (약간의 쓴맛)
+]
+
+SWEET_FLAVOR_IDS = set(load_hierarchy().expand_descendants(SWEET_FLAVOR_ROOTS).tolist())
+BITTER_FLAVOR_IDS = set(load_hierarchy().expand_descendants(BITTER_FLAVOR_ROOTS).tolist())
 
 # Roast Level별 기본 bitterness 가중치
 ROAST_BITTERNESS_BASE = {
@@ -72,7 +73,35 @@ def load_data():
     return scores, beans, flavors
 
 
-def calculate_sweetness(bean_id: int, flavor_ids: set, roast_level: str) -> int:
+def flavor_indicator(flavors: pd.DataFrame) -> dict:
+    """
+    bean_flavor_notes → 원두×flavor 희소 지시 행렬 (COO 형식, 같은 (원두, flavor) 노트는 한 번만)
+
+    Returns:
+        {"beans": 행 번호별 bean_id, "flavors": 열 번호별 flavor_id,
+         "rows": 노트별 행 번호, "cols": 노트별 열 번호}
+    """
+    pairs = flavors[["bean_id", "flavor_id"]].drop_duplicates()
+    rows, bean_index = pd.factorize(pairs["bean_id"])
+    cols, flavor_index = pd.factorize(pairs["flavor_id"])
+    return {"beans": bean_index, "flavors": flavor_index, "rows": rows, "cols": cols}
+
+
+def indicator_counts(matrix: dict, flavor_ids) -> np.ndarray:
+    """지시 행렬 × (flavor_ids에 속하는 열이면 1인 벡터) → 원두(행)별 해당 flavor 개수"""
+    vector = matrix["flavors"].isin(list(flavor_ids)).astype(np.int64)
+    counts = np.bincount(matrix["rows"], weights=vector[matrix["cols"]], minlength=len(matrix["beans"]))
+    return counts.astype(np.int64)
+
+
+def bean_flavor_counts(matrix: dict, bean_ids: pd.Series, flavor_ids) -> np.ndarray:
+    """bean_ids 순서의 해당 flavor 개수 (노트가 없는 원두는 0)"""
+    counts = np.append(indicator_counts(matrix, flavor_ids), 0)
+    # get_indexer가 못 찾으면 -1 → 마지막에 붙인 0
+    return counts[matrix["beans"].get_indexer(bean_ids)]
+
+
+def calculate_sweetness(roast_levels: pd.Series, sweet_counts: np.ndarray) -> np.ndarray:
     """
     단맛 점수 계산 (1-10)
 
@@ -80,16 +109,15 @@ def calculate_sweetness(bean_id: int, flavor_ids: set, roast_level: str) -> int:
     1. 기본값: roast_level에 따른 base (LIGHT=6, MEDIUM=5, HEAVY=3)
     2. SWEET 플레이버 개수당 +1 (최대 +4)
     """
-    base = ROAST_SWEETNESS_BASE.get(roast_level, 5)
-    sweet_count = len(flavor_ids & SWEET_FLAVOR_IDS)
+    base = roast_levels.map(ROAST_SWEETNESS_BASE).fillna(5).to_numpy(dtype=np.int64)
 
     # 최대 4점 추가
-    bonus = min(sweet_count, 4)
+    bonus = np.minimum(sweet_counts, 4)
 
-    return min(10, max(1, base + bonus))
+    return np.clip(base + bonus, 1, 10)
 
 
-def calculate_bitterness(bean_id: int, flavor_ids: set, roast_level: str) -> int:
+def calculate_bitterness(roast_levels: pd.Series, bitter_counts: np.ndarray) -> np.ndarray:
     """
     쓴맛 점수 계산 (1-10)
 
@@ -97,55 +125,68 @@ def calculate_bitterness(bean_id: int, flavor_ids: set, roast_level: str) -> int
     1. 기본값: roast_level에 따른 base (LIGHT=2, MEDIUM=5, HEAVY=8)
     2. BITTER 플레이버 개수당 +1 (최대 +2)
     """
-    base = ROAST_BITTERNESS_BASE.get(roast_level, 5)
-    bitter_count = len(flavor_ids & BITTER_FLAVOR_IDS)
+    base = roast_levels.map(ROAST_BITTERNESS_BASE).fillna(5).to_numpy(dtype=np.int64)
 
     # 최대 2점 추가
-    bonus = min(bitter_count, 2)
+    bonus = np.minimum(bitter_counts, 2)
 
-    return min(10, max(1, base + bonus))
+    return np.clip(base + bonus, 1, 10)
+
+
+def flavor_tag_strings(flavors: pd.DataFrame) -> pd.Series:
+    """
+    bean_id를 인덱스로 하는 flavor_tags 문자열 Series ("[80103, 80401, ...]")
+
+    flavor_id 순서는 기존과 같이 노트 순서대로 넣은 set의 순회 순서
+    (원두별로 안정 정렬한 노트를 슬라이스해서 set을 만듦)
+    """
+    flavors = flavors[flavors["bean_id"].notna()]
+    codes, bean_index = pd.factorize(flavors["bean_id"])
+    flavor_ids = flavors["flavor_id"].to_numpy()[np.argsort(codes, kind="stable")].tolist()
+    ends = np.cumsum(np.bincount(codes, minlength=len(bean_index))).tolist()
+    starts = [0] + ends[:-1]
+    tags = [str(list(set(flavor_ids[start:end]))) for start, end in zip(starts, ends)]
+    return pd.Series(tags, index=bean_index, dtype=object)
 
 
 def transform_bean_scores(scores: pd.DataFrame, beans: pd.DataFrame, flavors: pd.DataFrame) -> pd.DataFrame:
     """
     외부 CSV를 bean_scores 테이블 스키마에 맞게 변환
+
+    flavor 노트는 원두×flavor 지시 행렬로 한 번만 바꾸고, SWEET / BITTER 개수는
+    지시 벡터와의 곱으로 계산해 모든 감각 속성을 컬럼 단위 NumPy 배열로 만듭니다.
     """
-    # bean_id -> roasting_level 매핑
-    roast_map = beans.set_index("id")["roasting_level"].to_dict()
-
-    # bean_id -> flavor_ids 집합 매핑
-    flavor_map = flavors.groupby("bean_id")["flavor_id"].apply(set).to_dict()
-
-    results = []
-
-    for _, row in scores.iterrows():
-        bean_id = row["bean_id"]
-        roast_level = roast_map.get(bean_id, "MEDIUM")
-        flavor_ids = flavor_map.get(bean_id, set())
-
-        # sweetness, bitterness 추정
-        sweetness = calculate_sweetness(bean_id, flavor_ids, roast_level)
-        bitterness = calculate_bitterness(bean_id, flavor_ids, roast_level)
-
-        # flavor_tags 생성 (flavor_id를 code로 변환은 추후 처리)
-        # 일단 flavor_id 리스트로 저장
-        flavor_tags = list(flavor_ids) if flavor_ids else None
-
-        results.append({
-            "bean_id": int(bean_id),
-            "acidity": int(round(row["acidity"])),
-            "body": int(round(row["body"])),
-            "sweetness": sweetness,
-            "bitterness": bitterness,
-            "aroma": int(round(row["aroma"])),
-            "flavor": int(round(row["flavor"])),
-            "aftertaste": int(round(row["aftertaste"])),
-            "total_score": int(row["rating"]),
-            "roast_level": roast_level,
-            "flavor_tags": str(flavor_tags) if flavor_tags else None,
-        })
-
-    return pd.DataFrame(results)
+    bean_ids = scores["bean_id"]
+
+    # bean_id -> roasting_level (beans.csv에 없는 원두는 MEDIUM, 중복 id는 마지막 행)
+    roast_map = beans.drop_duplicates("id", keep="last").set_index("id")["roasting_level"]
+    roast_levels = bean_ids.map(roast_map).where(bean_ids.isin(roast_map.index), "MEDIUM")
+
+    # sweetness, bitterness 추정
+    matrix = flavor_indicator(flavors)
+    sweetness = calculate_sweetness(roast_levels, bean_flavor_counts(matrix, bean_ids, SWEET_FLAVOR_IDS))
+    bitterness = calculate_bitterness(roast_levels, bean_flavor_counts(matrix, bean_ids, BITTER_FLAVOR_IDS))
+
+    # flavor_tags 생성 (flavor_id를 code로 변환은 추후 처리)
+    # 일단 flavor_id 리스트로 저장
+    flavor_tags = bean_ids.map(flavor_tag_strings(flavors))
+
+    def rounded(column):
+        return np.round(scores[column].to_numpy(dtype=float)).astype(np.int64)
+
+    return pd.DataFrame({
+        "bean_id": bean_ids.to_numpy(dtype=float).astype(np.int64),
+        "acidity": rounded("acidity"),
+        "body": rounded("body"),
+        "sweetness": sweetness,
+        "bitterness": bitterness,
+        "aroma": rounded("aroma"),
+        "flavor": rounded("flavor"),
+        "aftertaste": rounded("aftertaste"),
+        "total_score": scores["rating"].to_numpy(dtype=float).astype(np.int64),
+        "roast_level": roast_levels.to_numpy(dtype=object),
+        "flavor_tags": flavor_tags.astype(object).where(flavor_tags.notna(), None).to_numpy(),
+    })
 
 
 def print_summary(df: pd.DataFrame):
@@ -0,0 +1,139 @@
+"""
+DB 직접 적재 스크립트
+
+data/final/*.csv를 5_generate_sql.py와 같은 규칙으로 준비한 뒤, SQL 파일을 거치지 않고
+커넥션 풀 + executemany로 DB에 바로 적재합니다. (외래키 의존성 순서, 테이블별 rows/s 출력)
+
+사전 준비 (MySQL): schema.sql, flavor_prod.sql 적재 + 대상 테이블이 비어 있어야 함
+
+사용법:
+    python scripts/7_load_database.py                      # MySQL (DB_HOST 등 환경변수)
+    python scripts/7_load_database.py --sqlite [DB 경로]    # SQLite 호환 모드 (스키마 생성 + 적재 + 값 검증)
+    python scripts/7_load_database.py --skip-integrity     # 참조 무결성 위반이 있어도 적재
+
+외래키 검사를 끈 채로 적재하므로, 5_generate_sql.py와 같이 적재 전에 참조 무결성을 검사하고
+위반이 있으면 보고서만 남기고 종료 코드 1로 중단합니다.
+"""
+
+import getpass
+import os
+import sys
+from collections import Counter
+from importlib import import_module
+from pathlib import Path
+
+from db_loader import count_rows, fetch_rows, load_database, mysql_pool, sqlite_pool, sqlite_schema, table_params
+from integrity_check import REPORT_PATH, check_integrity, flavor_ids, format_violation, save_report
+
+generate_sql = import_module('5_generate_sql')
+
+# 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+SCHEMA_PATH = PROJECT_ROOT / "sql" / "schema.sql"
+FLAVOR_SQL_PATH = PROJECT_ROOT / "sql" / "flavor_prod.sql"
+SQLITE_PATH = PROJECT_ROOT / "data" / "processed" / "comeet.sqlite3"
+
+# 외래키 검사 (data_import.sql과 같이 기본은 끔)
+# stores.owner_id가 적재하지 않는 users를 가리키므로 켜면 MySQL 적재가 실패함 (대신 적재 전 integrity_check)
+FOREIGN_KEY_CHECKS = False
+
+
+def connect_mysql():
+    """환경변수(DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME)로 MySQL 커넥션 풀 생성"""
+    password = os.environ.get("DB_PASSWORD")
+    if password is None:
+        password = getpass.getpass("DB 비밀번호를 입력하세요: ")
+    return mysql_pool(
+        host=os.environ.get("DB_HOST", "localhost"),
+        port=int(os.environ.get("DB_PORT", "3306")),
+        user=os.environ.get("DB_USER", "root"),
+        password=password,
+        database=os.environ.get("DB_NAME", "comeet"),
+        foreign_key_checks=FOREIGN_KEY_CHECKS,
+    )
+
+
+def create_sqlite(path: Path):
+    """SQLite DB를 새로 만들고 schema.sql(변환) + flavor_prod.sql 적용"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    pool = sqlite_pool(str(path), foreign_key_checks=FOREIGN_KEY_CHECKS)
+    with pool.connection() as conn:
+        conn.executescript(sqlite_schema(SCHEMA_PATH))
+        conn.executescript(FLAVOR_SQL_PATH.read_text(encoding='utf-8'))
+        conn.commit()
+    return pool
+
+
+def verify_loaded_values(pool, tables):
+    """DB에서 다시 읽은 행과 적재한 값이 같은지 확인하고 불일치 테이블 목록을 반환"""
+    mismatched = []
+    for table, frame in tables:
+        expected = table_params(frame, generate_sql.TABLE_COLUMN_TYPES[table])
+        actual = fetch_rows(pool, table, list(frame.columns))
+        if Counter(expected) != Counter(actual):
+            mismatched.append(table)
+    return mismatched
+
+
+def main():
+    print("=== DB 직접 적재 시작 ===\n")
+
+    skip_integrity = '--skip-integrity' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--skip-integrity']
+    sqlite_mode = len(args) > 0 and args[0] == '--sqlite'
+
+    print("1. 테이블 데이터 준비 중...")
+    tables, _ = generate_sql.prepare_tables()
+    print(f"   -> {len(tables)}개 테이블, {sum(len(frame) for _, frame in tables)}개 레코드")
+
+    # 외래키 검사를 끈 채로 적재되므로 5_generate_sql.py와 같은 검사를 먼저 실행
+    report = check_integrity(tables, {'flavors': flavor_ids()}, SCHEMA_PATH)
+    save_report(report)
+    for violation in report['violations']:
+        print(f"   ✗ {format_violation(violation)}")
+    if report['violations']:
+        if not skip_integrity:
+            print(f"\n✗ 참조 무결성 위반으로 중단합니다. 보고서: {REPORT_PATH}")
+            print("  (위반을 알고도 적재하려면 --skip-integrity)")
+            sys.exit(1)
+        print("   -> --skip-integrity: 위반을 무시하고 계속 진행")
+    else:
+        print("   -> 참조 무결성 위반 없음")
+
+    if sqlite_mode:
+        sqlite_path = Path(args[1]) if len(args) > 1 else SQLITE_PATH
+        print(f"\n2. SQLite 호환 모드: {sqlite_path}")
+        pool = create_sqlite(sqlite_path)
+    else:
+        print("\n2. MySQL 연결 중...")
+        pool = connect_mysql()
+
+    try:
+        print(f"\n3. 적재 중 (외래키 의존성 순서, 외래키 검사 {'켬' if FOREIGN_KEY_CHECKS else '끔'})...")
+        stats = load_database(pool, tables, generate_sql.TABLE_COLUMN_TYPES)
+        for stat in stats:
+            print(f"   -> {stat['table']}: {stat['rows']}개 행, {stat['seconds']:.2f}s "
+                  f"({stat['rows_per_second']:,.0f} rows/s)")
+
+        print("\n4. 적재 결과 확인 중...")
+        counts = count_rows(pool, [table for table, _ in tables])
+        failed = [table for table, frame in tables if counts[table] != len(frame)]
+        if sqlite_mode:
+            failed += [table for table in verify_loaded_values(pool, tables) if table not in failed]
+    finally:
+        pool.close()
+
+    if failed:
+        print(f"\n✗ 적재 결과가 CSV와 다른 테이블: {failed}")
+        sys.exit(1)
+
+    total_rows = sum(stat['rows'] for stat in stats)
+    total_seconds = sum(stat['seconds'] for stat in stats)
+    print(f"\n✓ 적재 완료: 총 {total_rows}개 행 ({'값 검증 완료' if sqlite_mode else '행 수 확인 완료'})")
+    print(f"✓ 테이블 적재 시간 합계 {total_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+원두 근사 중복(near-duplicate) 탐지 모듈
+
+Coffee Review 데이터셋에는 같은 원두가 연도만 바꿔 다시 리뷰되거나,
+같은 로스터리가 이름을 조금 바꿔 올린 경우가 많습니다.
+LLM 호출 전에 name + origin + roaster 문자열을 MinHash로 서명하고,
+LSH 밴딩으로 후보 쌍을 찾은 뒤 Union-Find로 클러스터를 묶습니다.
+
+사용법:
+    python scripts/bean_dedup.py [csv_path]
+
+2_process_beans.py에서는 클러스터 대표 원두만 LLM에 보내고,
+나머지 멤버에는 대표의 결과를 복사(fan-out)합니다.
+"""
+
+import re
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+SHINGLE_SIZE = 3          # 문자 n-gram 크기
+NUM_PERM = 128            # MinHash 해시 함수 개수
+NUM_BANDS = 16            # LSH 밴드 수 (NUM_PERM = NUM_BANDS * rows)
+SIMILARITY_THRESHOLD = 0.8  # 추정 Jaccard 유사도 기준
+DEDUP_COLUMNS = ['name', 'origin', 'roaster']
+
+# (a * x + b) mod p 형태의 universal hashing
+# p < 2^31, x < 2^32 이므로 int64 범위에서 overflow 없이 계산 가능
+_MERSENNE_PRIME = (1 << 31) - 1
+
+# 연도 표기 제거 (같은 원두를 다른 해에 리뷰한 경우)
+_YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+
+
+def normalize_text(text) -> str:
+    """소문자 변환, 연도/특수문자 제거, 공백 정리"""
+    if text is None or pd.isna(text):
+        return ''
+    text = str(text).lower()
+    text = _YEAR_PATTERN.sub(' ', text)
+    text = _NON_WORD_PATTERN.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def build_dedup_key(row) -> str:
+    """name + origin + roaster를 하나의 비교용 문자열로 결합"""
+    return ' | '.join(normalize_text(row.get(col)) for col in DEDUP_COLUMNS)
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """문자 k-gram 집합을 crc32 해시 배열로 변환 (실행마다 동일한 값)"""
+    if len(text) <= k:
+        grams = {text}
+    else:
+        grams = {text[i:i + k] for i in range(len(text) - k + 1)}
+    return np.fromiter(
+        (zlib.crc32(g.encode('utf-8')) for g in grams),
+        dtype=np.int64,
+        count=len(grams),
+    )
+
+
+def minhash_signatures(texts, num_perm: int = NUM_PERM, seed: int = 42) -> np.ndarray:
+    """
+    텍스트 목록의 MinHash 서명 행렬을 계산합니다.
+
+    Returns:
+        (len(texts), num_perm) 크기의 int64 배열
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+    b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+
+    signatures = np.full((len(texts), num_perm), _MERSENNE_PRIME, dtype=np.int64)
+    for i, text in enumerate(texts):
+        hashes = shingle_hashes(text)
+        # (num_perm, n_shingles) 행렬에서 행별 최솟값
+        permuted = (a[:, None] * hashes[None, :] + b[:, None]) % _MERSENNE_PRIME
+        signatures[i] = permuted.min(axis=1)
+    return signatures
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_signatures(signatures: np.ndarray, num_bands: int = NUM_BANDS,
+                       threshold: float = SIMILARITY_THRESHOLD) -> np.ndarray:
+    """
+    LSH 밴딩으로 후보 쌍을 찾고, 추정 유사도가 threshold 이상이면 같은 클러스터로 묶습니다.
+
+    Returns:
+        각 행의 대표 행 위치 (클러스터 내 가장 앞선 행)
+    """
+    n, num_perm = signatures.shape
+    rows_per_band = num_perm // num_bands
+    parent = np.arange(n)
+
+    for band in range(num_bands):
+        start = band * rows_per_band
+        band_slice = np.ascontiguousarray(signatures[:, start:start + rows_per_band])
+        # 밴드 전체를 바이트 키로 보고 같은 버킷에 들어간 행끼리 후보 쌍
+        keys = band_slice.view(np.dtype((np.void, band_slice.dtype.itemsize * rows_per_band))).ravel()
+        _, bucket_ids = np.unique(keys, return_inverse=True)
+
+        order = np.argsort(bucket_ids, kind='stable')
+        sorted_buckets = bucket_ids[order]
+        boundaries = np.flatnonzero(np.diff(sorted_buckets)) + 1
+        for members in np.split(order, boundaries):
+            if len(members) < 2:
+                continue
+            head = members[0]
+            for other in members[1:]:
+                root_a, root_b = _find(parent, head), _find(parent, other)
+                if root_a == root_b:
+                    continue
+                similarity = np.mean(signatures[head] == signatures[other])
+                if similarity >= threshold:
+                    # 앞선 행이 대표가 되도록 작은 인덱스를 루트로 유지
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return np.array([_find(parent, i) for i in range(n)])
+
+
+def find_duplicate_clusters(df: pd.DataFrame, threshold: float = SIMILARITY_THRESHOLD) -> pd.Series:
+    """
+    DataFrame의 각 행에 대해 클러스터 대표 행의 index를 반환합니다.
+
+    대표 행은 자기 자신의 index를 값으로 가집니다.
+    """
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=df.index.dtype)
+
+    texts = [build_dedup_key(row) for row in df.to_dict('records')]
+    signatures = minhash_signatures(texts)
+    rep_positions = cluster_signatures(signatures, threshold=threshold)
+    return pd.Series(df.index[rep_positions], index=df.index, name='cluster_rep')
+
+
+def summarize_clusters(cluster_rep: pd.Series) -> dict:
+    """클러스터 통계 (LLM 호출 절감량 확인용)"""
+    sizes = cluster_rep.value_counts()
+    return {
+        'rows': len(cluster_rep),
+        'clusters': len(sizes),
+        'duplicate_clusters': int((sizes > 1).sum()),
+        'saved_calls': len(cluster_rep) - len(sizes),
+    }
+
+
+def main():
+    default_path = Path(__file__).parent.parent / 'data' / 'beans' / 'coffee_clean.csv'
+    csv_path = Path(sys.argv[1]) if len(sys.argv) > 1 else default_path
+
+    print("=" * 60)
+    print("원두 근사 중복 탐지")
+    print("=" * 60)
+
+    df = pd.read_csv(csv_path)
+    print(f"\n[1/2] 데이터 로드: {csv_path} ({len(df)}개)")
+
+    print("\n[2/2] MinHash 클러스터링...")
+    cluster_rep = find_duplicate_clusters(df)
+    stats = summarize_clusters(cluster_rep)
+    print(f"  - 클러스터: {stats['clusters']}개 (중복 클러스터 {stats['duplicate_clusters']}개)")
+    print(f"  - 절감되는 LLM 호출: {stats['saved_calls']}개")
+
+    print("\n  중복 클러스터 샘플:")
+    duplicated = cluster_rep[cluster_rep.duplicated(keep=False)]
+    for rep, members in list(duplicated.groupby(duplicated))[:10]:
+        print(f"    * {df.at[rep, 'name']}")
+        for idx in members.index:
+            if idx != rep:
+                print(f"      = {df.at[idx, 'name']}")
+
+
+if __name__ == '__main__':
+    main()
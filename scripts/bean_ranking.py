@@ -0,0 +1,280 @@
+"""
+향미 유사도 기반 원두 랭킹 모듈
+
+국가별 대표 원두 하나(bean_ids[0])만 고르면 같은 국가의 메뉴가 모두 같은 원두로 매핑되므로,
+해당 국가의 모든 후보 원두를 점수화하여 top-k를 반환합니다.
+
+점수 = 향미 코사인 유사도 + KEYWORD_BONUS × (지역/품종 키워드 일치) + RATING_WEIGHT × 정규화 평점
+
+    - 원두 향미 벡터: bean_flavor_notes.csv의 flavor_id를 Flavor Wheel 상위 분류까지 전파
+      (소분류 1.0, 중분류 0.5, 대분류 0.25) 후 L2 정규화
+    - 질의 향미 벡터: 메뉴명/메뉴 설명/가게 설명에서 flavors_rag.json 키워드를 찾아 같은 방식으로 생성
+    - 향미 정보가 없는 텍스트는 키워드 일치와 평점 순으로 정렬
+
+모든 질의를 (질의 × 향미) @ (향미 × 원두) 행렬곱 한 번으로 점수화하고
+argpartition으로 상위 k개만 정렬합니다.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from keyword_trie import build_trie_pattern
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+FLAVORS_RAG_PATH = Path(__file__).parent.parent / 'data' / 'debug' / 'flavors_rag.json'
+
+# 자기 자신, 부모, 조부모 순서의 전파 가중치
+ANCESTOR_WEIGHTS = (1.0, 0.5, 0.25)
+
+KEYWORD_BONUS = 1.0   # 질의 키워드(지역/품종/가공법)가 원두 이름/품종/가공법에 포함될 때
+RATING_WEIGHT = 0.1   # 평점(0~1 정규화) 가중치. 향미/키워드 점수가 같을 때 순서를 정함
+DEFAULT_TOP_K = 3
+CHUNK_SIZE = 4096     # 질의를 나눠 계산할 행 수 (질의 × 원두 점수 행렬 메모리 제한)
+
+# 한 글자 키워드('티', '탄', '꽃' 등)는 메뉴명에서 오탐이 많아 제외
+MIN_KEYWORD_LENGTH = 2
+
+
+def load_flavor_tree(rag_path: Path = FLAVORS_RAG_PATH) -> tuple[dict, dict]:
+    """
+    flavors_rag.json에서 향미 계층과 키워드 로드
+
+    Returns:
+        (parents, keyword_flavors): flavor_id → parent_id, 소문자 키워드 → [flavor_id, ...]
+    """
+    with open(rag_path, 'r', encoding='utf-8') as f:
+        flavors = json.load(f)['flavors']
+
+    parents = {flavor['id']: flavor.get('parent_id') for flavor in flavors}
+    keyword_flavors = {}
+    for flavor in flavors:
+        for keyword in [flavor['name'], *flavor.get('keywords', [])]:
+            keyword = keyword.lower()
+            if len(keyword) >= MIN_KEYWORD_LENGTH:
+                keyword_flavors.setdefault(keyword, []).append(flavor['id'])
+    return parents, keyword_flavors
+
+
+_WORD_BOUNDARY_BEFORE = r'(?<![a-z0-9])'
+_WORD_BOUNDARY_AFTER = r'(?![a-z0-9])'
+
+
+def build_flavor_pattern(keywords) -> re.Pattern:
+    """
+    향미 키워드 trie 정규식 (영문 키워드는 앞뒤가 영숫자가 아닐 때만 매칭, 예: "boiled"의 "oil" 제외)
+
+    단어 경계를 정규식 안의 lookaround로 두므로, 가장 긴 키워드가 경계에서 실패하면
+    같은 위치의 더 짧은 키워드로 되돌아가 매칭합니다. (예: "black teas" → "black")
+    """
+    ascii_keywords = [keyword for keyword in keywords if keyword.isascii()]
+    other_keywords = [keyword for keyword in keywords if not keyword.isascii()]
+    branches = []
+    if ascii_keywords:
+        trie = build_trie_pattern(ascii_keywords).pattern
+        branches.append(f'{_WORD_BOUNDARY_BEFORE}(?:{trie}){_WORD_BOUNDARY_AFTER}')
+    if other_keywords:
+        branches.append(build_trie_pattern(other_keywords).pattern)
+    return re.compile('|'.join(branches) or r'(?!)')
+
+
+def find_flavor_keywords(pattern: re.Pattern, text: str) -> set:
+    """소문자 텍스트에서 향미 키워드 집합을 찾습니다. (pattern: build_flavor_pattern)"""
+    return set(pattern.findall(text))
+
+
+def ancestor_matrix(flavor_ids, parents: dict) -> np.ndarray:
+    """(F × F) 전파 행렬: 행 flavor를 자신과 상위 분류 열에 ANCESTOR_WEIGHTS로 분배"""
+    position = {flavor_id: i for i, flavor_id in enumerate(flavor_ids)}
+    propagate = np.zeros((len(flavor_ids), len(flavor_ids)), dtype=np.float64)
+    for i, flavor_id in enumerate(flavor_ids):
+        current = flavor_id
+        for weight in ANCESTOR_WEIGHTS:
+            if current not in position:
+                break
+            propagate[i, position[current]] = weight
+            current = parents.get(current)
+    return propagate
+
+
+def _l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def build_ranker(beans: pd.DataFrame, flavor_notes: pd.DataFrame, bean_countries: pd.Series,
+                 bean_scores: pd.DataFrame = None, keyword_beans: dict = None,
+                 rag_path: Path = FLAVORS_RAG_PATH) -> dict:
+    """
+    원두 랭킹에 필요한 행렬을 미리 계산합니다.
+
+    Args:
+        beans: beans.csv (id, name, variety, processing_method)
+        flavor_notes: bean_flavor_notes.csv (bean_id, flavor_id)
+        bean_countries: beans와 같은 index의 정규화된 국가명
+        bean_scores: bean_scores.csv (bean_id, rating). 없으면 평점 항은 0
+        keyword_beans: 질의 키워드 → 해당 원두 ID 집합 (country_bean_index.keyword_bean_ids)
+    """
+    parents, keyword_flavors = load_flavor_tree(rag_path)
+    flavor_ids = sorted(parents)
+    flavor_position = {flavor_id: i for i, flavor_id in enumerate(flavor_ids)}
+    propagate = ancestor_matrix(flavor_ids, parents)
+
+    bean_ids = beans['id'].to_numpy(dtype=np.int64)
+    bean_position = pd.Series(np.arange(len(bean_ids)), index=bean_ids)
+
+    # 원두 × 향미 지시 행렬 → 상위 분류 전파 → 정규화
+    notes = flavor_notes[flavor_notes['bean_id'].isin(bean_position.index)
+                         & flavor_notes['flavor_id'].isin(flavor_position)]
+    indicator = np.zeros((len(bean_ids), len(flavor_ids)), dtype=np.float64)
+    indicator[bean_position[notes['bean_id']].to_numpy(),
+              notes['flavor_id'].map(flavor_position).to_numpy()] = 1.0
+    flavor_matrix = _l2_normalize(indicator @ propagate)
+
+    # 평점 prior (0~1) + 같은 점수일 때 앞선 원두가 먼저 오도록 아주 작은 tie-break
+    rating_prior = np.zeros(len(bean_ids), dtype=np.float64)
+    if bean_scores is not None and len(bean_scores) > 0:
+        rating = beans['id'].map(bean_scores.drop_duplicates('bean_id').set_index('bean_id')['rating'])
+        rating = rating.astype(float)
+        if rating.notna().any():
+            low, high = rating.min(), rating.max()
+            span = high - low if high > low else 1.0
+            rating_prior = ((rating - low) / span).fillna(0).to_numpy(dtype=np.float64)
+    prior = RATING_WEIGHT * rating_prior - np.arange(len(bean_ids), dtype=np.float64) * 1e-9
+
+    country_codes, country_names = pd.factorize(bean_countries.reset_index(drop=True))
+
+    # 원두 × 키워드 지시 행렬
+    keyword_beans = keyword_beans or {}
+    terms = list(keyword_beans)
+    bean_keywords = np.zeros((len(bean_ids), len(terms)), dtype=np.float64)
+    for j, term in enumerate(terms):
+        ids = [bean_id for bean_id in keyword_beans[term] if bean_id in bean_position.index]
+        bean_keywords[bean_position[ids].to_numpy(), j] = 1.0
+
+    return {
+        'bean_ids': bean_ids,
+        'bean_country_codes': country_codes,
+        'country_index': {name: code for code, name in enumerate(country_names)},
+        'flavor_matrix': flavor_matrix,
+        'prior': prior,
+        'propagate': propagate,
+        'flavor_position': flavor_position,
+        'keyword_flavors': keyword_flavors,
+        'flavor_pattern': build_flavor_pattern(keyword_flavors),
+        'term_index': {term: j for j, term in enumerate(terms)},
+        'bean_keywords': bean_keywords,
+    }
+
+
+def query_flavor_vectors(ranker: dict, texts) -> np.ndarray:
+    """질의 텍스트 목록 → (len(texts) × F) 정규화된 향미 벡터 (같은 텍스트는 한 번만 스캔)"""
+    codes, unique_texts = pd.factorize(pd.Series(texts, dtype=object).fillna(''))
+    keyword_flavors, position = ranker['keyword_flavors'], ranker['flavor_position']
+
+    rows, cols = [], []
+    for i, text in enumerate(unique_texts):
+        if not isinstance(text, str) or not text:
+            continue
+        for keyword in find_flavor_keywords(ranker['flavor_pattern'], text.lower()):
+            for flavor_id in keyword_flavors[keyword]:
+                rows.append(i)
+                cols.append(position[flavor_id])
+
+    indicator = np.zeros((len(unique_texts), len(position)), dtype=np.float64)
+    indicator[rows, cols] = 1.0
+    return _l2_normalize(indicator @ ranker['propagate'])[codes]
+
+
+def query_keyword_matrix(ranker: dict, keyword_lists) -> np.ndarray:
+    """질의별 키워드 목록 → (len(keyword_lists) × T) 지시 행렬"""
+    term_index = ranker['term_index']
+    rows, cols = [], []
+    for i, keywords in enumerate(keyword_lists):
+        for keyword in keywords:
+            if keyword in term_index:
+                rows.append(i)
+                cols.append(term_index[keyword])
+
+    indicator = np.zeros((len(keyword_lists), len(term_index)), dtype=np.float64)
+    indicator[rows, cols] = 1.0
+    return indicator
+
+
+def rank_beans(ranker: dict, countries, keyword_lists, texts,
+               k: int = DEFAULT_TOP_K) -> tuple[np.ndarray, np.ndarray]:
+    """
+    질의(국가, 키워드, 텍스트)마다 해당 국가의 후보 원두 중 상위 k개를 찾습니다.
+
+    Returns:
+        (bean_ids, scores): (n × k) 배열. 후보가 k개보다 적으면 bean_id -1, score -inf로 채움
+    """
+    n = len(countries)
+    bean_count = len(ranker['bean_ids'])
+    k = max(1, min(k, bean_count))
+    top_ids = np.full((n, k), -1, dtype=np.int64)
+    top_scores = np.full((n, k), -np.inf, dtype=np.float64)
+    if n == 0 or bean_count == 0:
+        return top_ids, top_scores
+
+    country_index = ranker['country_index']
+    query_codes = np.array([country_index.get(country, -1) for country in countries], dtype=np.int64)
+    keyword_lists = list(keyword_lists)
+    texts = list(texts)
+
+    for start in range(0, n, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, n)
+        query_vectors = query_flavor_vectors(ranker, texts[start:end])
+        query_keywords = query_keyword_matrix(ranker, keyword_lists[start:end])
+
+        scores = query_vectors @ ranker['flavor_matrix'].T
+        scores += KEYWORD_BONUS * ((query_keywords @ ranker['bean_keywords'].T) > 0)
+        scores += ranker['prior']
+        scores[query_codes[start:end, None] != ranker['bean_country_codes'][None, :]] = -np.inf
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_values = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_values, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_values = np.take_along_axis(top_values, order, axis=1)
+
+        valid = np.isfinite(top_values)
+        top_ids[start:end] = np.where(valid, ranker['bean_ids'][top], -1)
+        top_scores[start:end] = top_values
+
+    return top_ids, top_scores
+
+
+def score_components(ranker: dict, bean_ids, keyword_lists, texts) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (질의, 선택된 원두) 쌍마다 점수 구성 요소를 계산합니다. (매핑 신뢰도 계산용)
+
+    Returns:
+        (flavor_similarity, keyword_match): 향미 코사인 유사도(0~1), 키워드 일치 여부(bool)
+    """
+    n = len(bean_ids)
+    similarity = np.zeros(n, dtype=np.float64)
+    keyword_match = np.zeros(n, dtype=bool)
+    bean_position = pd.Series(np.arange(len(ranker['bean_ids'])), index=ranker['bean_ids'])
+    positions = bean_position.reindex(np.asarray(bean_ids, dtype=np.int64)).to_numpy()
+    keyword_lists = list(keyword_lists)
+    texts = list(texts)
+
+    for start in range(0, n, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, n)
+        chunk = positions[start:end]
+        known = ~np.isnan(chunk)
+        rows = chunk[known].astype(np.int64)
+
+        query_vectors = query_flavor_vectors(ranker, texts[start:end])[known]
+        query_keywords = query_keyword_matrix(ranker, keyword_lists[start:end])[known]
+        similarity[start:end][known] = np.einsum('ij,ij->i', query_vectors, ranker['flavor_matrix'][rows])
+        keyword_match[start:end][known] = np.einsum('ij,ij->i', query_keywords, ranker['bean_keywords'][rows]) > 0
+
+    return similarity, keyword_match
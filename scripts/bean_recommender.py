@@ -0,0 +1,258 @@
+"""
+원두 추천 엔진 (bean_scores + user_preferences)
+
+scores_and_preferences.sql에 설계된 추천 규칙을 DB 없이 파이썬 프로세스 안에서 실행합니다.
+
+    - 하드 필터: roast_level ∈ preferred_roast_levels, disliked_tags와 겹치는 원두 제외
+    - Soft Scoring: 감각 속성(acidity, body, sweetness, bitterness)마다 10 - abs(pref - bean)의 합
+      + liked_tags와 겹치는 태그마다 LIKED_TAG_WEIGHT
+    - 동점은 total_score 높은 순, 그다음 bean_id 작은 순
+
+bean_scores_import.csv를 연속된 NumPy 배열로 한 번 읽어 두고,
+    - 선호값(1-10)별 점수 표를 미리 만들어 사용자 점수는 표 조회 + 덧셈으로 계산
+    - 원두 태그는 향미 계층으로 조상까지 확장한 원두×태그 행렬 (liked "fruity"는 블루베리 원두와도 매칭)
+    - liked / disliked 태그 수는 사용자가 고른 태그의 행만 더해서 계산 (희소 사용자×태그 행렬 곱)
+    - 점수와 동점 순위를 정수 키 하나로 묶어 argpartition으로 top-k 선택 (정렬은 k개만)
+recommend_batch()는 수천 명의 사용자를 사용자 묶음(BATCH_CELLS)마다 행렬 연산으로 한 번에 계산합니다.
+
+사용법:
+    python scripts/bean_recommender.py ['{"pref_acidity": 8, "liked_tags": ["fruity"]}']
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from flavor_hierarchy import load_hierarchy
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BEAN_SCORES_PATH = PROJECT_ROOT / 'data' / 'processed' / 'bean_scores_import.csv'
+BEANS_PATH = PROJECT_ROOT / 'data' / 'final' / 'beans.csv'
+
+# Soft Scoring에 쓰는 감각 속성 (user_preferences.pref_*와 같은 순서)
+SENSORY_COLUMNS = ['acidity', 'body', 'sweetness', 'bitterness']
+ROAST_LEVELS = ['LIGHT', 'MEDIUM', 'HEAVY']
+
+# user_preferences 기본값 (DEFAULT 5, 모든 배전도)
+DEFAULT_PREFERENCE = {
+    'pref_acidity': 5,
+    'pref_body': 5,
+    'pref_sweetness': 5,
+    'pref_bitterness': 5,
+    'preferred_roast_levels': ROAST_LEVELS,
+    'liked_tags': [],
+    'disliked_tags': [],
+}
+
+# liked_tags와 겹치는 태그 하나당 가산점
+LIKED_TAG_WEIGHT = 2
+
+# recommend_batch()가 한 번에 계산하는 사용자 × 원두 칸 수 (메모리 상한)
+BATCH_CELLS = 4_000_000
+
+
+def parse_flavor_tags(tags: pd.Series) -> pd.DataFrame:
+    """flavor_tags 문자열 ("[80103, 80401]") → (row, flavor_id) 긴 형식, 없으면 제외"""
+    lists = tags.fillna('').astype(str).str.strip('[]').str.split(',')
+    exploded = lists.explode().str.strip()
+    exploded = exploded[exploded != '']
+    return pd.DataFrame({'row': exploded.index.to_numpy(dtype=np.int64),
+                         'flavor_id': exploded.to_numpy(dtype=np.int64)})
+
+
+class BeanRecommender:
+    """
+    bean_scores 원두 추천 엔진
+
+    Args:
+        scores: bean_scores_import.csv 형식 DataFrame
+        hierarchy: 태그 확장용 FlavorHierarchy (기본: flavor_prod.sql, code 태그도 이 계층의 codes로 조회)
+    """
+
+    def __init__(self, scores: pd.DataFrame, hierarchy=None):
+        scores = scores.reset_index(drop=True)
+        hierarchy = hierarchy or load_hierarchy()
+        n = len(scores)
+
+        self.bean_ids = np.ascontiguousarray(scores['bean_id'].to_numpy(dtype=np.int64))
+        self.sensory = np.ascontiguousarray(scores[SENSORY_COLUMNS].to_numpy(dtype=np.int16))
+        self.total_score = np.ascontiguousarray(scores['total_score'].to_numpy(dtype=np.int64))
+        roast = pd.Categorical(scores['roast_level'], categories=ROAST_LEVELS)
+        self.roast = np.ascontiguousarray(roast.codes.astype(np.int8))  # 목록에 없는 값은 -1
+
+        # 원두 태그 → 조상까지 확장 (계층에 없는 태그는 그대로 유지)
+        notes = parse_flavor_tags(scores['flavor_tags'])
+        rows, flavors = hierarchy.expand_pairs(notes['row'].to_numpy(), notes['flavor_id'].to_numpy())
+        pairs = pd.DataFrame({'row': np.concatenate([notes['row'].to_numpy(), rows]),
+                              'flavor_id': np.concatenate([notes['flavor_id'].to_numpy(), flavors])})
+        pairs = pairs.drop_duplicates()
+        self.tag_ids = pd.Index(np.union1d(hierarchy.ids, pairs['flavor_id'].unique()))
+        self.tags = np.zeros((len(self.tag_ids), n), dtype=np.uint8)  # 태그×원두 (행 단위로 더하기 쉽게)
+        self.tags[self.tag_ids.get_indexer(pairs['flavor_id']), pairs['row'].to_numpy()] = 1
+
+        # 정렬 키 = 점수 * n + 동점 순위 (모든 원두의 키가 달라서 argpartition 결과가 정렬 기준과 일치)
+        # 동점 순위: total_score 높은 순, bean_id 작은 순으로 클수록 앞 (0 .. n-1)
+        max_score = 10 * len(SENSORY_COLUMNS) + LIKED_TAG_WEIGHT * len(self.tag_ids)
+        self.key_dtype = np.int32 if (max_score + 1) * n < np.iinfo(np.int32).max else np.int64
+        self.tiebreak = np.empty(n, dtype=self.key_dtype)
+        self.tiebreak[np.lexsort((-self.bean_ids, self.total_score))] = np.arange(n)
+        # 필터로 제외된 원두의 키: 음수이면서 서로 달라야 argpartition이 중복 값에서 느려지지 않음
+        self.excluded_key = self.tiebreak - n
+
+        # 선호값 v(1-10)별 원두 키 표: key_tables[d][v] = (10 - |v - bean[d]|) * n
+        values = np.arange(11, dtype=np.int64)[:, None]
+        self.key_tables = [np.ascontiguousarray((10 - np.abs(values - self.sensory[:, d])) * n, dtype=self.key_dtype)
+                           for d in range(len(SENSORY_COLUMNS))]
+
+        # 태그(flavor_id 또는 소문자 code) → 열 번호 (code는 hierarchy와 같은 출처, 없으면 flavor_id만)
+        self.tag_positions = {flavor_id: i for i, flavor_id in enumerate(self.tag_ids.tolist())}
+        if hierarchy.codes is not None:
+            for code, flavor_id in zip(hierarchy.codes.tolist(), hierarchy.ids.tolist()):
+                if isinstance(code, str):
+                    self.tag_positions[code.lower()] = self.tag_positions[flavor_id]
+
+    @classmethod
+    def from_csv(cls, path: Path = BEAN_SCORES_PATH, hierarchy=None) -> 'BeanRecommender':
+        return cls(pd.read_csv(path), hierarchy)
+
+    # ------------------------------------------------------------------------
+    # 사용자 취향 → 배열
+    # ------------------------------------------------------------------------
+
+    def tag_columns(self, tags) -> list:
+        """태그 목록 (flavor_id 또는 code, 대소문자 무관) → 태그×원두 행렬의 행 번호 (모르는 태그는 무시)"""
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+        if not isinstance(tags, (list, tuple, set, np.ndarray)):
+            return []
+        positions = (self.tag_positions.get(tag.lower() if isinstance(tag, str) else int(tag)) for tag in tags)
+        return [position for position in positions if position is not None]
+
+    def preference_arrays(self, preferences):
+        """
+        user_preferences 행 목록 (dict 또는 DataFrame) → (선호값 [U, 4], 허용 배전도 [U, 3],
+        liked 태그 [U, 태그], disliked 태그 [U, 태그])
+        """
+        if isinstance(preferences, pd.DataFrame):
+            preferences = preferences.to_dict('records')
+        preferences = [{**DEFAULT_PREFERENCE, **{k: v for k, v in p.items() if v is not None}} for p in preferences]
+        users = len(preferences)
+
+        values = np.array([[p[f'pref_{column}'] for column in SENSORY_COLUMNS] for p in preferences],
+                          dtype=np.int64).reshape(users, len(SENSORY_COLUMNS))
+        values = np.clip(values, 1, 10)
+
+        roasts = np.zeros((users, len(ROAST_LEVELS)), dtype=bool)
+        liked = np.zeros((users, len(self.tag_ids)), dtype=bool)
+        disliked = np.zeros((users, len(self.tag_ids)), dtype=bool)
+        for u, preference in enumerate(preferences):
+            levels = preference['preferred_roast_levels']
+            levels = json.loads(levels) if isinstance(levels, str) else levels
+            roasts[u] = [level in levels for level in ROAST_LEVELS]
+            liked[u, self.tag_columns(preference['liked_tags'])] = True
+            disliked[u, self.tag_columns(preference['disliked_tags'])] = True
+        return values, roasts, liked, disliked
+
+    # ------------------------------------------------------------------------
+    # 추천
+    # ------------------------------------------------------------------------
+
+    def _tag_counts(self, selected):
+        """사용자×태그 선택 [U, 태그] → 사용자별 원두마다 겹치는 태그 수 [U, n] (고른 태그 행만 더함)"""
+        users, rows = np.nonzero(selected)
+        slots = np.arange(len(users)) - np.searchsorted(users, users)  # 사용자 안에서 몇 번째 태그인지
+        counts = np.zeros((len(selected), len(self.bean_ids)), dtype=self.key_dtype)
+        for slot in range(int(slots.max()) + 1 if len(slots) else 0):
+            mask = slots == slot
+            counts[users[mask]] += self.tags[rows[mask]]
+        return counts
+
+    def _top_k(self, values, roasts, liked, disliked, k):
+        """사용자 묶음 하나의 top-k (bean 위치 [U, k], 점수 [U, k], 후보가 모자라면 위치 -1)"""
+        users, n = len(values), len(self.bean_ids)
+        key = np.broadcast_to(self.tiebreak, (users, n)).copy()
+        for d, table in enumerate(self.key_tables):
+            key += table[values[:, d]]
+
+        if liked.any():
+            key += self._tag_counts(liked) * (LIKED_TAG_WEIGHT * n)
+
+        # 하드 필터: 허용하지 않는 배전도 (목록에 없는 배전도 포함), disliked 태그와 겹치는 원두
+        excluded = ~roasts[:, np.maximum(self.roast, 0)] | (self.roast < 0)
+        if disliked.any():
+            excluded |= self._tag_counts(disliked) > 0
+        np.copyto(key, self.excluded_key, where=excluded)
+
+        k = min(k, n)
+        top = np.argpartition(key, n - k, axis=1)[:, n - k:] if k else np.empty((users, 0), dtype=np.int64)
+        top_key = np.take_along_axis(key, top, axis=1)
+        order = np.argsort(-top_key.astype(np.int64), axis=1)
+        top, top_key = np.take_along_axis(top, order, axis=1), np.take_along_axis(top_key, order, axis=1)
+        valid = top_key >= 0
+        return np.where(valid, top, -1), np.where(valid, top_key // n, 0).astype(np.int64)
+
+    def recommend_batch(self, preferences, k=10):
+        """
+        여러 사용자의 top-k를 한 번에 계산합니다.
+
+        Args:
+            preferences: user_preferences 행 목록 (dict 목록 또는 DataFrame, 없는 컬럼은 기본값)
+            k: 사용자별 추천 수
+
+        Returns:
+            (bean_ids [U, k], scores [U, k]): 점수 순, 조건에 맞는 원두가 k개보다 적으면 bean_id -1
+        """
+        values, roasts, liked, disliked = self.preference_arrays(preferences)
+        chunk = max(1, BATCH_CELLS // max(len(self.bean_ids), 1))
+        bean_ids, scores = [], []
+        for start in range(0, len(values), chunk):
+            part = slice(start, start + chunk)
+            positions, score = self._top_k(values[part], roasts[part], liked[part], disliked[part], k)
+            bean_ids.append(np.where(positions >= 0, self.bean_ids[positions], -1))
+            scores.append(score)
+        if not bean_ids:
+            width = min(k, len(self.bean_ids))
+            return np.empty((0, width), dtype=np.int64), np.empty((0, width), dtype=np.int64)
+        return np.vstack(bean_ids), np.vstack(scores)
+
+    def recommend(self, preference: dict, k=10) -> pd.DataFrame:
+        """사용자 한 명의 top-k (bean_id, score, 감각 속성, total_score, roast_level)"""
+        values, roasts, liked, disliked = self.preference_arrays([preference])
+        positions, score = self._top_k(values, roasts, liked, disliked, k)
+        keep = positions[0] >= 0
+        positions = positions[0][keep]
+        result = pd.DataFrame({'bean_id': self.bean_ids[positions], 'score': score[0][keep]})
+        for d, column in enumerate(SENSORY_COLUMNS):
+            result[column] = self.sensory[positions, d]
+        result['total_score'] = self.total_score[positions]
+        result['roast_level'] = [ROAST_LEVELS[code] for code in self.roast[positions]]
+        return result
+
+
+def main():
+    preference = {**DEFAULT_PREFERENCE, **(json.loads(sys.argv[1]) if len(sys.argv) > 1 else {
+        'pref_acidity': 8, 'pref_body': 4, 'pref_sweetness': 7, 'pref_bitterness': 2,
+        'preferred_roast_levels': ['LIGHT', 'MEDIUM'], 'liked_tags': ['fruity', 'floral'],
+        'disliked_tags': ['smoky'],
+    })}
+
+    print("=== 원두 추천 ===\n")
+    recommender = BeanRecommender.from_csv()
+    print(f"원두 {len(recommender.bean_ids)}개, 태그 {len(recommender.tag_ids)}개 (향미 계층 확장)")
+    print(f"취향: {json.dumps(preference, ensure_ascii=False)}\n")
+
+    result = recommender.recommend(preference, k=10)
+    names = pd.read_csv(BEANS_PATH).drop_duplicates('id').set_index('id')['name']
+    result.insert(1, 'name', result['bean_id'].map(names))
+    print(result.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+커버리지 기반 원두 샘플 선택 모듈
+
+SAMPLE_SIZE개의 원두를 무작위로 뽑는 대신, 로컬에서 싸게 추출할 수 있는 특징
+(국가, 가공법, 로스팅, 향미 키워드)의 커버리지가 최대가 되도록 선택합니다.
+같은 LLM 토큰 비용으로 더 다양한 원두 카탈로그를 얻는 것이 목적입니다.
+
+선택 방식:
+    - 각 원두를 특징 집합(facet:value)으로 표현
+    - 이미 많이 선택된 특징일수록 가치가 낮아지는 gain = Σ w_f / (1 + count_f)
+    - gain은 선택할수록 줄어들기만 하므로(submodular) lazy greedy로 선택
+
+사용법:
+    python scripts/bean_sampling.py [csv_path] [budget]
+"""
+
+import heapq
+import json
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+FLAVORS_RAG_PATH = Path(__file__).parent.parent / 'data' / 'debug' / 'flavors_rag.json'
+
+# 가공법 키워드 (Coffee Review 영문 설명 기준)
+PROCESS_KEYWORDS = {
+    'washed': r'washed|wet[- ]processed|fully washed',
+    'natural': r'natural|dry[- ]processed',
+    'honey': r'honey[- ]processed|honey process|pulped natural',
+    'anaerobic': r'anaerobic',
+    'carbonic': r'carbonic',
+    'wet_hulled': r'wet[- ]hulled|giling basah',
+    'fermentation': r'ferment',
+}
+
+# facet별 특징 1개당 가중치
+FACET_WEIGHTS = {
+    'country': 1.0,
+    'process': 1.0,
+    'roast': 1.0,
+    'flavor': 0.5,  # 키워드 수가 많으므로 다른 facet을 압도하지 않도록 낮춤
+}
+
+# 커버리지 곡선을 기록할 예산 지점
+CURVE_BUDGETS = [50, 100, 200, 300, 500, 750, 1000]
+
+
+def load_flavor_keywords(rag_path: Path = FLAVORS_RAG_PATH) -> dict:
+    """flavors_rag.json에서 Level 2/3 향미의 영문 키워드 로드 (flavor_id → keywords)"""
+    with open(rag_path, 'r', encoding='utf-8') as f:
+        flavors = json.load(f)['flavors']
+
+    keywords = {}
+    for flavor in flavors:
+        if flavor['level'] < 2:
+            continue
+        ascii_keywords = [kw for kw in flavor.get('keywords', []) if kw.isascii()]
+        if ascii_keywords:
+            keywords[flavor['id']] = ascii_keywords
+    return keywords
+
+
+def _word_pattern(alternatives) -> str:
+    return r'\b(?:' + '|'.join(alternatives) + r')\b'
+
+
+def extract_features(df: pd.DataFrame, countries, flavor_keywords: dict) -> tuple[np.ndarray, list]:
+    """
+    원두별 특징 지시 행렬을 생성합니다.
+
+    Returns:
+        (features, names): (len(df), F) bool 행렬과 'facet:value' 형식의 특징 이름 목록
+    """
+    origin = df['origin'].fillna('').astype(str)
+    desc = (df['desc_1'].fillna('') + ' ' + df['desc_3'].fillna('')).astype(str)
+    columns = {}
+
+    for country in countries:
+        columns[f'country:{country}'] = origin.str.contains(re.escape(country), case=False, regex=True)
+
+    process_text = df['name'].fillna('').astype(str) + ' ' + desc
+    for process, pattern in PROCESS_KEYWORDS.items():
+        columns[f'process:{process}'] = process_text.str.contains(pattern, case=False, regex=True)
+
+    for roast in df['roast'].dropna().unique():
+        columns[f'roast:{roast}'] = df['roast'] == roast
+
+    for flavor_id, keywords in flavor_keywords.items():
+        pattern = _word_pattern(re.escape(kw) for kw in keywords)
+        columns[f'flavor:{flavor_id}'] = desc.str.contains(pattern, case=False, regex=True)
+
+    names = list(columns.keys())
+    features = np.column_stack([col.to_numpy(dtype=bool) for col in columns.values()]) \
+        if names else np.zeros((len(df), 0), dtype=bool)
+    return features, names
+
+
+def feature_weights(names) -> np.ndarray:
+    """특징 이름의 facet에 따른 가중치 배열"""
+    return np.array([FACET_WEIGHTS.get(name.split(':', 1)[0], 1.0) for name in names])
+
+
+def greedy_coverage_order(features: np.ndarray, weights: np.ndarray, budget: int,
+                          random_state: int = 42) -> np.ndarray:
+    """
+    lazy greedy로 커버리지 gain이 큰 순서대로 budget개 행 위치를 선택합니다.
+
+    gain이 같은 경우 random_state로 섞은 순서를 따릅니다.
+    """
+    n = len(features)
+    budget = min(budget, n)
+    rng = np.random.default_rng(random_state)
+    tie_break = rng.permutation(n)
+
+    counts = np.zeros(features.shape[1])
+    row_features = [np.flatnonzero(row) for row in features]
+
+    def gain(i):
+        f = row_features[i]
+        return float(np.sum(weights[f] / (1.0 + counts[f])))
+
+    # (-gain, tie_break, 행 위치) 최소 힙
+    heap = [(-gain(i), tie_break[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    selected = []
+    while heap and len(selected) < budget:
+        _, tb, i = heapq.heappop(heap)
+        current = gain(i)
+        # 다시 계산한 gain이 여전히 최대면 선택, 아니면 갱신 후 재삽입
+        if heap and -heap[0][0] > current + 1e-12:
+            heapq.heappush(heap, (-current, tb, i))
+            continue
+        selected.append(i)
+        counts[row_features[i]] += 1
+
+    return np.array(selected, dtype=int)
+
+
+def coverage_curve(features: np.ndarray, names, order: np.ndarray, strategy: str,
+                   budgets=CURVE_BUDGETS) -> pd.DataFrame:
+    """선택 순서에 따른 facet별 커버리지(선택된 고유 특징 / 전체 풀의 고유 특징)"""
+    facets = np.array([name.split(':', 1)[0] for name in names])
+    present = features.any(axis=0)
+    rows = []
+
+    for budget in budgets:
+        if budget > len(order):
+            break
+        covered = features[order[:budget]].any(axis=0)
+        for facet in list(FACET_WEIGHTS) + ['all']:
+            mask = present if facet == 'all' else present & (facets == facet)
+            total = int(mask.sum())
+            rows.append({
+                'strategy': strategy,
+                'budget': budget,
+                'facet': facet,
+                'covered': int((covered & mask).sum()),
+                'total': total,
+                'coverage': round(float((covered & mask).sum()) / total, 4) if total else 1.0,
+            })
+
+    return pd.DataFrame(rows)
+
+
+def select_diverse_sample(df: pd.DataFrame, budget: int, countries,
+                          random_state: int = 42) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    커버리지 기반으로 budget개 원두를 선택합니다.
+
+    Returns:
+        (sampled_df, curve_df): 선택된 원두와 coverage vs budget 곡선 (coverage/random 비교)
+    """
+    features, names = extract_features(df, countries, load_flavor_keywords())
+    weights = feature_weights(names)
+
+    order = greedy_coverage_order(features, weights, budget, random_state)
+    random_order = np.random.default_rng(random_state).permutation(len(df))[:len(order)]
+
+    budgets = sorted(set(b for b in CURVE_BUDGETS if b < len(order)) | {len(order)})
+    curve_df = pd.concat([
+        coverage_curve(features, names, order, 'coverage', budgets),
+        coverage_curve(features, names, random_order, 'random', budgets),
+    ], ignore_index=True)
+
+    return df.iloc[order], curve_df
+
+
+def print_curve(curve_df: pd.DataFrame):
+    """coverage vs budget 곡선 요약 출력 (전체 facet 기준)"""
+    pivot = curve_df[curve_df['facet'] == 'all'].pivot(index='budget', columns='strategy', values='coverage')
+    print("    budget | coverage | random")
+    for budget, row in pivot.iterrows():
+        print(f"    {budget:6} | {row.get('coverage', float('nan')):8.3f} | {row.get('random', float('nan')):6.3f}")
+
+
+def main():
+    from importlib import import_module
+    process_beans = import_module('2_process_beans')
+
+    csv_path = Path(sys.argv[1]) if len(sys.argv) > 1 else process_beans.INPUT_FILE
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else process_beans.SAMPLE_SIZE
+
+    df = pd.read_csv(csv_path).dropna(subset=['roast', 'desc_1', 'desc_3'])
+    print(f"[데이터 로드] {csv_path}: {len(df)}개, 예산 {budget}개")
+
+    _, curve_df = select_diverse_sample(df, budget, process_beans.COFFEE_COUNTRIES)
+    print_curve(curve_df)
+
+
+if __name__ == '__main__':
+    main()
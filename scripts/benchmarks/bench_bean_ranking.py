@@ -0,0 +1,90 @@
+"""
+bean_ranking.py 원두 랭킹 벤치마크
+
+질의마다 해당 국가 원두를 하나씩 점수화하는 루프 방식과
+행렬곱 + argpartition 일괄 방식을 1k / 10k / 100k 질의에서 비교합니다.
+(루프 방식은 10k까지만 측정)
+
+사용법:
+    python scripts/benchmarks/bench_bean_ranking.py
+"""
+
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bean_ranking import build_ranker, query_flavor_vectors, query_keyword_matrix, rank_beans, KEYWORD_BONUS
+from country_bean_index import build_country_bean_index, keyword_bean_ids
+
+map_menu_beans = import_module('4_map_menu_beans')
+
+SIZES = [1_000, 10_000, 100_000]
+LOOP_MAX_SIZE = 10_000
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+
+def loop_rank(ranker, countries, keyword_lists, texts):
+    """질의별 루프 구현 (비교 기준, top-1만 반환)"""
+    query_vectors = query_flavor_vectors(ranker, texts)
+    query_keywords = query_keyword_matrix(ranker, keyword_lists)
+    codes = ranker['bean_country_codes']
+    results = []
+    for i, country in enumerate(countries):
+        code = ranker['country_index'].get(country, -1)
+        best_id, best_score = -1, -np.inf
+        for j in range(len(codes)):
+            if codes[j] != code:
+                continue
+            score = float(query_vectors[i] @ ranker['flavor_matrix'][j])
+            score += KEYWORD_BONUS * float(query_keywords[i] @ ranker['bean_keywords'][j] > 0)
+            score += ranker['prior'][j]
+            if score > best_score:
+                best_id, best_score = int(ranker['bean_ids'][j]), score
+        results.append(best_id)
+    return np.array(results)
+
+
+def main():
+    beans = pd.read_csv(DATA_DIR / 'final' / 'beans.csv')
+    flavor_notes = pd.read_csv(DATA_DIR / 'final' / 'bean_flavor_notes.csv')
+    bean_scores = pd.read_csv(DATA_DIR / 'debug' / 'bean_scores.csv')
+    menus = pd.read_csv(DATA_DIR / 'final' / 'menus.csv')
+
+    bean_countries = map_menu_beans.normalize_bean_countries(beans)
+    country_beans = build_country_bean_index(beans, bean_countries, bean_scores, map_menu_beans.DETAIL_TERMS)
+    start = time.perf_counter()
+    ranker = build_ranker(beans, flavor_notes, bean_countries, bean_scores, keyword_bean_ids(country_beans))
+    print(f"[build_ranker] {time.perf_counter() - start:.3f}s ({len(beans)} beans)")
+
+    texts_pool = (menus['name'].fillna('') + ' ' + menus['description'].fillna('')).to_numpy()
+    countries_pool = bean_countries.unique()
+    rng = np.random.default_rng(42)
+
+    for n in SIZES:
+        countries = countries_pool[rng.integers(0, len(countries_pool), size=n)]
+        texts = texts_pool[rng.integers(0, len(texts_pool), size=n)]
+        keyword_lists = [map_menu_beans.extract_keywords_from_text(text) for text in texts]
+
+        start = time.perf_counter()
+        top_ids, _ = rank_beans(ranker, countries, keyword_lists, texts, k=3)
+        batch_time = time.perf_counter() - start
+
+        if n > LOOP_MAX_SIZE:
+            print(f"[N={n:>9,}] batch {batch_time:7.3f}s")
+            continue
+
+        start = time.perf_counter()
+        loop_ids = loop_rank(ranker, countries, keyword_lists, texts)
+        loop_time = time.perf_counter() - start
+        print(f"[N={n:>9,}] loop {loop_time:7.3f}s | batch {batch_time:7.3f}s | "
+              f"x{loop_time / batch_time:.1f} | top-1 동일: {np.array_equal(loop_ids, top_ids[:, 0])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+6_import_bean_scores.py sweetness / bitterness 계산 벤치마크
+
+기존 방식(scores.iterrows() + 원두마다 set 교집합)과
+원두×flavor 지시 행렬 + 컬럼 단위 NumPy 계산 방식을 1k / 100k / 1M 원두에서 비교하고,
+변환 결과(CSV 텍스트)가 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_bean_scores.py
+"""
+
+import io
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+bean_scores = import_module('6_import_bean_scores')
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+# ============================================================================
+# 기존 구현 (비교 기준)
+# ============================================================================
+
+def legacy_calculate_sweetness(bean_id, flavor_ids, roast_level):
+    base = bean_scores.ROAST_SWEETNESS_BASE.get(roast_level, 5)
+    sweet_count = len(flavor_ids & bean_scores.SWEET_FLAVOR_IDS)
+    bonus = min(sweet_count, 4)
+    return min(10, max(1, base + bonus))
+
+
+def legacy_calculate_bitterness(bean_id, flavor_ids, roast_level):
+    base = bean_scores.ROAST_BITTERNESS_BASE.get(roast_level, 5)
+    bitter_count = len(flavor_ids & bean_scores.BITTER_FLAVOR_IDS)
+    bonus = min(bitter_count, 2)
+    return min(10, max(1, base + bonus))
+
+
+def legacy_transform_bean_scores(scores, beans, flavors):
+    roast_map = beans.set_index("id")["roasting_level"].to_dict()
+    flavor_map = flavors.groupby("bean_id")["flavor_id"].apply(set).to_dict()
+
+    results = []
+    for _, row in scores.iterrows():
+        bean_id = row["bean_id"]
+        roast_level = roast_map.get(bean_id, "MEDIUM")
+        flavor_ids = flavor_map.get(bean_id, set())
+        sweetness = legacy_calculate_sweetness(bean_id, flavor_ids, roast_level)
+        bitterness = legacy_calculate_bitterness(bean_id, flavor_ids, roast_level)
+        flavor_tags = list(flavor_ids) if flavor_ids else None
+        results.append({
+            "bean_id": int(bean_id),
+            "acidity": int(round(row["acidity"])),
+            "body": int(round(row["body"])),
+            "sweetness": sweetness,
+            "bitterness": bitterness,
+            "aroma": int(round(row["aroma"])),
+            "flavor": int(round(row["flavor"])),
+            "aftertaste": int(round(row["aftertaste"])),
+            "total_score": int(row["rating"]),
+            "roast_level": roast_level,
+            "flavor_tags": str(flavor_tags) if flavor_tags else None,
+        })
+    return pd.DataFrame(results)
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def scale_inputs(scores, beans, flavors, n):
+    """현재 데이터를 n개 원두가 되도록 복제 (복제본마다 bean_id에 오프셋)"""
+    offset = int(max(scores['bean_id'].max(), beans['id'].max(), flavors['bean_id'].max()))
+    copies = -(-n // len(scores))
+
+    def replicate(frame, column):
+        return pd.concat([frame.assign(**{column: frame[column] + i * offset}) for i in range(copies)],
+                         ignore_index=True)
+
+    scaled_scores = replicate(scores, 'bean_id').head(n)
+    scaled_beans = replicate(beans, 'id')
+    scaled_flavors = replicate(flavors, 'bean_id')
+    return scaled_scores, scaled_beans, scaled_flavors
+
+
+def csv_text(frame):
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    scores = pd.read_csv(bean_scores.INPUT_SCORES)
+    beans = pd.read_csv(bean_scores.INPUT_BEANS)
+    flavors = pd.read_csv(bean_scores.INPUT_FLAVORS)
+
+    for n in SIZES:
+        inputs = scale_inputs(scores, beans, flavors, n)
+        expected, legacy_time = timed(legacy_transform_bean_scores, *inputs)
+        actual, new_time = timed(bean_scores.transform_bean_scores, *inputs)
+        same = csv_text(expected) == csv_text(actual)
+        print(f"[{n:>9,} beans] iterrows {legacy_time:7.2f}s | 지시 행렬 {new_time:6.2f}s "
+              f"({legacy_time / new_time:6.1f}x) | 결과 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+flavor_embeddings.py 검색 벤치마크
+
+brute-force vs IVF 근사 검색의 지연 시간과 recall@k를 비교합니다.
+벡터는 클러스터 구조를 가진 합성 데이터를 사용합니다.
+
+사용법:
+    python scripts/benchmarks/bench_embedding_index.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flavor_embeddings import l2_normalize, train_ivf, search  # noqa: E402
+
+SIZES = [10_000, 100_000]
+DIM = 384
+N_QUERIES = 200
+K = 10
+NPROBES = [4, 8, 16]
+
+
+def make_index(n: int, dim: int, rng) -> tuple[dict, float]:
+    """클러스터가 있는 합성 벡터로 인덱스 구성 (실제 향미 분포처럼 군집된 데이터)"""
+    centers = rng.standard_normal((64, dim)).astype(np.float32)
+    labels = rng.integers(0, len(centers), size=n)
+    vectors = l2_normalize(centers[labels] + 0.8 * rng.standard_normal((n, dim)).astype(np.float32))
+
+    start = time.perf_counter()
+    centroids, assignments = train_ivf(vectors)
+    train_time = time.perf_counter() - start
+
+    index = {
+        "bean_ids": np.arange(1, n + 1),
+        "vectors": vectors,
+        "centroids": centroids,
+        "lists": [np.flatnonzero(assignments == c) for c in range(len(centroids))],
+    }
+    return index, train_time
+
+
+def run(n: int, rng):
+    index, train_time = make_index(n, DIM, rng)
+    queries = index["vectors"][rng.choice(n, N_QUERIES, replace=False)]
+    print(f"\n[N={n:,}, dim={DIM}] IVF 학습 {train_time:.2f}s, 리스트 {len(index['centroids'])}개")
+
+    start = time.perf_counter()
+    exact = [set(b for b, _ in search(index, q, K)) for q in queries]
+    brute_ms = (time.perf_counter() - start) / N_QUERIES * 1000
+    print(f"  brute-force   : {brute_ms:7.3f} ms/query")
+
+    for nprobe in NPROBES:
+        start = time.perf_counter()
+        approx = [set(b for b, _ in search(index, q, K, nprobe=nprobe)) for q in queries]
+        ivf_ms = (time.perf_counter() - start) / N_QUERIES * 1000
+        recall = np.mean([len(a & e) / K for a, e in zip(approx, exact)])
+        print(f"  ivf nprobe={nprobe:<3}: {ivf_ms:7.3f} ms/query, recall@{K}={recall:.3f}")
+
+
+def main():
+    rng = np.random.default_rng(42)
+    for n in SIZES:
+        run(n, rng)
+
+
+if __name__ == "__main__":
+    main()
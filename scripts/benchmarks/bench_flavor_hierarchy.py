@@ -0,0 +1,94 @@
+"""
+향미 계층 closure 벤치마크
+
+bean_flavor_notes를 복제한 10만 / 100만 노트에서
+    - 부모 포인터 방식: flavor마다 parent_id를 따라 올라가는 파이썬 루프 (bean_ranking.ancestor_matrix와 같은 방식)
+    - flavor_hierarchy: 조상 표 / 전위 순회 구간 배열
+로 (원두, flavor) 노트의 조상 확장과 SWEET 하위 여부 판정 시간을 비교하고 결과가 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_flavor_hierarchy.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flavor_hierarchy import load_hierarchy, parse_flavor_sql
+
+SIZES = [100_000, 1_000_000]
+NOTES_PATH = Path(__file__).parent.parent.parent / 'data' / 'final' / 'bean_flavor_notes.csv'
+SWEET = 8
+
+
+# ============================================================================
+# 부모 포인터 방식 (비교 기준)
+# ============================================================================
+
+def parent_walk_pairs(bean_ids, flavor_ids, parents):
+    pairs, seen = [], set()
+    for bean_id, flavor_id in zip(bean_ids.tolist(), flavor_ids.tolist()):
+        current = flavor_id if flavor_id in parents else None
+        while current is not None:
+            if (bean_id, current) not in seen:
+                seen.add((bean_id, current))
+                pairs.append((bean_id, current))
+            current = parents[current]
+    return pairs
+
+
+def parent_walk_is_descendant(flavor_ids, ancestor, parents):
+    result = []
+    for flavor_id in flavor_ids.tolist():
+        current = flavor_id if flavor_id in parents else None
+        while current is not None and current != ancestor:
+            current = parents[current]
+        result.append(current is not None)
+    return np.array(result)
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    flavors = parse_flavor_sql()
+    parents = {flavor_id: (None if parent_id < 0 else parent_id)
+               for flavor_id, parent_id in zip(flavors['id'].tolist(), flavors['parent_id'].tolist())}
+    hierarchy = load_hierarchy()
+    notes = pd.read_csv(NOTES_PATH, encoding='utf-8-sig')
+    offset = int(notes['bean_id'].max())
+
+    for n in SIZES:
+        copies = -(-n // len(notes))
+        scaled = pd.concat([notes.assign(bean_id=notes['bean_id'] + i * offset) for i in range(copies)],
+                           ignore_index=True).head(n)
+        bean_ids, flavor_ids = scaled['bean_id'].to_numpy(), scaled['flavor_id'].to_numpy()
+
+        expected, walk_time = timed(parent_walk_pairs, bean_ids, flavor_ids, parents)
+        (owners, expanded), closure_time = timed(hierarchy.expand_pairs, bean_ids, flavor_ids)
+        same_pairs = sorted(expected) == sorted(zip(owners.tolist(), expanded.tolist()))
+
+        expected_sweet, walk_check_time = timed(parent_walk_is_descendant, flavor_ids, SWEET, parents)
+        sweet, check_time = timed(hierarchy.is_descendant, flavor_ids, SWEET)
+        same_sweet = np.array_equal(expected_sweet, sweet)
+
+        print(f"[{n:>9,} notes] 조상 확장: 부모 포인터 {walk_time:6.2f}s | closure {closure_time:6.3f}s "
+              f"({walk_time / closure_time:5.1f}x) → {len(owners):,}쌍, 동일: {same_pairs}")
+        print(f"{'':17} SWEET 하위 판정: 부모 포인터 {walk_check_time:6.2f}s | 구간 비교 {check_time:6.3f}s "
+              f"({walk_check_time / check_time:5.1f}x), 동일: {same_sweet}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+참조 무결성 검사 벤치마크
+
+data/final의 모든 테이블을 100x / 1000x 복제해서 (복제본마다 id와 외래키 컬럼에 같은 오프셋)
+    - 단순 구현: 부모 키를 파이썬 set으로 만들고 행마다 membership 검사 / 유니크 키는 seen set
+    - integrity_check.check_integrity: 정렬된 정수 배열 + np.isin, 복합 키는 int64로 묶어 중복 검사
+의 시간을 비교하고, 제약마다 위반 행 수가 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_integrity_check.py
+"""
+
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integrity_check import check_integrity, flavor_ids, schema_constraints
+
+generate_sql = import_module('5_generate_sql')
+
+SCALES = [100, 1000]
+
+
+def scale_tables(tables, scale):
+    """모든 테이블을 scale배 복제 (복제본 i는 id / 외래키 컬럼에 i * 부모 테이블 오프셋, flavors는 그대로)"""
+    frames = dict(tables)
+    constraints = schema_constraints()
+    offsets = {table: int(frame['id'].max()) + 1 for table, frame in frames.items() if 'id' in frame.columns}
+
+    scaled = []
+    for table, frame in frames.items():
+        shifted = {'id': table} if 'id' in frame.columns else {}
+        shifted.update({column: parent for column, parent, _ in constraints[table]['foreign_keys']
+                        if column in frame.columns and parent in offsets})
+        copies = [frame.assign(**{column: frame[column] + i * offsets[parent] for column, parent in shifted.items()})
+                  for i in range(scale)]
+        scaled.append((table, pd.concat(copies, ignore_index=True)))
+    return scaled
+
+
+# ============================================================================
+# 단순 구현 (비교 기준)
+# ============================================================================
+
+def naive_check(tables, reference_keys):
+    """제약별 위반 행 수 {(검사, 테이블, 컬럼): 행 수}"""
+    frames = dict(tables)
+    counts = {}
+    for table, frame in frames.items():
+        constraints = schema_constraints()[table]
+        for name, columns in constraints['unique_keys']:
+            if any(column not in frame.columns for column in columns):
+                continue
+            seen, duplicated = set(), 0
+            for key in zip(*[frame[column].tolist() for column in columns]):
+                if key in seen:
+                    duplicated += 1
+                seen.add(key)
+            if duplicated:
+                counts[('unique', table, tuple(columns))] = duplicated
+
+        for column, parent, parent_column in constraints['foreign_keys']:
+            if column not in frame.columns:
+                continue
+            if parent in frames:
+                parent_ids = set(frames[parent][parent_column].dropna().astype('int64').tolist())
+            elif parent in reference_keys:
+                parent_ids = set(reference_keys[parent].tolist())
+            else:
+                continue
+            missing = sum(1 for value in frame[column].tolist() if value == value and int(value) not in parent_ids)
+            if missing:
+                counts[('foreign_key', table, (column,))] = missing
+    return counts
+
+
+def report_counts(report):
+    return {(violation['check'], violation['table'], tuple(violation['columns'])): violation['rows']
+            for violation in report['violations'] if violation['check'] != 'not_null'}
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    tables, _ = generate_sql.prepare_tables()
+    reference_keys = {'flavors': flavor_ids()}
+
+    for scale in SCALES:
+        scaled = scale_tables(tables, scale)
+        rows = sum(len(frame) for _, frame in scaled)
+
+        naive, naive_time = timed(naive_check, scaled, reference_keys)
+        report, fast_time = timed(check_integrity, scaled, reference_keys)
+        same = naive == report_counts(report)
+
+        violations = sum(violation['rows'] for violation in report['violations'])
+        print(f"[x{scale:<4} {rows:>10,} rows] 단순 구현 {naive_time:7.2f}s | "
+              f"check_integrity {fast_time:6.2f}s ({naive_time / fast_time:5.1f}x) | "
+              f"위반 {violations:,}개 행 | 결과 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
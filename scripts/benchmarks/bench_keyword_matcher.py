@@ -0,0 +1,87 @@
+"""
+4_map_menu_beans.py 키워드 추출 벤치마크
+
+기존 방식(호출마다 키워드 목록 재구성 + 키워드별 부분 문자열 검사)과
+trie 정규식 1회 스캔 방식을 1k / 100k / 1M 메뉴에서 비교합니다.
+근사 매칭(origin_matcher.py)을 더한 extract_origin_keywords의 비용과
+영문/약어/오타 변형 메뉴명에서 국가를 찾은 비율도 함께 출력합니다.
+
+사용법:
+    python scripts/benchmarks/bench_keyword_matcher.py
+"""
+
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+map_menu_beans = import_module('4_map_menu_beans')
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+# 정확 매칭으로는 국가를 못 찾는 표기 변형
+VARIANT_NAMES = [
+    'Ethiopia Guji', 'ETH 구지 내추럴', 'Colombia Huila', '코스타 리카 따라주', '에디오피아 예가채프',
+    'Yirgacheffe G1', 'Brasil Cerrado', 'Kenya AA', 'panama geisha', 'Guatemala Antigua',
+]
+MENUS_PATH = Path(__file__).parent.parent.parent / 'data' / 'final' / 'menus.csv'
+
+
+def legacy_extract_keywords_from_text(text):
+    """기존 구현 (비교 기준)"""
+    if not text or pd.isna(text):
+        return []
+
+    text = str(text)
+    found = []
+    all_terms = list(map_menu_beans.BEAN_COUNTRIES) + list(map_menu_beans.COUNTRY_ALIASES.keys())
+    all_terms.extend([
+        "게이샤", "게샤", "파카마라", "부르봉", "핑크", "AA",
+        "피베리", "내추럴", "워시드", "허니", "아네로빅"
+    ])
+    for term in all_terms:
+        if term in text:
+            found.append(term)
+    return found
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    results = [fn(text) for text in texts]
+    return results, time.perf_counter() - start
+
+
+def main():
+    base_names = pd.read_csv(MENUS_PATH)['name'].dropna().to_numpy()
+    rng = np.random.default_rng(42)
+
+    for n in SIZES:
+        texts = base_names[rng.integers(0, len(base_names), size=n)]
+        legacy, legacy_time = timed(legacy_extract_keywords_from_text, texts)
+        compiled, compiled_time = timed(map_menu_beans.extract_keywords_from_text, texts)
+
+        # 차이는 더 긴 키워드에 포함된 짧은 키워드가 빠진 경우뿐이어야 함
+        differing = sum(set(a) != set(b) for a, b in zip(legacy, compiled))
+        countries_equal = all(
+            map_menu_beans.get_country_from_keywords(a) == map_menu_beans.get_country_from_keywords(b)
+            for a, b in zip(legacy, compiled)
+        )
+        _, origin_time = timed(map_menu_beans.extract_origin_keywords, texts)
+        print(f"[N={n:>9,}] legacy {legacy_time:7.3f}s | compiled {compiled_time:7.3f}s | "
+              f"x{legacy_time / compiled_time:.1f} | 키워드 차이 {differing}건, 국가 동일: {countries_equal} | "
+              f"+근사 매칭 {origin_time:7.3f}s")
+
+    exact_found = sum(bool(map_menu_beans.get_country_from_keywords(
+        map_menu_beans.extract_keywords_from_text(name))) for name in VARIANT_NAMES)
+    origin_found = sum(bool(map_menu_beans.get_country_from_keywords(
+        map_menu_beans.extract_origin_keywords(name))) for name in VARIANT_NAMES)
+    print(f"[표기 변형 {len(VARIANT_NAMES)}개] 국가 인식: 정확 매칭 {exact_found}개 → 근사 매칭 포함 {origin_found}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""
+4_map_menu_beans.py 메뉴-원두 매핑 벤치마크
+
+기존 방식(메뉴 행마다 dict 후보 생성 + set 기반 중복 제거)과
+컬럼 단위 파이프라인(키워드 컬럼 → explode → merge → drop_duplicates)을
+현재 데이터의 1x / 10x / 100x 복제본에서 비교하고, 결과 동일성을 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_menu_mapping.py
+"""
+
+import contextlib
+import io
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bean_ranking import build_ranker, rank_beans
+from country_bean_index import build_country_bean_index, keyword_bean_ids
+
+map_menu_beans = import_module('4_map_menu_beans')
+
+SCALES = [1, 10, 100]
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+
+# ============================================================================
+# 기존 구현 (비교 기준)
+# ============================================================================
+
+def legacy_select_bean(country, keywords, country_beans):
+    country_data = country_beans.get(country)
+    if not country_data:
+        return None
+    for kw in keywords:
+        if kw in country_data:
+            return country_data[kw][0]
+    return country_data['default'][0]
+
+
+def legacy_rank(ranker, candidates, country_beans):
+    if not candidates:
+        return
+    top_ids, top_scores = rank_beans(
+        ranker, [c['match_country'] for c in candidates], [c['keywords'] for c in candidates],
+        [c['query_text'] for c in candidates], k=map_menu_beans.TOP_K_CANDIDATES,
+    )
+    for candidate, ids, scores in zip(candidates, top_ids, top_scores):
+        ids = [int(bean_id) for bean_id in ids if bean_id > 0]
+        if ids:
+            candidate['bean_id'] = ids[0]
+            candidate['rank_score'] = round(float(scores[0]), 4)
+        else:
+            candidate['bean_id'] = legacy_select_bean(candidate['match_country'], candidate['keywords'], country_beans)
+            candidate['rank_score'] = None
+            candidate['match_source'] = 'default'
+        candidate['candidate_bean_ids'] = ','.join(map(str, ids))
+
+
+def legacy_query_text(*parts):
+    return ' '.join(str(part) for part in parts if isinstance(part, str) and part)
+
+
+def legacy_create_mappings(stores, menus, beans, flavor_notes, bean_scores):
+    m = map_menu_beans
+    bean_countries = m.normalize_bean_countries(beans)
+    country_beans = build_country_bean_index(beans, bean_countries, bean_scores, m.DETAIL_TERMS)
+    ranker = build_ranker(beans, flavor_notes, bean_countries, bean_scores, keyword_bean_ids(country_beans))
+
+    store_descriptions = dict(zip(stores['id'], stores['description']))
+    store_countries = {}
+    for store_id, desc in store_descriptions.items():
+        countries = [m.normalize_country(kw) for kw in m.extract_origin_keywords(desc)]
+        countries = list(dict.fromkeys(c for c in countries if c))
+        if countries:
+            store_countries[store_id] = countries
+
+    name_candidates = []
+    for position, (_, menu) in enumerate(menus.iterrows()):
+        keywords = m.extract_origin_keywords(menu['name'])
+        origins = [kw for kw in keywords if m.normalize_country(kw)]
+        if any(kw not in m.VARIETY_ALIASES for kw in origins):
+            origins = [kw for kw in origins if kw not in m.VARIETY_ALIASES]
+        countries = list(dict.fromkeys(m.normalize_country(kw) for kw in origins))
+        for order, country in enumerate(countries):
+            name_candidates.append({
+                'position': position, 'menu_id': menu['id'], 'match_source': 'menu_name',
+                'match_country': country, 'keywords': keywords, 'country_order': order,
+                'is_blended': len(countries) > 1, 'store_country_count': 1,
+                'query_text': legacy_query_text(menu['name'], menu['description']),
+            })
+    legacy_rank(ranker, name_candidates, country_beans)
+    name_candidates = [c for c in name_candidates if c['bean_id']]
+    mapped_menus = {c['menu_id'] for c in name_candidates}
+
+    store_candidates = []
+    for position, (_, menu) in enumerate(menus.iterrows()):
+        if menu['id'] in mapped_menus or menu['store_id'] not in store_countries:
+            continue
+        query_text = legacy_query_text(menu['name'], menu['description'], store_descriptions.get(menu['store_id']))
+        countries = store_countries[menu['store_id']]
+        for order, country in enumerate(countries):
+            store_candidates.append({
+                'position': position, 'menu_id': menu['id'], 'match_source': 'store_description',
+                'match_country': country, 'keywords': [], 'country_order': order,
+                'is_blended': False, 'store_country_count': len(countries), 'query_text': query_text,
+            })
+    legacy_rank(ranker, store_candidates, country_beans)
+    store_candidates = [c for c in store_candidates if c['bean_id']]
+
+    mappings = []
+    seen = set()
+    for c in sorted(name_candidates + store_candidates, key=lambda c: (c['position'], c['country_order'])):
+        key = (c['menu_id'], c['bean_id'])
+        if key in seen:
+            continue
+        seen.add(key)
+        mappings.append(c)
+
+    # 신뢰도 점수식은 동일 함수 사용 (비교 대상은 후보 생성/중복 제거 방식)
+    mappings = pd.DataFrame(mappings)
+    mappings['confidence'] = m.mapping_confidence(ranker, mappings)
+    mappings['match_keywords'] = mappings['keywords'].str.join(',')
+    return mappings[['menu_id', 'bean_id', 'is_blended', 'confidence', 'match_source', 'match_country',
+                     'match_keywords', 'rank_score', 'candidate_bean_ids']]
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def scale_data(stores, menus, scale):
+    """가게/메뉴를 scale배 복제 (ID는 복제본마다 오프셋)"""
+    store_offset = int(stores['id'].max())
+    menu_offset = int(menus['id'].max())
+    scaled_stores = pd.concat([stores.assign(id=stores['id'] + i * store_offset) for i in range(scale)],
+                              ignore_index=True)
+    scaled_menus = pd.concat([menus.assign(id=menus['id'] + i * menu_offset,
+                                           store_id=menus['store_id'] + i * store_offset)
+                              for i in range(scale)], ignore_index=True)
+    return scaled_stores, scaled_menus
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    stores = pd.read_csv(DATA_DIR / 'final' / 'stores.csv')
+    menus = pd.read_csv(DATA_DIR / 'final' / 'menus.csv')
+    beans = pd.read_csv(DATA_DIR / 'final' / 'beans.csv')
+    flavor_notes = pd.read_csv(DATA_DIR / 'final' / 'bean_flavor_notes.csv')
+    bean_scores = pd.read_csv(DATA_DIR / 'debug' / 'bean_scores.csv')
+
+    for scale in SCALES:
+        scaled_stores, scaled_menus = scale_data(stores, menus, scale)
+        legacy, legacy_time = timed(legacy_create_mappings, scaled_stores, scaled_menus,
+                                    beans, flavor_notes, bean_scores)
+        (columnar, _), columnar_time = timed(map_menu_beans.create_menu_bean_mappings, scaled_stores,
+                                             scaled_menus, beans, flavor_notes, bean_scores)
+
+        same = legacy.astype(str).reset_index(drop=True).equals(columnar.astype(str).reset_index(drop=True))
+        print(f"[x{scale:<3} {len(scaled_menus):>9,} menus] legacy {legacy_time:7.3f}s | "
+              f"columnar {columnar_time:7.3f}s | x{legacy_time / columnar_time:.1f} | "
+              f"{len(columnar):,} mappings, 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+5_generate_sql.py 테이블별 SQL 파트 병렬 생성 벤치마크
+
+data/final의 모든 테이블을 10x / 100x 복제해서
+    - 기존 방식: 테이블 SQL을 모두 메모리 리스트에 모은 뒤 한 문자열로 결합 (스냅샷 다이제스트 계산 포함)
+    - 파트 방식: 워커 1개 (순차) / 워커 N개 (CPU 수)로 테이블별 파일에 스트리밍 후 manifest 순서로 이어 붙이기
+의 시간과 (순차 실행 기준) 파이썬 힙 최대 사용량을 비교하고, 최종 SQL이 바이트 단위로 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_parallel_sql.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sql_diff import diff_key_columns, diff_table, row_digests
+
+generate_sql = import_module('5_generate_sql')
+
+SCALES = [10, 100]
+WORKERS = os.cpu_count() or 1
+
+# 복제본마다 오프셋을 더해 키가 겹치지 않게 할 컬럼 (차분 키 / 기본키)
+KEY_COLUMNS = {'bean_flavor_notes': 'bean_id', 'menu_bean_mappings': 'menu_id'}
+
+
+def scale_tables(tables, scale):
+    """모든 테이블을 scale배 복제 (키 컬럼에 복제본마다 오프셋)"""
+    scaled = []
+    for table, frame in tables:
+        key = KEY_COLUMNS.get(table, 'id')
+        offset = int(frame[key].max())
+        copies = [frame.assign(**{key: frame[key] + i * offset}) for i in range(scale)]
+        scaled.append((table, pd.concat(copies, ignore_index=True)))
+    return scaled
+
+
+def in_memory_sql(tables):
+    """기존 방식 (비교 기준): 테이블마다 리터럴 + 스냅샷 다이제스트를 만들고, SQL은 리스트에 모아 한 번에 결합"""
+    sql_parts = generate_sql.sql_header_lines("Comeet Data Import SQL")
+    for table, frame in tables:
+        literals = generate_sql.literal_frame(table, frame)
+        diff_source = literals.drop(columns=generate_sql.DIFF_OMIT_COLUMNS.get(table, []))
+        diff_table(row_digests(diff_source, diff_key_columns(table)), list(diff_source.columns))
+        sql_parts.append(generate_sql.build_insert_sql(generate_sql.TABLE_TITLES[table], table,
+                                                       ", ".join(literals.columns), generate_sql.literal_rows(literals)))
+        sql_parts.append("")
+    return "\n".join(sql_parts) + "\n" + generate_sql.sql_footer_text()
+
+
+def parts_sql(tables, parts_dir, workers):
+    """파트 방식: 테이블별 파트 생성 → manifest → 이어 붙이기, 최종 파일 경로 반환"""
+    results = generate_sql.generate_table_parts(tables, parts_dir, workers=workers)
+    header_path = parts_dir / "00_header.sql"
+    generate_sql.write_part(header_path, generate_sql.sql_header_lines("Comeet Data Import SQL"))
+    footer_path = parts_dir / "99_footer.sql"
+    footer_path.write_text(generate_sql.sql_footer_text(), encoding='utf-8')
+
+    files = [header_path.name] + [result['file'] for result in results] + [footer_path.name]
+    manifest_path = parts_dir / "manifest.json"
+    manifest_path.write_text(json.dumps({'parts': [{'file': name} for name in files]}), encoding='utf-8')
+    return generate_sql.stitch_parts(manifest_path, parts_dir / "data_import.sql")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def peak_memory(fn, *args):
+    """fn 실행 중 파이썬 힙 최대 사용량 (MB, 현재 프로세스)"""
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main():
+    tables, _ = generate_sql.prepare_tables()
+    print(f"CPU {WORKERS}개")
+
+    for scale in SCALES:
+        scaled = scale_tables(tables, scale)
+        rows = sum(len(frame) for _, frame in scaled)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            serial_dir, parallel_dir = Path(tmp_dir) / 'serial', Path(tmp_dir) / 'parallel'
+            serial_dir.mkdir()
+            parallel_dir.mkdir()
+
+            expected, memory_time = timed(in_memory_sql, scaled)
+            serial_path, serial_time = timed(parts_sql, scaled, serial_dir, 1)
+            parallel_path, parallel_time = timed(parts_sql, scaled, parallel_dir, WORKERS)
+
+            same = (serial_path.read_bytes() == expected.encode('utf-8')
+                    and parallel_path.read_bytes() == serial_path.read_bytes())
+
+            memory_peak = peak_memory(in_memory_sql, scaled)
+            parts_peak = peak_memory(parts_sql, scaled, serial_dir, 1)
+
+        print(f"[x{scale:<3} {rows:>9,} rows] 메모리 결합 {memory_time:7.2f}s ({memory_peak:7.1f}MB) | "
+              f"파트 순차 {serial_time:7.2f}s ({parts_peak:7.1f}MB) | 파트 워커 {WORKERS}개 {parallel_time:7.2f}s | "
+              f"바이트 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
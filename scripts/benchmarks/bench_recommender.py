@@ -0,0 +1,127 @@
+"""
+원두 추천 엔진 벤치마크
+
+bean_scores_import.csv (1x / 100x 원두)와 무작위 사용자 취향으로
+    - 단순 구현: 사용자마다 DataFrame 필터 + 점수 컬럼 계산 + sort_values (SQL 쿼리를 옮긴 방식)
+    - BeanRecommender.recommend: 한 명씩 호출 (지연 시간 p50 / p99)
+    - BeanRecommender.recommend_batch: 사용자 전체를 한 번에 (초당 사용자 수)
+를 비교하고, 표본 사용자의 top-k (bean_id, 점수)가 단순 구현과 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_recommender.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bean_recommender import (
+    BEAN_SCORES_PATH, LIKED_TAG_WEIGHT, ROAST_LEVELS, SENSORY_COLUMNS, BeanRecommender, parse_flavor_tags,
+)
+from flavor_hierarchy import load_hierarchy, parse_flavor_sql
+
+SCALES = [1, 100]
+USERS = {1: 10_000, 100: 1_000}
+LATENCY_QUERIES = 500
+NAIVE_USERS = 50
+K = 10
+SEED = 42
+
+
+def scale_scores(scores, scale):
+    offset = int(scores['bean_id'].max())
+    return pd.concat([scores.assign(bean_id=scores['bean_id'] + i * offset) for i in range(scale)],
+                     ignore_index=True)
+
+
+def random_preferences(n, rng):
+    """무작위 user_preferences (태그는 flavor code, 일부 사용자만 disliked 태그)"""
+    codes = parse_flavor_sql()['code'].str.lower().tolist()
+    preferences = []
+    for _ in range(n):
+        roasts = [level for level in ROAST_LEVELS if rng.random() < 0.7] or ['MEDIUM']
+        preferences.append({
+            **{f'pref_{column}': int(rng.integers(1, 11)) for column in SENSORY_COLUMNS},
+            'preferred_roast_levels': roasts,
+            'liked_tags': list(rng.choice(codes, size=int(rng.integers(0, 4)), replace=False)),
+            'disliked_tags': list(rng.choice(codes, size=1)) if rng.random() < 0.3 else [],
+        })
+    return preferences
+
+
+# ============================================================================
+# 단순 구현 (비교 기준)
+# ============================================================================
+
+def naive_tag_sets(scores):
+    """원두별 태그 집합 (조상 포함)"""
+    hierarchy = load_hierarchy()
+    notes = parse_flavor_tags(scores['flavor_tags'])
+    tag_sets = [set() for _ in range(len(scores))]
+    for row, flavor_id in zip(notes['row'].tolist(), notes['flavor_id'].tolist()):
+        tag_sets[row].add(flavor_id)
+        tag_sets[row].update(hierarchy.expand_ancestors([flavor_id]).tolist())
+    return tag_sets
+
+
+def naive_recommend(scores, tag_sets, codes, preference, k):
+    liked = {codes.get(tag, tag) for tag in preference['liked_tags']}
+    disliked = {codes.get(tag, tag) for tag in preference['disliked_tags']}
+    frame = scores.assign(tags=tag_sets)
+    frame = frame[frame['roast_level'].isin(preference['preferred_roast_levels'])]
+    frame = frame[[not (tags & disliked) for tags in frame['tags']]]
+    score = sum(10 - (frame[column] - preference[f'pref_{column}']).abs() for column in SENSORY_COLUMNS)
+    score = score + LIKED_TAG_WEIGHT * frame['tags'].map(lambda tags: len(tags & liked))
+    frame = frame.assign(score=score).sort_values(['score', 'total_score', 'bean_id'],
+                                                   ascending=[False, False, True])
+    return frame['bean_id'].head(k).tolist(), frame['score'].head(k).tolist()
+
+
+def main():
+    rng = np.random.default_rng(SEED)
+    base = pd.read_csv(BEAN_SCORES_PATH)
+    codes = dict(zip(parse_flavor_sql()['code'].str.lower(), parse_flavor_sql()['id']))
+
+    for scale in SCALES:
+        scores = scale_scores(base, scale)
+        start = time.perf_counter()
+        recommender = BeanRecommender(scores)
+        build_time = time.perf_counter() - start
+        preferences = random_preferences(USERS[scale], rng)
+
+        # 결과 동일성 + 단순 구현 시간
+        tag_sets = naive_tag_sets(scores)
+        start = time.perf_counter()
+        expected = [naive_recommend(scores, tag_sets, codes, p, K) for p in preferences[:NAIVE_USERS]]
+        naive_time = (time.perf_counter() - start) / NAIVE_USERS
+
+        # 한 명씩 지연 시간
+        latencies = []
+        for preference in preferences[:LATENCY_QUERIES]:
+            start = time.perf_counter()
+            recommender.recommend(preference, K)
+            latencies.append(time.perf_counter() - start)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+
+        # 배치 처리량
+        start = time.perf_counter()
+        bean_ids, batch_scores = recommender.recommend_batch(preferences, K)
+        batch_time = time.perf_counter() - start
+
+        same = all(
+            bean_ids[u][bean_ids[u] >= 0].tolist() == ids and batch_scores[u][bean_ids[u] >= 0].tolist() == points
+            for u, (ids, points) in enumerate(expected)
+        )
+        print(f"[원두 {len(scores):>7,}개] 인덱스 {build_time:5.2f}s | 단순 구현 {naive_time * 1000:8.2f}ms/명 | "
+              f"recommend p50 {p50:6.2f}ms p99 {p99:6.2f}ms | "
+              f"batch {len(preferences):,}명 {batch_time:5.2f}s ({len(preferences) / batch_time:,.0f}명/s) | "
+              f"top-{K} 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Redis 벡터 인덱스 적재 벤치마크 (파이프라인 켬 / 끔)
+
+bean_scores + 임베딩을 1k / 10k 원두로 복제해 bench:bean:{id} Hash로 적재하면서
+    - 파이프라인 끔: HSET 명령마다 왕복 (execute_command)
+    - 파이프라인 켬: PIPELINE_BATCH개씩 묶어 배치당 왕복 1번
+의 초당 적재 수를 비교하고, 적재 후 저장된 Hash 수를 확인합니다. 끝나면 벤치마크 키와 인덱스는 삭제합니다.
+
+대상: 로컬 Redis Stack (REDIS_HOST / REDIS_PORT), 연결할 수 없으면 왕복마다 LOCAL_ROUND_TRIP초를 기다리는 LocalRedis
+(LocalRedis 결과는 왕복 지연을 모의한 수치이며 Redis 측정값이 아님 → 출력에 "모의"로 표시)
+
+사용법:
+    python scripts/benchmarks/bench_redis_export.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from redis_vector_export import (
+    PIPELINE_BATCH, LocalRedis, connect_redis, create_index, delete_keys, hset_commands, load_export_arrays,
+    write_commands,
+)
+
+SIZES = [1_000, 10_000]
+BENCH_PREFIX = 'bench:bean:'
+BENCH_INDEX = 'idx:bench_beans'
+# LocalRedis 모의 왕복 지연 (localhost Redis 왕복 수준)
+LOCAL_ROUND_TRIP = 0.0001
+
+
+def scale_arrays(arrays, n):
+    """원두 배열을 n개가 되도록 복제 (복제본마다 bean_id에 오프셋, 임베딩은 그대로)"""
+    copies = -(-n // len(arrays['bean_ids']))
+    offset = int(arrays['bean_ids'].max())
+    scaled = {name: np.concatenate([values] * copies)[:n] for name, values in arrays.items()}
+    scaled['bean_ids'] = np.concatenate([arrays['bean_ids'] + i * offset for i in range(copies)])[:n]
+    scaled['numeric'] = scaled['numeric'].copy()
+    scaled['numeric'][:, 0] = scaled['bean_ids']
+    return scaled
+
+
+def count_keys(client, keys):
+    return sum(client.execute_command('EXISTS', *keys[begin:begin + PIPELINE_BATCH])
+               for begin in range(0, len(keys), PIPELINE_BATCH))
+
+
+def main():
+    arrays, index = load_export_arrays()
+    try:
+        client = connect_redis()
+        target = 'Redis'
+        simulated = False
+    except Exception as e:
+        print(f"Redis 연결 실패 ({e}) → LocalRedis (왕복 {LOCAL_ROUND_TRIP * 1e6:.0f}µs 모의)\n")
+        client = LocalRedis(round_trip=LOCAL_ROUND_TRIP)
+        target = 'LocalRedis 모의'
+        simulated = True
+
+    create_index(client, index['meta']['dim'], BENCH_INDEX, BENCH_PREFIX)
+    try:
+        for n in SIZES:
+            commands = hset_commands(scale_arrays(arrays, n), BENCH_PREFIX)
+            keys = [command[1] for command in commands]
+            results = {}
+            for batch_size in (1, PIPELINE_BATCH):
+                delete_keys(client, keys)
+                seconds = write_commands(client, commands, batch_size)
+                results[batch_size] = (seconds, count_keys(client, keys))
+            delete_keys(client, keys)
+
+            (off, off_count), (on, on_count) = results[1], results[PIPELINE_BATCH]
+            print(f"[{target} {n:>7,} keys] 파이프라인 끔 {off:6.2f}s ({n / off:>9,.0f} keys/s) | "
+                  f"켬({PIPELINE_BATCH}) {on:6.2f}s ({n / on:>9,.0f} keys/s) | {off / on:5.1f}x | "
+                  f"저장 확인: {off_count == on_count == n}")
+        if simulated:
+            print("\n※ 모의 결과: 프로세스 내 LocalRedis에 왕복 지연만 더한 수치로, Redis 처리량 측정값이 아닙니다.")
+    finally:
+        client.execute_command('FT.DROPINDEX', BENCH_INDEX)
+
+
+if __name__ == '__main__':
+    main()
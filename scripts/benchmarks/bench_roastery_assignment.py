@@ -0,0 +1,121 @@
+"""
+3_preprocess_for_db.py roastery 할당 벤치마크
+
+기존 방식(브랜드별 str.contains + iterrows + apply)과
+벡터화 방식(정규식 1회 추출 + factorize)을 10k / 100k 매장에서 비교하고,
+두 결과가 동일한지 검증합니다.
+
+벡터화 방식은 빈 임시 ID 레지스트리를 사용하므로 Admin Roastery(id=1) 예약만큼
+ID가 1씩 밀린 것 외에는 기존 방식과 같아야 합니다.
+
+사용법:
+    python scripts/benchmarks/bench_roastery_assignment.py
+"""
+
+import sys
+import tempfile
+import time
+from importlib import import_module
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+preprocess = import_module('3_preprocess_for_db')
+
+SIZES = [10_000, 100_000]
+STORES_PATH = Path(__file__).parent.parent.parent / 'data' / 'raw' / 'stores_crawled.csv'
+
+
+# ============================================================================
+# 기존 구현 (비교 기준)
+# ============================================================================
+
+def legacy_extract_brand_from_name(store_name):
+    for brand in preprocess.FRANCHISE_BRANDS:
+        if brand in store_name:
+            return brand
+    return None
+
+
+def legacy_assign(stores_df):
+    roasteries = []
+    brand_to_roastery_id = {}
+    roastery_id = 1
+
+    for brand in preprocess.FRANCHISE_BRANDS:
+        if stores_df['name'].str.contains(brand, na=False).any():
+            roasteries.append({'id': roastery_id, 'name': brand, 'logo_url': '', 'website_url': ''})
+            brand_to_roastery_id[brand] = roastery_id
+            roastery_id += 1
+
+    for _, store in stores_df.iterrows():
+        if legacy_extract_brand_from_name(store['name']) is None:
+            roasteries.append({'id': roastery_id, 'name': store['name'], 'logo_url': '', 'website_url': ''})
+            brand_to_roastery_id[f"store_{store['id']}"] = roastery_id
+            roastery_id += 1
+
+    def get_roastery_id(row):
+        brand = legacy_extract_brand_from_name(row['name'])
+        return brand_to_roastery_id[brand] if brand else brand_to_roastery_id[f"store_{row['id']}"]
+
+    roastery_ids = stores_df.apply(get_roastery_id, axis=1)
+    return pd.DataFrame(roasteries), roastery_ids
+
+
+def vectorized_assign(stores_df):
+    with tempfile.TemporaryDirectory() as registry_dir:
+        stores_df = preprocess.add_roastery_keys(stores_df)
+        roasteries_df, brand_to_roastery_id = preprocess.create_roasteries(
+            stores_df, registry_dir=Path(registry_dir))
+        roastery_ids = stores_df['roastery_key'].map(brand_to_roastery_id)
+
+    # Admin Roastery 행을 빼고 ID를 기존 방식 기준으로 되돌려 비교
+    offset = preprocess.ADMIN_ROASTERY_ID
+    roasteries_df = roasteries_df.iloc[1:].reset_index(drop=True)
+    roasteries_df['id'] -= offset
+    return roasteries_df, roastery_ids - offset
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def make_stores(n: int, base: pd.DataFrame, rng) -> pd.DataFrame:
+    """실제 가게 이름을 재사용해 n개 매장 생성 (독립 카페 이름에는 지점 번호를 붙임)"""
+    names = base['name'].to_numpy()[rng.integers(0, len(base), size=n)]
+    suffix = pd.Series(np.arange(n)).astype(str).to_numpy()
+    return pd.DataFrame({'id': np.arange(1, n + 1), 'name': names + ' ' + suffix})
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    base = pd.read_csv(STORES_PATH)
+    rng = np.random.default_rng(42)
+
+    # 실제 데이터에서 결과 동일성 확인
+    (legacy_r, legacy_ids), _ = timed(legacy_assign, base)
+    (vec_r, vec_ids), _ = timed(vectorized_assign, base)
+    pd.testing.assert_frame_equal(legacy_r, vec_r, check_dtype=False)
+    assert (legacy_ids.to_numpy() == vec_ids.to_numpy()).all()
+    print(f"[실제 데이터 {len(base)}개] 결과 동일 (roasteries {len(vec_r)}개)")
+
+    for n in SIZES:
+        stores = make_stores(n, base, rng)
+        (legacy_r, legacy_ids), legacy_time = timed(legacy_assign, stores)
+        (vec_r, vec_ids), vec_time = timed(vectorized_assign, stores)
+        pd.testing.assert_frame_equal(legacy_r, vec_r, check_dtype=False)
+        assert (legacy_ids.to_numpy() == vec_ids.to_numpy()).all()
+        print(f"[N={n:,}] legacy {legacy_time:7.3f}s | vectorized {vec_time:7.3f}s | "
+              f"x{legacy_time / vec_time:.1f}")
+
+
+if __name__ == '__main__':
+    main()
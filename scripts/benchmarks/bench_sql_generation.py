@@ -0,0 +1,79 @@
+"""
+5_generate_sql.py INSERT 문 생성 벤치마크
+
+기존 방식(iterrows + 셀마다 format_value)과 컬럼 단위 변환(sql_column → str.cat)을
+menus.csv를 복제한 10k / 100k / 1M 행에서 비교하고, 출력이 바이트 단위로 같은지 확인합니다.
+(카테고리 분류 비용을 빼기 위해 classified_category는 미리 채워 둠)
+
+사용법:
+    python scripts/benchmarks/bench_sql_generation.py
+"""
+
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+generate_sql = import_module('5_generate_sql')
+
+SIZES = [10_000, 100_000, 1_000_000]
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+
+def legacy_generate_menus_sql(df):
+    """기존 구현 (비교 기준)"""
+    format_value = generate_sql.format_value
+    values = []
+
+    for _, row in df.iterrows():
+        price = row['price']
+        if pd.isna(price) or price == '' or price == 0:
+            price = 0
+        category = row.get('classified_category') or generate_sql.classify_menu_category(row['name'])
+
+        val = f"({format_value(row['id'], 'int')}, {format_value(row['store_id'], 'int')}, {format_value(row['name'])}, {format_value(row['description'])}, {format_value(price, 'int')}, {format_value(category)}, {format_value(row['image_url'])})"
+        values.append(val)
+
+    return generate_sql.build_insert_sql("Menus", "menus", "id, store_id, name, description, price, category, image_url", values)
+
+
+def columnar_generate_menus_sql(df):
+    """현재 구현 (prepare_menus → 컬럼 단위 리터럴 변환)"""
+    return generate_sql.generate_table_sql("Menus", "menus", generate_sql.prepare_menus(df))
+
+
+def scale_menus(menus, n):
+    """menus를 n행이 되도록 복제 (ID는 복제본마다 오프셋)"""
+    repeats = -(-n // len(menus))
+    offset = int(menus['id'].max())
+    scaled = pd.concat([menus.assign(id=menus['id'] + i * offset) for i in range(repeats)], ignore_index=True)
+    return scaled.head(n)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    menus = pd.read_csv(DATA_DIR / 'final' / 'menus.csv')
+    codes, names = pd.factorize(menus['name'])
+    menus['classified_category'] = pd.Series([generate_sql.classify_menu_category(name) for name in names],
+                                             dtype=object).to_numpy()[codes]
+
+    for n in SIZES:
+        scaled = scale_menus(menus, n)
+        legacy, legacy_time = timed(legacy_generate_menus_sql, scaled)
+        columnar, columnar_time = timed(columnar_generate_menus_sql, scaled)
+        print(f"[N={n:>9,}] iterrows {legacy_time:7.3f}s | columnar {columnar_time:7.3f}s | "
+              f"x{legacy_time / columnar_time:.1f} | {len(columnar.encode('utf-8')) / 1e6:.1f}MB, "
+              f"바이트 동일: {legacy == columnar}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+5_generate_sql.py 가게 카테고리 계산 벤치마크
+
+기존 방식(메뉴마다 CATEGORY_RULES 이중 루프 + 가게마다 전체 메뉴 재필터링)과
+단일 우선순위 정규식 + groupby 최빈값 방식을 1k / 10k / 100k 메뉴에서 비교하고,
+메뉴별 카테고리와 가게별 카테고리(순서 포함)가 같은지 확인합니다.
+
+사용법:
+    python scripts/benchmarks/bench_store_categories.py
+"""
+
+import sys
+import time
+from collections import Counter
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+generate_sql = import_module('5_generate_sql')
+
+SIZES = [1_000, 10_000, 100_000]
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+
+# ============================================================================
+# 기존 구현 (비교 기준)
+# ============================================================================
+
+def legacy_classify_menu_category(menu_name):
+    if pd.isna(menu_name) or menu_name == '':
+        return None
+    menu_name_lower = str(menu_name).lower()
+    for category, keywords in generate_sql.CATEGORY_RULES:
+        for keyword in keywords:
+            if keyword.lower() in menu_name_lower:
+                return category
+    return None
+
+
+def legacy_calculate_store_categories(menus_df):
+    store_categories = {}
+    menus_df['classified_category'] = menus_df['name'].apply(legacy_classify_menu_category)
+    for store_id in menus_df['store_id'].unique():
+        store_menus = menus_df[menus_df['store_id'] == store_id]
+        categories = store_menus['classified_category'].dropna().tolist()
+        if categories:
+            store_categories[store_id] = Counter(categories).most_common(1)[0][0]
+        else:
+            store_categories[store_id] = 'AMERICANO'
+    return store_categories
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def scale_menus(menus, n):
+    """menus를 n행이 되도록 복제 (복제본마다 가게 ID 오프셋)"""
+    repeats = -(-n // len(menus))
+    store_offset = int(menus['store_id'].max())
+    scaled = pd.concat([menus.assign(store_id=menus['store_id'] + i * store_offset) for i in range(repeats)],
+                       ignore_index=True)
+    return scaled.head(n).copy()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    menus = pd.read_csv(DATA_DIR / 'final' / 'menus.csv')
+
+    # 우선순위 매처가 메뉴명 하나하나에서 기존 이중 루프와 같은 카테고리를 내는지
+    names = menus['name'].tolist()
+    same_names = all(generate_sql.classify_menu_category(name) == legacy_classify_menu_category(name)
+                     for name in names)
+    print(f"메뉴명 {len(names)}개 분류 동일: {same_names}")
+
+    for n in SIZES:
+        legacy_menus, new_menus = scale_menus(menus, n), scale_menus(menus, n)
+        legacy, legacy_time = timed(legacy_calculate_store_categories, legacy_menus)
+        grouped, grouped_time = timed(generate_sql.calculate_store_categories, new_menus)
+
+        same = list(legacy.items()) == list(grouped.items()) and \
+            legacy_menus['classified_category'].fillna('').tolist() == new_menus['classified_category'].fillna('').tolist()
+        print(f"[N={n:>9,} menus, {len(grouped):>6,} stores] legacy {legacy_time:7.3f}s | "
+              f"groupby {grouped_time:7.3f}s | x{legacy_time / grouped_time:.1f} | 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
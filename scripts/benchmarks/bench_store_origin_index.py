@@ -0,0 +1,71 @@
+"""
+store_origin_index.py 가게 원산지 인덱스 벤치마크
+
+stores.csv를 1x / 10x / 100x 복제하고 (설명 끝에 가게 번호를 붙여 모두 다른 텍스트로)
+캐시 없음(cold) / 전체 캐시(warm) / 1% 설명 변경 시 로드 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmarks/bench_store_origin_index.py
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from store_origin_index import load_store_origin_index
+
+map_menu_beans = import_module('4_map_menu_beans')
+
+SCALES = [1, 10, 100]
+CHANGED_RATIO = 0.01
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+
+def scale_stores(stores, scale):
+    """가게를 scale배 복제 (ID 오프셋, 설명은 가게마다 다른 텍스트)"""
+    offset = int(stores['id'].max())
+    scaled = pd.concat([stores.assign(id=stores['id'] + i * offset) for i in range(scale)], ignore_index=True)
+    scaled['description'] = scaled['description'].fillna('') + ' #' + scaled['id'].astype(str)
+    return scaled
+
+
+def timed_load(stores, cache_path):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        index_df = load_store_origin_index(stores, map_menu_beans.extract_store_origins,
+                                           map_menu_beans.ALL_TERMS, map_menu_beans.STORE_ORIGIN_RULES,
+                                           cache_path)
+    return index_df, time.perf_counter() - start
+
+
+def main():
+    stores = pd.read_csv(DATA_DIR / 'final' / 'stores.csv')
+
+    for scale in SCALES:
+        scaled = scale_stores(stores, scale)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / 'store_origin_index.json'
+            cold, cold_time = timed_load(scaled, cache_path)
+            warm, warm_time = timed_load(scaled, cache_path)
+
+            changed = scaled.copy()
+            rows = changed.sample(frac=CHANGED_RATIO, random_state=42).index
+            changed.loc[rows, 'description'] += ' 에티오피아 내추럴'
+            _, changed_time = timed_load(changed, cache_path)
+
+        same = cold.drop(columns='description_hash').astype(str).equals(
+            warm.drop(columns='description_hash').astype(str))
+        print(f"[x{scale:<3} {len(scaled):>7,} stores] cold {cold_time:7.3f}s | warm {warm_time:7.3f}s | "
+              f"{CHANGED_RATIO:.0%} 변경 {changed_time:7.3f}s | x{cold_time / warm_time:.1f} | 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+국가 → 키워드 → 원두 ID 인덱스 생성 모듈
+
+4_map_menu_beans.py의 COUNTRY_BEANS는 원두 ID를 직접 적어 두어
+2_process_beans.py를 다시 실행해 beans.csv 번호가 바뀌면 조용히 잘못된 원두를 가리켰습니다.
+이 모듈은 beans.csv에서 같은 구조의 인덱스를 생성합니다.
+
+    {국가: {"default": [원두 ID...], 지역/품종/가공법 키워드: [원두 ID...]}}
+
+    - 각 목록은 bean_scores.csv 평점 내림차순 (같으면 ID 오름차순)
+    - 키워드는 원두 이름/농장/품종/가공법에 포함되면 해당 (영문 표기는 TERM_SYNONYMS)
+
+생성 결과는 data/processed/country_bean_index.json에 캐시하고,
+beans.csv / bean_scores.csv / 키워드 목록이 바뀐 경우에만 다시 생성합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+CACHE_PATH = Path(__file__).parent.parent / 'data' / 'processed' / 'country_bean_index.json'
+
+# 인덱스 구조나 매칭 규칙을 바꾸면 올려서 기존 캐시를 무효화
+INDEX_VERSION = 1
+
+# 한글 키워드 → beans.csv에 함께 쓰이는 다른 표기 (영문 품종/가공법, 음역 변형)
+TERM_SYNONYMS = {
+    '게이샤': ['게샤', 'gesha', 'geisha'],
+    '게샤': ['게이샤', 'gesha', 'geisha'],
+    '파카마라': ['pacamara'],
+    '부르봉': ['버번', '보르본', 'bourbon'],
+    '핑크': ['pink bourbon'],
+    '피베리': ['피이버리', 'peaberry'],
+    '내추럴': ['natural'],
+    '워시드': ['세척', 'washed'],
+    '허니': ['honey'],
+    '아네로빅': ['아나로빅', '무산소', 'anaerobic'],
+    '시다모': ['시다마', 'sidama', 'sidamo'],
+    '시다마': ['시다모', 'sidama', 'sidamo'],
+    '예가체프': ['yirgacheffe'],
+    '구지': ['guji'],
+    '코나': ['kona'],
+}
+
+
+def term_pattern(term: str) -> str:
+    """키워드와 동의어를 소문자 텍스트용 정규식 alternation으로 (영문은 단어 경계)"""
+    alternatives = []
+    for t in [term, *TERM_SYNONYMS.get(term, [])]:
+        escaped = re.escape(t.lower())
+        alternatives.append(rf'\b{escaped}\b' if t.isascii() else escaped)
+    return '|'.join(alternatives)
+
+
+def build_country_bean_index(beans: pd.DataFrame, bean_countries: pd.Series,
+                             bean_scores: pd.DataFrame = None, terms=()) -> dict:
+    """
+    beans.csv로 국가 → 키워드 → 원두 ID 인덱스를 생성합니다.
+
+    Args:
+        beans: beans.csv (id, name, farm, variety, processing_method)
+        bean_countries: beans와 같은 index의 정규화된 국가명
+        bean_scores: bean_scores.csv (bean_id, rating). 없으면 ID 순서
+        terms: 지역/품종/가공법 키워드 목록
+    """
+    ranked = beans[['id']].assign(country=bean_countries.to_numpy())
+    ranked['rating'] = 0.0
+    if bean_scores is not None and len(bean_scores) > 0:
+        ratings = bean_scores.drop_duplicates('bean_id').set_index('bean_id')['rating']
+        ranked['rating'] = ranked['id'].map(ratings).astype(float).fillna(0.0)
+
+    text_columns = [col for col in ['name', 'farm', 'variety', 'processing_method'] if col in beans.columns]
+    bean_text = beans[text_columns].fillna('').astype(str).agg(' '.join, axis=1).str.lower()
+    for term in dict.fromkeys(terms):
+        ranked[term] = bean_text.str.contains(term_pattern(term), regex=True).to_numpy()
+
+    ranked = ranked[ranked['country'] != ''].sort_values(['rating', 'id'], ascending=[False, True], kind='stable')
+
+    index = {}
+    for country, group in ranked.groupby('country', sort=True):
+        entry = {'default': group['id'].astype(int).tolist()}
+        for term in dict.fromkeys(terms):
+            ids = group.loc[group[term], 'id'].astype(int).tolist()
+            if ids:
+                entry[term] = ids
+        index[country] = entry
+    return index
+
+
+def source_signature(paths, terms) -> str:
+    """원본 파일 내용 + 키워드 목록 + INDEX_VERSION의 sha256"""
+    digest = hashlib.sha256(f'v{INDEX_VERSION}'.encode('utf-8'))
+    digest.update(json.dumps([list(dict.fromkeys(terms)), TERM_SYNONYMS], ensure_ascii=False).encode('utf-8'))
+    for path in paths:
+        path = Path(path)
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes() if path.exists() else b'<missing>')
+    return digest.hexdigest()
+
+
+def load_country_bean_index(beans_path: Path, scores_path: Path, normalize_countries, terms,
+                            cache_path: Path = CACHE_PATH) -> dict:
+    """
+    캐시된 인덱스를 로드하고, 원본이 바뀌었으면 다시 생성해 저장합니다.
+
+    Args:
+        normalize_countries: beans DataFrame → 정규화된 국가명 Series 함수
+    """
+    signature = source_signature([beans_path, scores_path], terms)
+
+    if cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('signature') == signature:
+            print(f"  - 국가별 원두 인덱스 캐시 사용: {cache_path}")
+            return cached['index']
+
+    beans = pd.read_csv(beans_path)
+    bean_scores = pd.read_csv(scores_path) if scores_path.exists() else None
+    index = build_country_bean_index(beans, normalize_countries(beans), bean_scores, terms)
+
+    # 임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 캐시 보존)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'signature': signature, 'index': index}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+    print(f"  - 국가별 원두 인덱스 생성: {len(index)}개 국가 → {cache_path}")
+    return index
+
+
+def keyword_bean_ids(index: dict) -> dict:
+    """국가 구분 없이 키워드 → 원두 ID 집합 (랭킹 가산점 계산용)"""
+    keyword_beans = {}
+    for entry in index.values():
+        for term, ids in entry.items():
+            if term != 'default':
+                keyword_beans.setdefault(term, set()).update(ids)
+    return keyword_beans
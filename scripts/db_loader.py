@@ -0,0 +1,252 @@
+"""
+DB 직접 적재 모듈
+
+sql/data_import.sql을 mysql CLI로 흘려 넣는 대신, 5_generate_sql.py가 준비한 테이블 데이터를
+DB-API 커넥션 풀로 바로 적재합니다.
+
+    - 외래키 의존성 단계(LOAD_LEVELS) 순서로 적재 (참조 데이터가 온전하면 외래키 검사를 켠 채로 적재 가능)
+    - 같은 단계의 테이블(stores / beans 등)은 풀의 커넥션으로 동시에 적재
+    - 테이블마다 LOAD_BATCH_ROWS 행씩 executemany + 배치마다 COMMIT
+    - 테이블별 행 수 / 소요 시간 / rows/s 반환
+
+MySQL은 pymysql, MySQL 없이 적재 경로를 확인할 때는 sqlite3 호환 모드(sqlite_schema)를 사용합니다.
+"""
+
+import queue
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from pandas.api.types import is_integer_dtype
+
+from load_data_export import EXACT_INT_LIMIT, null_mask
+
+try:
+    import pymysql
+    HAS_PYMYSQL = True
+except ImportError:
+    HAS_PYMYSQL = False
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+# 외래키 의존성 단계 (단계 안의 테이블은 서로 참조하지 않으므로 동시에 적재)
+LOAD_LEVELS = [
+    ['roasteries'],
+    ['stores', 'beans'],
+    ['menus'],
+    ['bean_flavor_notes', 'menu_bean_mappings'],
+]
+
+# executemany 한 번(= 트랜잭션 하나)에 보낼 행 수
+LOAD_BATCH_ROWS = 5000
+
+# 커넥션 수 (한 단계의 최대 동시 적재 테이블 수)
+POOL_SIZE = max(len(level) for level in LOAD_LEVELS)
+
+# DB-API paramstyle → 자리표시자
+PLACEHOLDERS = {'qmark': '?', 'format': '%s', 'pyformat': '%s'}
+
+
+# ============================================================================
+# 커넥션 풀
+# ============================================================================
+
+class ConnectionPool:
+    """
+    고정 크기 DB-API 커넥션 풀
+
+    Args:
+        connect: 인자 없이 새 커넥션을 반환하는 함수
+        size: 커넥션 수
+        paramstyle: 드라이버 모듈의 paramstyle ('qmark', 'format', 'pyformat')
+    """
+
+    def __init__(self, connect, size=POOL_SIZE, paramstyle='format'):
+        self.size = size
+        self.placeholder = PLACEHOLDERS[paramstyle]
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(connect())
+
+    @contextmanager
+    def connection(self):
+        """풀에서 커넥션을 빌려 쓰고 반납 (예외 시 롤백)"""
+        conn = self._idle.get()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get().close()
+
+
+def mysql_pool(host, port, user, password, database, size=POOL_SIZE, foreign_key_checks=True):
+    """pymysql 커넥션 풀 (utf8mb4, autocommit 끔, 세션 FOREIGN_KEY_CHECKS 설정)"""
+    if not HAS_PYMYSQL:
+        raise ImportError("pymysql 패키지가 설치되지 않았습니다. pip install pymysql")
+
+    def connect():
+        return pymysql.connect(host=host, port=port, user=user, password=password, database=database,
+                               charset='utf8mb4', autocommit=False,
+                               init_command=f"SET FOREIGN_KEY_CHECKS = {int(foreign_key_checks)}")
+    return ConnectionPool(connect, size, pymysql.paramstyle)
+
+
+def sqlite_pool(path, size=POOL_SIZE, foreign_key_checks=True):
+    """sqlite3 커넥션 풀 (다른 스레드의 쓰기 잠금은 timeout까지 대기)"""
+    def connect():
+        conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if foreign_key_checks else 'OFF'}")
+        return conn
+    return ConnectionPool(connect, size, sqlite3.paramstyle)
+
+
+# ============================================================================
+# SQLite 호환 모드
+# ============================================================================
+
+_COMMENT = re.compile(r"\s+COMMENT\s+'(?:[^']|'')*'")
+_INDEX_KEY = re.compile(r'^\s*KEY (\w+) (\([^)]*\)),?\n', re.M)
+_TABLE_BODY = re.compile(r'CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);', re.S)
+
+
+def sqlite_schema(schema_path: Path) -> str:
+    """
+    schema.sql(MySQL)을 SQLite에서 실행할 수 있는 DDL로 변환합니다.
+
+    COMMENT / ON UPDATE를 제거하고, AUTO_INCREMENT 기본키는 INTEGER PRIMARY KEY로, UNIQUE KEY는 테이블 제약으로,
+    일반 KEY는 CREATE INDEX 문으로 바꿉니다.
+    """
+    text = Path(schema_path).read_text(encoding='utf-8')
+    text = _COMMENT.sub('', text)
+    text = text.replace(' ON UPDATE CURRENT_TIMESTAMP', '')
+    # SQLite는 INTEGER PRIMARY KEY만 rowid 별칭(자동 증가)
+    text = text.replace('BIGINT AUTO_INCREMENT PRIMARY KEY', 'INTEGER PRIMARY KEY')
+    text = re.sub(r'UNIQUE KEY (\w+) \(', r'CONSTRAINT \1 UNIQUE (', text)
+
+    indexes = []
+
+    def move_indexes(match):
+        table, body = match.groups()
+        for name, columns in _INDEX_KEY.findall(body + '\n'):
+            indexes.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} {columns};")
+        body = _INDEX_KEY.sub('', body + '\n').rstrip().rstrip(',')
+        return f"CREATE TABLE IF NOT EXISTS {table}\n({body}\n);"
+
+    text = _TABLE_BODY.sub(move_indexes, text)
+    return text + '\n' + '\n'.join(indexes) + '\n'
+
+
+# ============================================================================
+# 적재
+# ============================================================================
+
+def db_column(series, column_type='string'):
+    """
+    Series → 드라이버에 넘길 파이썬 값 목록 (format_value와 같은 NULL 판정, NULL은 None)
+
+    int는 int, float는 float, bool은 True/False, 나머지는 str
+    """
+    is_null = null_mask(series)
+    values = series[~is_null]
+
+    if column_type == 'int':
+        if not (is_integer_dtype(values) and (len(values) == 0 or values.abs().max() <= EXACT_INT_LIMIT)):
+            values = values.astype(float).astype('int64')
+        values = values.tolist()
+    elif column_type == 'float':
+        values = values.astype(float).tolist()
+    elif column_type == 'bool':
+        values = values.astype(str).str.lower().isin(['true', '1', 'yes']).tolist()
+    else:
+        values = values.astype(str).tolist()
+
+    params = np.full(len(series), None, dtype=object)
+    params[~is_null.to_numpy()] = values
+    return params.tolist()
+
+
+def table_params(frame, column_types) -> list:
+    """준비된 테이블 데이터 → executemany용 행 튜플 목록"""
+    return list(zip(*[db_column(frame[column], column_types[column]) for column in frame.columns]))
+
+
+def insert_statement(table, columns, placeholder='%s') -> str:
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})"
+
+
+def load_table(pool, table, frame, column_types, batch_rows=LOAD_BATCH_ROWS) -> dict:
+    """테이블 하나를 batch_rows 행씩 executemany로 적재하고 {table, rows, seconds}를 반환"""
+    start = time.perf_counter()
+    rows = table_params(frame, column_types)
+    statement = insert_statement(table, list(frame.columns), pool.placeholder)
+
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        for i in range(0, len(rows), batch_rows):
+            cursor.executemany(statement, rows[i:i + batch_rows])
+            conn.commit()
+        cursor.close()
+    return {'table': table, 'rows': len(rows), 'seconds': time.perf_counter() - start}
+
+
+def load_database(pool, tables, table_column_types, batch_rows=LOAD_BATCH_ROWS) -> list:
+    """
+    테이블들을 LOAD_LEVELS 순서로 적재합니다.
+
+    Args:
+        tables: [(테이블명, 준비된 DataFrame), ...]
+        table_column_types: {테이블: {컬럼: int / float / bool / string}}
+
+    Returns:
+        테이블별 {table, rows, seconds, rows_per_second} 목록 (적재 순서)
+    """
+    frames = dict(tables)
+    unknown = set(frames) - {table for level in LOAD_LEVELS for table in level}
+    if unknown:
+        raise ValueError(f"LOAD_LEVELS에 없는 테이블: {sorted(unknown)}")
+
+    stats = []
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        for level in LOAD_LEVELS:
+            futures = [executor.submit(load_table, pool, table, frames[table], table_column_types[table], batch_rows)
+                       for table in level if table in frames]
+            # 같은 단계가 모두 끝나야 다음 단계(이 테이블들을 참조하는 테이블)로 진행
+            stats.extend(future.result() for future in futures)
+
+    for stat in stats:
+        stat['rows_per_second'] = stat['rows'] / stat['seconds'] if stat['seconds'] > 0 else 0.0
+    return stats
+
+
+def count_rows(pool, tables) -> dict:
+    """적재 후 테이블별 DB 행 수"""
+    counts = {}
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            counts[table] = cursor.fetchone()[0]
+        cursor.close()
+    return counts
+
+
+def fetch_rows(pool, table, columns) -> list:
+    """테이블의 columns를 id 순서로 조회 (검증용)"""
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+        rows = [tuple(row) for row in cursor.fetchall()]
+        cursor.close()
+    return rows
@@ -0,0 +1,326 @@
+"""
+원두 향미 설명 임베딩 인덱스
+
+sql/scores_and_preferences.sql의 Redis flavor_embedding 설계에 들어갈 벡터를 로컬에서 생성하고,
+같은 벡터로 최근접 이웃 검색을 수행합니다. (외부 API 호출 없음, CPU only)
+
+임베딩 backend:
+    - sentence-transformers가 설치되어 있으면 다국어 MiniLM 모델 사용 (384차원)
+    - 없으면 해시 TF-IDF fallback (1536차원, Redis 인덱스 DIM과 동일)
+
+원두 텍스트:
+    - data/bean_descriptions.csv (2_process_beans.py가 저장한 desc_1/desc_3)가 있으면 사용
+    - 없으면 원두 이름/국가/품종/가공법 + bean_flavor_notes의 플레이버 이름/키워드로 구성
+
+출력 (data/processed/embeddings/):
+    - bean_vectors.npy: (N, dim) float32, 메모리 매핑으로 읽음. bean_ids.npy와 행 순서 일치
+    - bean_ids.npy: 행 위치 → bean_id (오름차순)
+    - flavor_vectors.npy / flavor_ids.npy: SCA Flavor Wheel 항목 임베딩
+    - ivf_centroids.npy / ivf_assignments.npy: 근사 검색(IVF)용 클러스터
+    - idf.npy, meta.json: 쿼리 임베딩 재현용 정보
+
+사용법:
+    python scripts/flavor_embeddings.py
+"""
+
+import json
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+BASE_DIR = Path(__file__).parent.parent
+INPUT_BEANS = BASE_DIR / "data" / "final" / "beans.csv"
+INPUT_FLAVORS = BASE_DIR / "data" / "final" / "bean_flavor_notes.csv"
+INPUT_DESCRIPTIONS = BASE_DIR / "data" / "bean_descriptions.csv"  # 2_process_beans.py 출력 위치
+FLAVORS_RAG_PATH = BASE_DIR / "data" / "debug" / "flavors_rag.json"
+OUTPUT_DIR = BASE_DIR / "data" / "processed" / "embeddings"
+
+HASH_DIM = 1536  # Redis FT.CREATE의 DIM 1536과 동일
+SENTENCE_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# IVF 근사 검색 설정
+IVF_ITERATIONS = 10
+DEFAULT_NPROBE = 8
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+# ============================================================================
+# 임베딩 backend
+# ============================================================================
+
+def tokenize(text: str) -> list:
+    """소문자 단어 unigram + bigram"""
+    words = _TOKEN_PATTERN.findall(str(text).lower())
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+
+def hashed_term_counts(texts, dim: int = HASH_DIM) -> np.ndarray:
+    """signed feature hashing으로 (len(texts), dim) 단어 빈도 행렬 생성"""
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for i, text in enumerate(texts):
+        for token in tokenize(text):
+            h = zlib.crc32(token.encode("utf-8"))
+            # 최상위 비트로 부호를 정해 충돌 편향 완화
+            matrix[i, h % dim] += 1.0 if h & 0x80000000 else -1.0
+    return matrix
+
+
+def compute_idf(counts: np.ndarray) -> np.ndarray:
+    """버킷별 smooth idf"""
+    doc_freq = np.count_nonzero(counts, axis=0)
+    return (np.log((1 + len(counts)) / (1 + doc_freq)) + 1).astype(np.float32)
+
+
+def l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+@lru_cache(maxsize=None)
+def load_sentence_model(model_name: str):
+    """모델 이름별 SentenceTransformer (쿼리마다 다시 로드하지 않도록 캐시)"""
+    return SentenceTransformer(model_name, device="cpu")
+
+
+def embed_texts(texts, meta: dict, idf: np.ndarray = None) -> np.ndarray:
+    """meta['backend']에 맞춰 텍스트를 정규화된 float32 벡터로 변환"""
+    if meta["backend"] == "sentence-transformers":
+        return load_sentence_model(meta["model"]).encode(list(texts), normalize_embeddings=True).astype(np.float32)
+
+    counts = hashed_term_counts(texts, meta["dim"])
+    return l2_normalize(counts * idf)
+
+
+def choose_backend() -> dict:
+    if HAS_SENTENCE_TRANSFORMERS:
+        return {"backend": "sentence-transformers", "model": SENTENCE_MODEL, "dim": 384}
+    return {"backend": "hashed-tfidf", "model": None, "dim": HASH_DIM}
+
+
+# ============================================================================
+# 텍스트 구성
+# ============================================================================
+
+def load_flavor_wheel(rag_path: Path = FLAVORS_RAG_PATH) -> pd.DataFrame:
+    """flavors_rag.json → (id, text) DataFrame"""
+    with open(rag_path, "r", encoding="utf-8") as f:
+        flavors = json.load(f)["flavors"]
+
+    return pd.DataFrame([{
+        "id": flavor["id"],
+        "text": " ".join([flavor["code"].replace("_", " "), flavor["name"], *flavor.get("keywords", [])]),
+    } for flavor in flavors]).sort_values("id", ignore_index=True)
+
+
+def build_bean_texts(beans: pd.DataFrame, flavor_notes: pd.DataFrame,
+                     flavor_wheel: pd.DataFrame, descriptions: pd.DataFrame = None) -> pd.Series:
+    """bean_id → 임베딩할 텍스트 (desc_1/desc_3 우선, 없으면 플레이버 노트 기반)"""
+    flavor_text = flavor_wheel.set_index("id")["text"]
+    notes = flavor_notes.assign(text=flavor_notes["flavor_id"].map(flavor_text).fillna(""))
+    notes_text = notes.groupby("bean_id")["text"].agg(" ".join)
+
+    meta_cols = ["name", "country", "variety", "processing_method"]
+    meta_text = beans.set_index("id")[meta_cols].fillna("").astype(str).agg(" ".join, axis=1)
+    texts = meta_text + " " + notes_text.reindex(meta_text.index).fillna("")
+
+    if descriptions is not None and len(descriptions) > 0:
+        desc = descriptions.set_index("bean_id")[["desc_1", "desc_3"]].fillna("").astype(str)
+        desc_text = (desc["desc_1"] + " " + desc["desc_3"]).reindex(texts.index)
+        texts = texts.where(desc_text.isna(), meta_text + " " + desc_text)
+
+    return texts.sort_index()
+
+
+# ============================================================================
+# IVF 근사 검색
+# ============================================================================
+
+def train_ivf(vectors: np.ndarray, n_lists: int = None, seed: int = 42) -> tuple[np.ndarray, np.ndarray]:
+    """
+    spherical k-means로 coarse quantizer 학습
+
+    Returns:
+        (centroids, assignments): (n_lists, dim) 중심 벡터와 각 벡터의 리스트 번호
+    """
+    n = len(vectors)
+    n_lists = n_lists or max(1, int(np.sqrt(n)))
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(n, size=min(n_lists, n), replace=False)].copy()
+
+    for _ in range(IVF_ITERATIONS):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        empty = ~sums.any(axis=1)
+        sums[empty] = centroids[empty]
+        centroids = l2_normalize(sums)
+
+    assignments = np.argmax(vectors @ centroids.T, axis=1)
+    return centroids, assignments
+
+
+# ============================================================================
+# 인덱스 저장 / 로드 / 검색
+# ============================================================================
+
+def save_matrix(path: Path, matrix: np.ndarray):
+    """float32 .npy 파일로 저장 (np.load(mmap_mode='r')로 메모리 매핑 가능)"""
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=matrix.shape)
+    out[:] = matrix
+    out.flush()
+    del out
+
+
+def build_index(bean_texts: pd.Series, flavor_wheel: pd.DataFrame, output_dir: Path = OUTPUT_DIR) -> dict:
+    """원두/플레이버 임베딩과 IVF 인덱스를 생성해 output_dir에 저장"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    meta = choose_backend()
+
+    idf = None
+    if meta["backend"] == "hashed-tfidf":
+        idf = compute_idf(hashed_term_counts(bean_texts.tolist(), meta["dim"]))
+        np.save(output_dir / "idf.npy", idf)
+
+    bean_vectors = embed_texts(bean_texts.tolist(), meta, idf)
+    flavor_vectors = embed_texts(flavor_wheel["text"].tolist(), meta, idf)
+    centroids, assignments = train_ivf(bean_vectors)
+
+    save_matrix(output_dir / "bean_vectors.npy", bean_vectors)
+    save_matrix(output_dir / "flavor_vectors.npy", flavor_vectors)
+    np.save(output_dir / "bean_ids.npy", bean_texts.index.to_numpy(dtype=np.int64))
+    np.save(output_dir / "flavor_ids.npy", flavor_wheel["id"].to_numpy(dtype=np.int64))
+    np.save(output_dir / "ivf_centroids.npy", centroids)
+    np.save(output_dir / "ivf_assignments.npy", assignments.astype(np.int32))
+
+    meta["count"] = len(bean_vectors)
+    with open(output_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    return load_index(output_dir)
+
+
+def load_index(index_dir: Path = OUTPUT_DIR) -> dict:
+    """저장된 인덱스를 메모리 매핑으로 로드"""
+    with open(index_dir / "meta.json", "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    idf_path = index_dir / "idf.npy"
+    assignments = np.load(index_dir / "ivf_assignments.npy")
+    centroids = np.load(index_dir / "ivf_centroids.npy")
+
+    return {
+        "meta": meta,
+        "idf": np.load(idf_path) if idf_path.exists() else None,
+        "bean_ids": np.load(index_dir / "bean_ids.npy"),
+        "vectors": np.load(index_dir / "bean_vectors.npy", mmap_mode="r"),
+        "flavor_ids": np.load(index_dir / "flavor_ids.npy"),
+        "flavor_vectors": np.load(index_dir / "flavor_vectors.npy", mmap_mode="r"),
+        "centroids": centroids,
+        "lists": [np.flatnonzero(assignments == c) for c in range(len(centroids))],
+    }
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 위치를 내림차순으로 반환 (argpartition 후 부분 정렬)"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=int)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def search(index: dict, query: np.ndarray, k: int = 10, nprobe: int = None) -> list:
+    """
+    코사인 유사도 상위 k개 원두 검색
+
+    Args:
+        query: 정규화된 쿼리 벡터
+        nprobe: None이면 brute-force, 정수면 IVF로 가까운 nprobe개 리스트만 탐색
+
+    Returns:
+        [(bean_id, similarity), ...]
+    """
+    vectors = index["vectors"]
+    if nprobe is None:
+        candidates = None
+        scores = np.asarray(vectors @ query)
+    else:
+        probe = _top_k(index["centroids"] @ query, nprobe)
+        candidates = np.concatenate([index["lists"][c] for c in probe])
+        scores = np.asarray(vectors[candidates] @ query)
+
+    top = _top_k(scores, k)
+    positions = top if candidates is None else candidates[top]
+    return [(int(index["bean_ids"][p]), float(scores[t])) for p, t in zip(positions, top)]
+
+
+def embed_query(index: dict, text: str) -> np.ndarray:
+    return embed_texts([text], index["meta"], index["idf"])[0]
+
+
+def search_text(index: dict, text: str, k: int = 10, nprobe: int = None) -> list:
+    """자유 텍스트(예: '블루베리 자스민 floral')로 원두 검색"""
+    return search(index, embed_query(index, text), k, nprobe)
+
+
+def bean_vector(index: dict, bean_id: int) -> np.ndarray:
+    """bean_id의 임베딩 (bean_ids는 오름차순이므로 이진 탐색)"""
+    pos = np.searchsorted(index["bean_ids"], bean_id)
+    if pos >= len(index["bean_ids"]) or index["bean_ids"][pos] != bean_id:
+        raise KeyError(f"bean_id {bean_id} not in index")
+    return np.asarray(index["vectors"][pos])
+
+
+def flavor_vector(index: dict, flavor_id: int) -> np.ndarray:
+    pos = np.searchsorted(index["flavor_ids"], flavor_id)
+    if pos >= len(index["flavor_ids"]) or index["flavor_ids"][pos] != flavor_id:
+        raise KeyError(f"flavor_id {flavor_id} not in index")
+    return np.asarray(index["flavor_vectors"][pos])
+
+
+def main():
+    print("=" * 60)
+    print("향미 임베딩 인덱스 생성")
+    print("=" * 60)
+
+    beans = pd.read_csv(INPUT_BEANS)
+    flavor_notes = pd.read_csv(INPUT_FLAVORS)
+    descriptions = pd.read_csv(INPUT_DESCRIPTIONS) if INPUT_DESCRIPTIONS.exists() else None
+    flavor_wheel = load_flavor_wheel()
+
+    print(f"\n[1/3] 텍스트 구성")
+    print(f"  - beans: {len(beans)}개, flavor wheel: {len(flavor_wheel)}개")
+    print(f"  - desc_1/desc_3: {'사용' if descriptions is not None else '없음 (플레이버 노트 기반 fallback)'}")
+    bean_texts = build_bean_texts(beans, flavor_notes, flavor_wheel, descriptions)
+
+    print(f"\n[2/3] 임베딩 + IVF 인덱스 생성")
+    index = build_index(bean_texts, flavor_wheel)
+    meta = index["meta"]
+    print(f"  - backend: {meta['backend']} ({meta['dim']}차원)")
+    print(f"  - IVF 리스트: {len(index['centroids'])}개")
+    print(f"  - 저장 위치: {OUTPUT_DIR}")
+
+    print(f"\n[3/3] 검색 예시")
+    for query in ["blueberry jasmine floral", "dark chocolate smoky"]:
+        results = search_text(index, query, k=3)
+        print(f"  '{query}' → {results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+향미 계층 (SCA Flavor Wheel) closure 모듈
+
+flavor_prod.sql (또는 flavors_rag.json)의 parent_id 계층을 한 번 읽어서
+조상/자손 관계를 모두 미리 계산해 정수 배열로 들고 있습니다.
+
+    - 위치: flavor_id → 배열 위치 룩업 테이블 (id 최댓값 + 1 크기)
+    - 조상: 위치별 [자기 자신, 부모, 조부모, ...] 고정 폭 표 (빈 칸은 -1)
+    - 자손: 전위 순회 구간 [tin, tout) → 자손 판정은 구간 비교 두 번 (O(1)),
+      한 flavor의 자손 전체는 전위 순서 배열의 연속 구간
+    - closure: (ancestor_id, descendant_id, depth) 쌍 전체 (자기 자신은 depth 0) → flavor_closure 테이블
+
+README의 "자식 선택 시 부모는 자동 포함"은 expand_ancestors / expand_pairs,
+"SWEET 계열 전체" 같은 점수 계산용 집합은 expand_descendants로 만듭니다.
+계층에 없는 flavor_id(예: flavor_prod.sql에 없는 80201)는 어느 flavor의 조상/자손도 아니며 확장 결과에서 빠집니다.
+
+사용법:
+    python scripts/flavor_hierarchy.py    # sql/flavor_closure.sql 생성
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FLAVOR_SQL_PATH = PROJECT_ROOT / 'sql' / 'flavor_prod.sql'
+FLAVORS_RAG_PATH = PROJECT_ROOT / 'data' / 'debug' / 'flavors_rag.json'
+CLOSURE_SQL_PATH = PROJECT_ROOT / 'sql' / 'flavor_closure.sql'
+
+# flavor_prod.sql INSERT 행의 앞부분: (id, 'code', parent_id 또는 NULL, level, ...
+_FLAVOR_ROW = re.compile(r"^\s*(?:VALUES\s*)?\((\d+),\s*'([^']*)',\s*(NULL|\d+),\s*(\d+),", re.M)
+
+
+# ============================================================================
+# 계층 읽기
+# ============================================================================
+
+def parse_flavor_sql(path: Path = FLAVOR_SQL_PATH) -> pd.DataFrame:
+    """flavor_prod.sql → DataFrame (id, code, parent_id, level), 최상위의 parent_id는 -1"""
+    rows = _FLAVOR_ROW.findall(Path(path).read_text(encoding='utf-8'))
+    return pd.DataFrame({
+        'id': np.array([row[0] for row in rows], dtype=np.int64),
+        'code': [row[1] for row in rows],
+        'parent_id': np.array([-1 if row[2] == 'NULL' else row[2] for row in rows], dtype=np.int64),
+        'level': np.array([row[3] for row in rows], dtype=np.int64),
+    })
+
+
+def parse_flavors_rag(path: Path = FLAVORS_RAG_PATH) -> pd.DataFrame:
+    """flavors_rag.json → parse_flavor_sql과 같은 형식의 DataFrame"""
+    with open(path, 'r', encoding='utf-8') as f:
+        flavors = json.load(f)['flavors']
+    return pd.DataFrame({
+        'id': np.array([flavor['id'] for flavor in flavors], dtype=np.int64),
+        'code': [flavor['code'] for flavor in flavors],
+        'parent_id': np.array([flavor.get('parent_id') or -1 for flavor in flavors], dtype=np.int64),
+        'level': np.array([flavor['level'] for flavor in flavors], dtype=np.int64),
+    })
+
+
+class FlavorHierarchy:
+    """
+    향미 계층의 조상/자손 closure (정수 배열)
+
+    Args:
+        ids: flavor_id 배열
+        parent_ids: 같은 순서의 부모 flavor_id 배열 (최상위는 -1)
+        codes: 같은 순서의 code 배열 (선택, 코드 → id 조회용)
+    """
+
+    def __init__(self, ids, parent_ids, codes=None):
+        ids = np.asarray(ids, dtype=np.int64)
+        parent_ids = np.asarray(parent_ids, dtype=np.int64)
+        order = np.argsort(ids, kind='stable')
+        self.ids = ids[order]
+        self.codes = None if codes is None else np.asarray(codes, dtype=object)[order]
+        if len(self.ids) and ((self.ids[1:] == self.ids[:-1]).any() or self.ids[0] < 0):
+            raise ValueError("flavor_id가 중복되었거나 음수입니다")
+
+        # flavor_id → 위치 (없는 id는 -1)
+        self._lookup = np.full(int(self.ids.max(initial=-1)) + 2, -1, dtype=np.int64)
+        self._lookup[self.ids] = np.arange(len(self.ids))
+
+        self.parent = self.positions(parent_ids[order])
+        unknown = (self.parent < 0) & (parent_ids[order] >= 0)
+        if unknown.any():
+            raise ValueError(f"계층에 없는 parent_id: {sorted(set(parent_ids[order][unknown].tolist()))}")
+
+        self.depth = self._depths()
+        self.ancestor_table = self._ancestor_table()
+        self.tin, self.tout, self.preorder = self._preorder()
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'FlavorHierarchy':
+        codes = frame['code'].to_numpy() if 'code' in frame else None
+        return cls(frame['id'].to_numpy(), frame['parent_id'].to_numpy(), codes)
+
+    def _depths(self) -> np.ndarray:
+        """위치별 깊이 (최상위 0), 부모 포인터를 한 단계씩 올라가며 배열 단위로 계산"""
+        depth = np.zeros(len(self.ids), dtype=np.int64)
+        current = self.parent.copy()
+        for _ in range(len(self.ids) + 1):
+            active = current >= 0
+            if not active.any():
+                return depth
+            depth[active] += 1
+            current[active] = self.parent[current[active]]
+        raise ValueError("향미 계층에 순환이 있습니다")
+
+    def _ancestor_table(self) -> np.ndarray:
+        """위치별 [자기 자신, 부모, 조부모, ...] (폭 = 최대 깊이 + 1, 빈 칸은 -1)"""
+        width = int(self.depth.max(initial=0)) + 1
+        table = np.full((len(self.ids), width), -1, dtype=np.int64)
+        table[:, 0] = np.arange(len(self.ids))
+        for level in range(1, width):
+            previous = table[:, level - 1]
+            known = previous >= 0
+            table[known, level] = self.parent[previous[known]]
+        return table
+
+    def _preorder(self):
+        """전위 순회 (자식은 id 순서) → tin, tout (자손 구간 [tin, tout)), 순회 순서의 위치 배열"""
+        children = {}
+        for child in np.lexsort((self.ids, self.parent)).tolist():
+            children.setdefault(int(self.parent[child]), []).append(child)
+
+        tin = np.zeros(len(self.ids), dtype=np.int64)
+        tout = np.zeros(len(self.ids), dtype=np.int64)
+        preorder = []
+        stack = [(root, False) for root in reversed(children.get(-1, []))]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                tout[node] = len(preorder)
+                continue
+            tin[node] = len(preorder)
+            preorder.append(node)
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children.get(node, [])))
+        return tin, tout, np.array(preorder, dtype=np.int64)
+
+    # ------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------
+
+    def positions(self, flavor_ids) -> np.ndarray:
+        """flavor_id 배열 → 위치 배열 (계층에 없는 id는 -1)"""
+        flavor_ids = np.asarray(flavor_ids, dtype=np.int64)
+        inside = (flavor_ids >= 0) & (flavor_ids < len(self._lookup))
+        return np.where(inside, self._lookup[np.where(inside, flavor_ids, -1)], -1)
+
+    def is_descendant(self, descendant_id, ancestor_id):
+        """
+        descendant_id가 ancestor_id 자신이거나 그 하위 flavor인지 (O(1), 배열을 넘기면 원소별)
+
+        예: is_descendant(80104, 8) → True (HONEY는 SWEET 하위)
+        """
+        child, ancestor = self.positions(descendant_id), self.positions(ancestor_id)
+        known = (child >= 0) & (ancestor >= 0)
+        child, ancestor = np.where(known, child, 0), np.where(known, ancestor, 0)
+        result = known & (self.tin[ancestor] <= self.tin[child]) & (self.tin[child] < self.tout[ancestor])
+        return bool(result) if result.ndim == 0 else result
+
+    def expand_ancestors(self, flavor_ids) -> np.ndarray:
+        """flavor_id들 + 그 조상 전체 (정렬된 id 배열, 자식 선택 시 부모 자동 포함)"""
+        found = self.positions(flavor_ids)
+        ancestors = self.ancestor_table[found[found >= 0]].ravel()
+        return self.ids[np.unique(ancestors[ancestors >= 0])]
+
+    def expand_descendants(self, flavor_ids) -> np.ndarray:
+        """flavor_id들 + 그 자손 전체 (정렬된 id 배열)"""
+        found = self.positions(flavor_ids)
+        found = found[found >= 0]
+        # 각 구간 [tin, tout)에 +1 / -1을 찍고 누적합 > 0인 전위 순서 칸이 자손
+        marks = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.add.at(marks, self.tin[found], 1)
+        np.add.at(marks, self.tout[found], -1)
+        covered = np.cumsum(marks[:-1]) > 0
+        return np.sort(self.ids[self.preorder[covered]])
+
+    def expand_pairs(self, owner_ids, flavor_ids):
+        """
+        (소유자, flavor) 쌍 전체를 조상까지 확장합니다. (예: 원두별 노트 → 부모 flavor 포함 노트)
+
+        Returns:
+            (owner_ids, flavor_ids) 배열, 중복 쌍 제거 / 입력 순서 유지 / 계층에 없는 flavor는 제외
+        """
+        owner_ids = np.asarray(owner_ids)
+        found = self.positions(flavor_ids)
+        keep = found >= 0
+        table = self.ancestor_table[found[keep]]
+        owners = np.repeat(owner_ids[keep], table.shape[1])
+        ancestors = table.ravel()
+        valid = ancestors >= 0
+        pairs = pd.DataFrame({'owner': owners[valid], 'flavor': self.ids[ancestors[valid]]}).drop_duplicates()
+        return pairs['owner'].to_numpy(), pairs['flavor'].to_numpy()
+
+    def closure_frame(self) -> pd.DataFrame:
+        """flavor_closure 테이블 행: (ancestor_id, descendant_id, depth), 자기 자신 포함"""
+        descendants = np.repeat(np.arange(len(self.ids)), self.ancestor_table.shape[1])
+        ancestors = self.ancestor_table.ravel()
+        distance = np.tile(np.arange(self.ancestor_table.shape[1]), len(self.ids))
+        valid = ancestors >= 0
+        frame = pd.DataFrame({
+            'ancestor_id': self.ids[ancestors[valid]],
+            'descendant_id': self.ids[descendants[valid]],
+            'depth': distance[valid],
+        })
+        return frame.sort_values(['ancestor_id', 'descendant_id'], ignore_index=True)
+
+
+@lru_cache(maxsize=None)
+def load_hierarchy(path: Path = FLAVOR_SQL_PATH) -> FlavorHierarchy:
+    """flavor_prod.sql(.sql) 또는 flavors_rag.json(.json)에서 계층 로드 (경로별로 한 번만)"""
+    path = Path(path)
+    frame = parse_flavors_rag(path) if path.suffix == '.json' else parse_flavor_sql(path)
+    return FlavorHierarchy.from_frame(frame)
+
+
+# ============================================================================
+# flavor_closure SQL
+# ============================================================================
+
+def closure_sql(hierarchy: FlavorHierarchy) -> str:
+    """flavor_closure 테이블 INSERT 문 (schema.sql의 flavor_closure, flavor_prod.sql 적재 후 실행)"""
+    closure = hierarchy.closure_frame()
+    values = [f"({ancestor}, {descendant}, {depth})"
+              for ancestor, descendant, depth in closure.itertuples(index=False)]
+    lines = [
+        "-- 향미 계층 closure (조상 → 자손, 자기 자신은 depth 0)",
+        "-- Generated by scripts/flavor_hierarchy.py from sql/flavor_prod.sql",
+        "",
+        "INSERT INTO flavor_closure (ancestor_id, descendant_id, depth)",
+        "VALUES " + ",\n       ".join(values) + ";",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    print("=== 향미 계층 closure 생성 ===\n")
+    hierarchy = load_hierarchy()
+    closure = hierarchy.closure_frame()
+
+    levels = pd.Series(hierarchy.depth + 1).value_counts().sort_index()
+    print(f"flavor {len(hierarchy.ids)}개 (레벨별 {levels.to_dict()}), 최대 깊이 {int(hierarchy.depth.max())}")
+    print(f"closure {len(closure)}개 행 (자기 자신 {int((closure['depth'] == 0).sum())}개)")
+
+    rag = load_hierarchy(FLAVORS_RAG_PATH)
+    if not closure.equals(rag.closure_frame()):
+        print("⚠ flavors_rag.json의 계층이 flavor_prod.sql과 다릅니다")
+
+    CLOSURE_SQL_PATH.write_text(closure_sql(hierarchy), encoding='utf-8')
+    print(f"\n✓ SQL 파일 생성 완료: {CLOSURE_SQL_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+프랜차이즈 브랜드 자동 탐지 모듈
+
+FRANCHISE_BRANDS에 없는 체인점은 매장마다 별도 roastery가 되므로,
+가게 이름의 공통 브랜드 접두어를 찾아 검토용 후보로 제안합니다.
+(예: "인텔리젠시아커피 강남", "인텔리젠시아커피 잠실" → "인텔리젠시아커피")
+
+방식:
+    1. 이름 정규화: 소문자, 괄호/특수문자 제거, 지점 토큰(~점) 제거,
+       붙여 쓴 일반 접미어 분리 ("히트커피로스터스" → "히트커피 로스터스")
+    2. 토큰 단위 prefix trie 구성 (노드마다 통과하는 매장 ID 집합)
+    3. 일반 단어(카페, 커피 등)로만 된 접두어는 건너뛰고,
+       MIN_STORES개 이상 매장이 공유하는 가장 긴 단일 경로를 브랜드 후보로 선택
+
+결과는 자동 적용하지 않고 franchise_candidates.csv로 저장합니다.
+approved 컬럼을 True로 바꾸면 다음 3_preprocess_for_db.py 실행부터 반영됩니다.
+"""
+
+import re
+from pathlib import Path
+
+import pandas as pd
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+MIN_STORES = 2          # 브랜드로 제안할 최소 매장 수
+MIN_BRAND_LENGTH = 2    # 너무 짧은 공통 접두어는 토큰 기반 이름 사용
+
+# 단독으로는 브랜드가 될 수 없는 일반 단어
+GENERIC_TOKENS = {
+    '카페', '커피', '로스터리', '로스터스', '로스터즈', '로스터리카페', '스페셜티',
+    '커피랩', '랩', '바', '하우스', '스튜디오', '베이커리',
+    'cafe', 'coffee', 'roasters', 'roastery', 'specialty', 'lab', 'bar',
+}
+
+# 토큰 끝에 붙여 쓴 경우 분리할 일반 접미어 (긴 것부터 검사)
+GENERIC_SUFFIXES = sorted(['로스터스', '로스터즈', '로스터리', '커피랩', '커피'], key=len, reverse=True)
+
+_PAREN_PATTERN = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+_BRANCH_PATTERN = re.compile(r'\w+점$')
+
+
+def normalize_tokens(name: str) -> tuple:
+    """가게 이름을 브랜드 비교용 토큰 튜플로 변환"""
+    if not isinstance(name, str):
+        return ()
+
+    text = _PAREN_PATTERN.sub(' ', name.lower())
+    tokens = _NON_WORD_PATTERN.sub(' ', text).split()
+
+    # 첫 토큰 이후의 지점명 제거 (예: "테라로사 구의역점" → "테라로사")
+    tokens = tokens[:1] + [t for t in tokens[1:] if not _BRANCH_PATTERN.fullmatch(t)]
+
+    split_tokens = []
+    for token in tokens:
+        suffixes = []
+        # "히트커피로스터스" → "히트" + "커피" + "로스터스"
+        while True:
+            suffix = next((sfx for sfx in GENERIC_SUFFIXES
+                           if token.endswith(sfx) and len(token) > len(sfx)), None)
+            if suffix is None:
+                break
+            suffixes.insert(0, suffix)
+            token = token[:-len(suffix)]
+        split_tokens.extend([token] + suffixes)
+    return tuple(split_tokens)
+
+
+def build_trie(token_lists, store_ids) -> dict:
+    """토큰 prefix trie 생성. 노드: {'stores': set, 'children': {token: node}}"""
+    root = {'stores': set(), 'children': {}}
+    for tokens, store_id in zip(token_lists, store_ids):
+        node = root
+        node['stores'].add(store_id)
+        for token in tokens:
+            node = node['children'].setdefault(token, {'stores': set(), 'children': {}})
+            node['stores'].add(store_id)
+    return root
+
+
+def _is_generic(prefix) -> bool:
+    return all(token in GENERIC_TOKENS for token in prefix)
+
+
+def _collect(node: dict, prefix: tuple, found: list):
+    for token, child in node['children'].items():
+        child_prefix = prefix + (token,)
+        if len(child['stores']) < MIN_STORES:
+            continue
+        if _is_generic(child_prefix):
+            _collect(child, child_prefix, found)
+            continue
+
+        # 모든 매장이 같은 다음 토큰을 공유하는 동안 경로 확장
+        while True:
+            full = [(t, c) for t, c in child['children'].items() if c['stores'] == child['stores']]
+            if len(full) != 1:
+                break
+            token, child = full[0]
+            child_prefix = child_prefix + (token,)
+
+        found.append((child_prefix, child['stores']))
+
+
+def _common_prefix(names) -> str:
+    """원본 이름의 공통 접두어 (FRANCHISE_BRANDS 부분 문자열 매칭에 바로 쓸 수 있는 형태)"""
+    first, last = min(names), max(names)
+    length = 0
+    while length < min(len(first), len(last)) and first[length] == last[length]:
+        length += 1
+    return first[:length].strip()
+
+
+def discover_franchises(stores_df: pd.DataFrame, known_brands=()) -> pd.DataFrame:
+    """
+    공통 브랜드 접두어를 가진 매장 그룹을 찾습니다.
+
+    Returns:
+        brand, store_count, matched_stores, store_ids, example_names, in_franchise_list 컬럼의 DataFrame
+        (matched_stores: brand 문자열이 이름에 포함된 매장 수, 대소문자 무시)
+    """
+    token_lists = [normalize_tokens(name) for name in stores_df['name']]
+    trie = build_trie(token_lists, stores_df['id'])
+
+    found = []
+    _collect(trie, (), found)
+
+    names_by_id = dict(zip(stores_df['id'], stores_df['name']))
+    rows = []
+    for prefix, store_set in found:
+        store_ids = sorted(store_set)
+        names = [names_by_id[i] for i in store_ids]
+        brand = _common_prefix(names)
+        if len(brand) < MIN_BRAND_LENGTH:
+            brand = ' '.join(prefix)
+
+        rows.append({
+            'brand': brand,
+            'store_count': len(store_ids),
+            'matched_stores': sum(brand.casefold() in name.casefold() for name in names),
+            'store_ids': ' '.join(map(str, store_ids)),
+            'example_names': ' | '.join(names[:5]),
+            # 후보 brand는 소문자일 수 있으므로 양쪽 모두 casefold해서 비교
+            'in_franchise_list': any(known.casefold() in brand.casefold() or brand.casefold() in known.casefold()
+                                     for known in known_brands),
+        })
+
+    columns = ['brand', 'store_count', 'matched_stores', 'store_ids', 'example_names', 'in_franchise_list']
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(rows, columns=columns).sort_values(
+        ['in_franchise_list', 'store_count', 'brand'], ascending=[True, False, True], ignore_index=True
+    )
+
+
+def load_approved_brands(review_path: Path) -> list:
+    """검토 파일에서 approved=True인 브랜드 목록 로드"""
+    if not review_path.exists():
+        return []
+    reviewed = pd.read_csv(review_path)
+    if 'approved' not in reviewed.columns:
+        return []
+    approved = reviewed['approved'].astype(str).str.lower().isin(['true', '1', 'yes'])
+    return reviewed.loc[approved, 'brand'].astype(str).tolist()
+
+
+def save_candidates(candidates: pd.DataFrame, review_path: Path):
+    """후보를 검토 파일로 저장 (기존 approved 브랜드는 이번에 탐지되지 않아도 유지)"""
+    candidates = candidates.copy()
+    if review_path.exists():
+        reviewed = pd.read_csv(review_path)
+        approved = set(load_approved_brands(review_path))
+        kept = reviewed[reviewed['brand'].isin(approved) & ~reviewed['brand'].isin(candidates['brand'])]
+        candidates['approved'] = candidates['brand'].isin(approved)
+        candidates = pd.concat([candidates, kept.assign(approved=True)], ignore_index=True)
+    else:
+        candidates['approved'] = False
+    candidates.to_csv(review_path, index=False, encoding='utf-8-sig')
@@ -0,0 +1,154 @@
+"""
+파이프라인 재실행 간 ID를 고정하는 영구 ID 레지스트리
+
+크롤링/전처리를 다시 실행해도 기존 stores/menus/roasteries의 ID가 바뀌지 않도록,
+자연 키(natural key) → ID 매핑을 data/registry/{name}.csv에 저장합니다.
+기존 키는 같은 ID를 유지하고, 새 키만 현재 최대 ID 다음 번호를 받습니다.
+
+자연 키:
+    - stores: 정규화된 가게 이름 + 주소
+    - menus: 가게 자연 키 + 정규화된 메뉴 이름
+    - roasteries: 프랜차이즈 브랜드명 또는 독립 카페의 store_{id}
+
+같은 실행 안에서 자연 키가 겹치면 안정적인 속성(가게 전화번호/설명, 메뉴 설명/가격)의 해시로 구분하므로
+크롤링 순서가 바뀌어도 ID가 서로 바뀌지 않습니다.
+
+레지스트리가 없으면 이전 실행 결과 CSV로 시드하여 현재 DB의 ID를 그대로 이어받습니다.
+"""
+
+import os
+import re
+import unicodedata
+import zlib
+from pathlib import Path
+
+import pandas as pd
+
+REGISTRY_DIR = Path(__file__).parent.parent / 'data' / 'registry'
+
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+
+
+def normalize_key(*parts) -> str:
+    """NFKC 정규화, 소문자, 특수문자/공백 정리 후 '|'로 결합"""
+    normalized = []
+    for part in parts:
+        text = '' if part is None or pd.isna(part) else str(part)
+        text = unicodedata.normalize('NFKC', text).lower()
+        normalized.append(' '.join(_NON_WORD_PATTERN.sub(' ', text).split()))
+    return '|'.join(normalized)
+
+
+def normalize_keys(*columns: pd.Series) -> pd.Series:
+    """normalize_key의 Series 버전 (컬럼별 벡터화 정규화 후 '|'로 결합)"""
+    normalized = [
+        column.astype('string').fillna('')
+        .str.normalize('NFKC').str.lower()
+        .str.replace(_NON_WORD_PATTERN, ' ', regex=True).str.strip()
+        .str.replace(r'\s+', ' ', regex=True)
+        for column in columns
+    ]
+    keys = normalized[0]
+    for column in normalized[1:]:
+        keys = keys + '|' + column
+    return keys.astype(object)
+
+
+def _registry_path(name: str, registry_dir: Path) -> Path:
+    return registry_dir / f'{name}.csv'
+
+
+def registry_exists(name: str, registry_dir: Path = REGISTRY_DIR) -> bool:
+    return _registry_path(name, registry_dir).exists()
+
+
+def load_registry(name: str, registry_dir: Path = REGISTRY_DIR) -> pd.Series:
+    """레지스트리 로드 (index: key, values: id)"""
+    path = _registry_path(name, registry_dir)
+    if not path.exists():
+        return pd.Series(dtype='int64', name='id')
+    registry = pd.read_csv(path, dtype={'key': str, 'id': 'int64'}, keep_default_na=False)
+    return registry.set_index('key')['id']
+
+
+def save_registry(name: str, registry: pd.Series, registry_dir: Path = REGISTRY_DIR):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 레지스트리 보존)"""
+    registry_dir.mkdir(parents=True, exist_ok=True)
+    path = _registry_path(name, registry_dir)
+    tmp_path = path.with_suffix('.csv.tmp')
+    registry.rename_axis('key').rename('id').sort_values().to_csv(tmp_path, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def seed_registry(name: str, keys: pd.Series, ids: pd.Series, registry_dir: Path = REGISTRY_DIR,
+                  tiebreak: pd.Series = None):
+    """레지스트리가 없을 때 기존 결과의 (key, id)로 초기화"""
+    if registry_exists(name, registry_dir):
+        return
+    seed = pd.Series(ids.to_numpy(dtype='int64'), index=disambiguate(keys, tiebreak).to_numpy())
+    save_registry(name, seed[~seed.index.duplicated()], registry_dir)
+
+
+def _number_occurrences(keys: pd.Series) -> pd.Series:
+    """중복 키의 두 번째부터 등장 순서대로 '#2', '#3'... 을 붙임"""
+    occurrence = keys.groupby(keys, sort=False).cumcount()
+    return keys.where(occurrence == 0, keys + '#' + (occurrence + 1).astype(str))
+
+
+def disambiguate(keys: pd.Series, tiebreak: pd.Series = None) -> pd.Series:
+    """
+    같은 실행 안에서 중복된 키를 서로 다른 키로 만듭니다.
+
+    tiebreak(keys와 같은 index의 안정적인 속성 문자열)이 있으면 중복 키마다 tiebreak 해시('#1a2b3c4d')를 붙여
+    크롤링 순서와 무관하게 같은 항목이 같은 키를 받습니다. tiebreak까지 같은 완전 중복과 tiebreak가 없을 때는
+    등장 순서('#2', '#3'...)로 구분합니다.
+    """
+    if tiebreak is not None:
+        duplicated = keys.duplicated(keep=False)
+        if duplicated.any():
+            digests = normalize_keys(tiebreak[duplicated]).map(
+                lambda text: format(zlib.crc32(text.encode('utf-8')), '08x'))
+            keys = keys.copy()
+            keys[duplicated] = keys[duplicated] + '#' + digests
+    return _number_occurrences(keys)
+
+
+def assign_ids(keys: pd.Series, name: str, reserved: int = 0,
+               registry_dir: Path = REGISTRY_DIR, tiebreak: pd.Series = None) -> pd.Series:
+    """
+    자연 키 Series에 고정 ID를 부여합니다.
+
+    Args:
+        keys: 자연 키 Series
+        name: 레지스트리 이름 (stores, menus, roasteries)
+        reserved: 이 값 이하의 ID는 새 키에 할당하지 않음 (예: Admin Roastery = 1)
+        tiebreak: 중복 키 구분에 쓸 안정적인 속성 (disambiguate 참고)
+
+    Returns:
+        keys와 같은 index의 ID Series
+    """
+    registry = load_registry(name, registry_dir)
+    keys = keys.astype(str)
+    stable_keys = disambiguate(keys, tiebreak)
+
+    ids = stable_keys.map(registry)
+    # 등장 순서('#n')로 저장된 기존 레지스트리의 중복 키는 한 번만 이어받고 해시 키로 다시 저장
+    legacy = ids.isna() & (stable_keys != _number_occurrences(keys))
+    if legacy.any():
+        ids[legacy] = _number_occurrences(keys)[legacy].map(registry)
+        inherited = legacy & ids.notna()
+        if inherited.any():
+            registry = pd.concat([registry, pd.Series(ids[inherited].to_numpy(dtype='int64'),
+                                                      index=stable_keys[inherited].to_numpy())])
+            save_registry(name, registry, registry_dir)
+
+    keys = stable_keys
+    new_keys = pd.unique(keys[ids.isna()])
+    if len(new_keys) > 0:
+        next_id = max(int(registry.max()) if len(registry) else 0, reserved) + 1
+        new_entries = pd.Series(range(next_id, next_id + len(new_keys)), index=new_keys, dtype='int64')
+        registry = pd.concat([registry, new_entries])
+        save_registry(name, registry, registry_dir)
+        ids = keys.map(registry)
+
+    return ids.astype('int64')
@@ -0,0 +1,286 @@
+"""
+적재 전 참조 무결성 검사 모듈
+
+data_import.sql / LOAD DATA / 7_load_database.py는 모두 외래키 검사를 끈 채로 적재하므로,
+없는 원두를 가리키는 매핑이나 flavor_prod.sql에 없는 flavor_id는 DB에 그대로 들어갑니다.
+이 모듈은 5_generate_sql.py가 준비한 테이블 데이터만으로 DB 없이 같은 제약을 검사합니다.
+
+    - 외래키 / 유니크 키 / NOT NULL 제약은 schema.sql에서 읽음 (스키마가 바뀌면 검사도 따라감)
+    - 부모 테이블마다 키 컬럼을 정수 배열로 한 번만 만들고, 모든 외래키 간선을 np.isin으로 검사
+      (정수 키 범위가 좁으면 np.isin이 룩업 테이블을 써서 정렬/해시 없이 O(n))
+    - 복합 유니크 키(uk_menu_bean, uk_bean_flavor)는 두 정수 컬럼을 int64 하나로 묶어 중복 검사
+    - 적재 대상이 아닌 부모 테이블은 reference_keys로 키를 넘겨 검사 (flavors ← flavor_prod.sql),
+      키가 없으면 (users 등) 검사하지 않은 간선으로 보고
+
+사용법:
+    python scripts/integrity_check.py [data_dir]    # data/final 검사 + 보고서 저장 (위반 시 종료 코드 1)
+"""
+
+import json
+import os
+import re
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from flavor_hierarchy import parse_flavor_sql
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCHEMA_PATH = PROJECT_ROOT / 'sql' / 'schema.sql'
+FLAVOR_SQL_PATH = PROJECT_ROOT / 'sql' / 'flavor_prod.sql'
+REPORT_PATH = PROJECT_ROOT / 'data' / 'processed' / 'integrity_report.json'
+
+# 위반 항목마다 보고서에 남기는 예시 키 수
+SAMPLE_KEYS = 10
+
+_CREATE_TABLE = re.compile(r'CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);', re.S)
+_FOREIGN_KEY = re.compile(r'^\s*FOREIGN KEY \((\w+)\) REFERENCES (\w+) \((\w+)\)', re.M)
+_UNIQUE_KEY = re.compile(r'^\s*UNIQUE KEY (\w+) \(([^)]*)\)', re.M)
+_PRIMARY_KEY = re.compile(r'^\s*(\w+)\s+\w+.*\bPRIMARY KEY\b', re.M)
+_NOT_NULL = re.compile(r'^\s*(\w+)\s+\w+[^,\n]*\bNOT NULL\b', re.M)
+_QUOTED = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_PARENS = re.compile(r'\([^()]*\)')
+
+
+# ============================================================================
+# 제약 조건 / 참조 키 읽기
+# ============================================================================
+
+def strip_type_arguments(body: str) -> str:
+    """
+    CREATE TABLE 본문에서 따옴표 문자열(COMMENT 등)과 괄호 안을 지움
+
+    DECIMAL(10, 8)처럼 타입 인자에 쉼표가 있으면 _NOT_NULL이 쉼표에서 멈추므로,
+    안쪽 괄호부터 반복해서 지워 중첩 괄호도 처리합니다.
+    """
+    body = _QUOTED.sub("''", body)
+    while True:
+        stripped = _PARENS.sub('', body)
+        if stripped == body:
+            return body
+        body = stripped
+
+
+def not_null_columns(table: str, body: str) -> list:
+    """
+    CREATE TABLE 본문 → NOT NULL 컬럼 목록
+
+    NOT NULL이 들어 있는 정의 줄 수와 읽은 컬럼 수가 다르면 (정규식이 놓친 타입 표기)
+    검사가 조용히 빠지지 않도록 ValueError
+    """
+    definitions = strip_type_arguments(body)
+    columns = _NOT_NULL.findall(definitions)
+    declared = [line.strip() for line in definitions.splitlines() if re.search(r'\bNOT NULL\b', line)]
+    if len(columns) != len(declared):
+        raise ValueError(f"{table}: NOT NULL 정의 {len(declared)}개 중 {len(columns)}개만 읽음 ({declared})")
+    return columns
+
+
+def schema_constraints(schema_path: Path = SCHEMA_PATH) -> dict:
+    """
+    schema.sql → 테이블별 제약 조건 (주석 처리된 줄은 제외)
+
+    Returns:
+        {테이블: {"foreign_keys": [(컬럼, 부모 테이블, 부모 컬럼), ...],
+                 "unique_keys": [(키 이름, [컬럼, ...]), ...]  (PRIMARY KEY 포함),
+                 "not_null": [컬럼, ...]}}
+    """
+    text = Path(schema_path).read_text(encoding='utf-8')
+    constraints = {}
+    for table, body in _CREATE_TABLE.findall(text):
+        body = '\n'.join(line for line in body.splitlines() if not line.strip().startswith('--'))
+        unique_keys = [('PRIMARY', [column]) for column in _PRIMARY_KEY.findall(body)]
+        unique_keys += [(name, [column.strip() for column in columns.split(',')])
+                        for name, columns in _UNIQUE_KEY.findall(body)]
+        constraints[table] = {
+            'foreign_keys': _FOREIGN_KEY.findall(body),
+            'unique_keys': unique_keys,
+            'not_null': not_null_columns(table, body),
+        }
+    return constraints
+
+
+def flavor_ids(flavor_sql_path: Path = FLAVOR_SQL_PATH) -> np.ndarray:
+    """flavor_prod.sql의 INSERT 행에서 flavors.id 목록 (정렬된 int64 배열)"""
+    return np.unique(parse_flavor_sql(flavor_sql_path)['id'].to_numpy())
+
+
+# ============================================================================
+# 검사
+# ============================================================================
+
+def key_array(series: pd.Series) -> np.ndarray:
+    """키 컬럼 → NULL을 뺀 int64 배열 (CSV에서 float로 읽힌 정수 포함)"""
+    values = pd.to_numeric(series, errors='coerce').dropna()
+    return values.to_numpy(dtype=np.int64)
+
+
+def sample_counts(values) -> list:
+    """위반 키 → 많이 나온 순서로 [[키, 행 수], ...] (최대 SAMPLE_KEYS개)"""
+    counts = pd.Series(values).value_counts().head(SAMPLE_KEYS)
+    return [[key.item() if hasattr(key, 'item') else key, int(count)] for key, count in counts.items()]
+
+
+def combined_keys(frame: pd.DataFrame, columns) -> np.ndarray:
+    """
+    유니크 키 컬럼 → 행마다 비교 가능한 키 배열
+
+    정수 컬럼 2개이고 범위가 int64에 들어가면 (a, b)를 a * (max(b) + 1) + b 하나로 묶고,
+    그 외에는 컬럼 값을 이어 붙인 문자열을 사용
+    """
+    if len(columns) == 1:
+        values = frame[columns[0]]
+        return values.to_numpy() if values.dtype.kind in 'iu' else values.astype(str).to_numpy()
+
+    if len(columns) == 2 and all(frame[column].dtype.kind in 'iu' for column in columns):
+        left, right = (frame[column].to_numpy(dtype=np.int64) for column in columns)
+        if len(left) == 0:
+            return left
+        if left.min() >= 0 and right.min() >= 0:
+            width = int(right.max()) + 1
+            if int(left.max()) < np.iinfo(np.int64).max // width:
+                return left * width + right
+
+    return frame[columns].astype(str).agg(', '.join, axis=1).to_numpy()
+
+
+def duplicate_keys(frame: pd.DataFrame, columns) -> list:
+    """유니크 키 컬럼이 중복된 키 목록 (복합 키는 "a, b" 문자열, 행 순서 = 첫 중복 순서)"""
+    keys = combined_keys(frame, columns)
+    duplicated = pd.Series(keys).duplicated(keep='first').to_numpy()
+    if not duplicated.any():
+        return []
+    rows = frame.loc[duplicated, columns]
+    if len(columns) == 1:
+        return rows[columns[0]].tolist()
+    return rows.astype(str).agg(', '.join, axis=1).tolist()
+
+
+def check_integrity(tables, reference_keys=None, schema_path: Path = SCHEMA_PATH) -> dict:
+    """
+    준비된 테이블 데이터의 외래키 / 유니크 키 / NOT NULL 제약을 검사합니다.
+
+    Args:
+        tables: [(테이블명, DataFrame), ...] 또는 {테이블명: DataFrame}
+        reference_keys: 적재하지 않는 부모 테이블의 키 {테이블: id 배열} (예: {"flavors": flavor_ids()})
+        schema_path: 제약 조건을 읽을 schema.sql
+
+    Returns:
+        {"violations": [{"check", "table", "columns", ...}, ...],
+         "checked": {"foreign_keys": n, "unique_keys": n, "not_null": n, "rows": n},
+         "skipped": ["stores.owner_id -> users.id", ...]}
+    """
+    frames = dict(tables)
+    constraints = schema_constraints(schema_path)
+    violations, skipped = [], []
+    checked = {'foreign_keys': 0, 'unique_keys': 0, 'not_null': 0, 'rows': sum(len(f) for f in frames.values())}
+
+    # 부모 키는 테이블마다 한 번만 배열로 만들어 모든 간선에서 재사용 (np.isin은 중복 키를 그대로 받음)
+    parent_keys = {table: np.unique(np.asarray(keys, dtype=np.int64))
+                   for table, keys in (reference_keys or {}).items()}
+
+    def keys_of(table, column):
+        if (table, column) not in parent_keys:
+            parent_keys[(table, column)] = key_array(frames[table][column])
+        return parent_keys[(table, column)]
+
+    for table, frame in frames.items():
+        if table not in constraints:
+            raise ValueError(f"schema.sql에 {table} 테이블이 없습니다")
+        table_constraints = constraints[table]
+
+        for column in table_constraints['not_null']:
+            if column not in frame.columns:
+                continue
+            checked['not_null'] += 1
+            nulls = int(frame[column].isna().sum())
+            if nulls:
+                violations.append({'check': 'not_null', 'table': table, 'columns': [column], 'rows': nulls})
+
+        for name, columns in table_constraints['unique_keys']:
+            if any(column not in frame.columns for column in columns):
+                continue
+            checked['unique_keys'] += 1
+            duplicated = duplicate_keys(frame, columns)
+            if duplicated:
+                violations.append({'check': 'unique', 'table': table, 'columns': columns, 'key': name,
+                                   'rows': len(duplicated), 'samples': sample_counts(duplicated)})
+
+        for column, parent, parent_column in table_constraints['foreign_keys']:
+            if column not in frame.columns:
+                continue
+            edge = f"{table}.{column} -> {parent}.{parent_column}"
+            if parent in frames and parent_column in frames[parent].columns:
+                parent_ids = keys_of(parent, parent_column)
+            elif parent in parent_keys and parent_column == 'id':
+                parent_ids = parent_keys[parent]
+            else:
+                skipped.append(edge)
+                continue
+
+            checked['foreign_keys'] += 1
+            child_ids = key_array(frame[column])
+            missing = child_ids[~np.isin(child_ids, parent_ids)]
+            if len(missing):
+                violations.append({'check': 'foreign_key', 'table': table, 'columns': [column],
+                                   'references': f"{parent}.{parent_column}", 'rows': len(missing),
+                                   'samples': sample_counts(missing)})
+
+    return {'violations': violations, 'checked': checked, 'skipped': skipped}
+
+
+def format_violation(violation) -> str:
+    """보고서 항목 한 줄 요약"""
+    target = f"{violation['table']}({', '.join(violation['columns'])})"
+    if violation['check'] == 'foreign_key':
+        text = f"외래키 위반 {target} -> {violation['references']}: {violation['rows']}개 행"
+    elif violation['check'] == 'unique':
+        text = f"유니크 키 중복 {target} [{violation['key']}]: {violation['rows']}개 행"
+    else:
+        text = f"NOT NULL 위반 {target}: {violation['rows']}개 행"
+    if violation.get('samples'):
+        text += " (예: " + ", ".join(f"{key} x{count}" for key, count in violation['samples'][:5]) + ")"
+    return text
+
+
+def save_report(report: dict, path: Path = REPORT_PATH):
+    """임시 파일에 쓴 뒤 교체"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    generate_sql = import_module('5_generate_sql')
+    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else generate_sql.DATA_DIR
+
+    print("=== 참조 무결성 검사 ===\n")
+    tables, _ = generate_sql.prepare_tables(data_dir)
+    report = check_integrity(tables, {'flavors': flavor_ids()})
+    save_report(report)
+
+    checked = report['checked']
+    print(f"검사: {checked['rows']}개 행, 외래키 {checked['foreign_keys']}개, "
+          f"유니크 키 {checked['unique_keys']}개, NOT NULL {checked['not_null']}개")
+    for edge in report['skipped']:
+        print(f"  - 건너뜀 (부모 테이블 키 없음): {edge}")
+    for violation in report['violations']:
+        print(f"  ✗ {format_violation(violation)}")
+    print(f"\n보고서: {REPORT_PATH}")
+
+    if report['violations']:
+        sys.exit(1)
+    print("✓ 위반 없음")
+
+
+if __name__ == '__main__':
+    main()
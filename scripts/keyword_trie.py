@@ -0,0 +1,36 @@
+"""
+키워드 목록을 문자 trie 정규식으로 컴파일하는 공용 모듈
+
+수십~수백 개 키워드를 단순 alternation으로 묶으면 각 위치에서 모든 대안을 시도하지만,
+trie 형태로 접두어를 공유하면 위치마다 trie를 한 번만 내려가므로 키워드 수와 무관하게 빠릅니다.
+(4_map_menu_beans.py 국가/지역 키워드, bean_ranking.py 향미 키워드에서 사용)
+"""
+
+import re
+
+
+def build_trie_pattern(terms) -> re.Pattern:
+    """
+    키워드 목록을 문자 trie 형태의 정규식으로 컴파일합니다.
+
+    각 위치에서 trie를 따라 한 번만 내려가므로 키워드 수와 무관하게 한 번의 스캔으로 매칭되고,
+    greedy 선택(?:...)? 덕분에 같은 위치에서는 가장 긴 키워드가 선택됩니다.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True  # 단어 끝 표시
+
+    def to_regex(node):
+        is_end = '' in node
+        branches = [re.escape(char) + to_regex(child) for char, child in node.items() if char != '']
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            return '(?:' + body + ')?'
+        return body
+
+    return re.compile(to_regex(trie))
@@ -0,0 +1,168 @@
+"""
+LOAD DATA INFILE용 TSV 내보내기 모듈
+
+MySQL LOAD DATA는 INSERT 문 파싱보다 훨씬 빠르므로, 5_generate_sql.py가 만든 테이블 데이터를
+MySQL 기본 형식의 TSV와 로더 SQL로 함께 내보냅니다.
+
+    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'
+
+    - 컬럼 순서는 schema.sql의 CREATE TABLE 순서 (없는 컬럼은 DB 기본값)
+    - NULL은 \\N, 문자열의 \\ 탭 줄바꿈 CR NUL은 백슬래시 이스케이프
+    - BOOLEAN은 1/0
+    - 첫 줄은 컬럼 헤더 (IGNORE 1 LINES)
+
+read_load_data_tsv()는 같은 규칙으로 TSV를 다시 읽어 INSERT 값과 비교하는 검증용입니다.
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_numeric_dtype
+
+TSV_NULL = '\\N'
+
+# format_value가 NULL로 보는 문자열 ('nan'은 대소문자 무관)
+NULL_STRINGS = ['', 'nan', 'naN', 'nAn', 'nAN', 'Nan', 'NaN', 'NAn', 'NAN']
+
+# int(float(value))와 str(value)가 같은 정수 범위 (float64 가수부)
+EXACT_INT_LIMIT = 2 ** 53
+
+# 문자열 값 이스케이프 (백슬래시를 먼저 처리)
+TSV_ESCAPES = [('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'), ('\0', '\\0')]
+
+# LOAD DATA가 해석하는 이스케이프 시퀀스 (그 외 \x는 x)
+TSV_UNESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+
+_CREATE_TABLE = re.compile(r'CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);', re.S)
+_NON_COLUMN = ('UNIQUE', 'KEY', 'INDEX', 'PRIMARY', 'FOREIGN', 'CONSTRAINT', '--', ')')
+_ESCAPE_SEQUENCE = re.compile(r'\\(.)', re.S)
+
+
+def schema_columns(schema_path: Path) -> dict:
+    """schema.sql → {테이블: [컬럼명, ...]} (CREATE TABLE 정의 순서)"""
+    text = Path(schema_path).read_text(encoding='utf-8')
+    tables = {}
+    for table, body in _CREATE_TABLE.findall(text):
+        columns = []
+        for line in body.splitlines():
+            line = line.strip()
+            if not line or line.upper().startswith(_NON_COLUMN):
+                continue
+            columns.append(line.split()[0])
+        tables[table] = columns
+    return tables
+
+
+def ordered_columns(table: str, columns, schema: dict) -> list:
+    """내보낼 컬럼을 schema.sql 순서로 정렬 (schema에 없는 컬럼이면 ValueError)"""
+    if table not in schema:
+        raise ValueError(f"schema.sql에 {table} 테이블이 없습니다")
+    missing = [column for column in columns if column not in schema[table]]
+    if missing:
+        raise ValueError(f"{table}: schema.sql에 없는 컬럼 {missing}")
+    return [column for column in schema[table] if column in columns]
+
+
+def null_mask(series: pd.Series) -> pd.Series:
+    """format_value와 같은 NULL 판정 (결측값, 빈 문자열, 'nan')"""
+    if is_numeric_dtype(series):
+        return series.isna()
+    return series.isna() | series.astype(str).isin(NULL_STRINGS)
+
+
+def number_text(values: pd.Series, column_type: str) -> list:
+    """NULL이 아닌 값 → str(int(float(v))) / str(float(v))와 같은 문자열 목록"""
+    if column_type == 'int':
+        if not (is_integer_dtype(values) and (len(values) == 0 or values.abs().max() <= EXACT_INT_LIMIT)):
+            values = values.astype(float).astype('int64')
+        return list(map(str, values.tolist()))
+    return list(map(str, values.astype(float).tolist()))
+
+
+def tsv_column(series: pd.Series, column_type: str = 'string') -> pd.Series:
+    """컬럼 타입(int / float / bool / string)에 따라 Series 전체를 TSV 필드 문자열로 변환"""
+    is_null = null_mask(series)
+    values = series[~is_null]
+
+    if column_type in ('int', 'float'):
+        values = number_text(values, column_type)
+    elif column_type == 'bool':
+        values = values.astype(str).str.lower().isin(['true', '1', 'yes']).map({True: '1', False: '0'})
+    else:
+        values = values.astype(str)
+        for raw, escaped in TSV_ESCAPES:
+            values = values.str.replace(raw, escaped, regex=False)
+
+    fields = np.full(len(series), TSV_NULL, dtype=object)
+    fields[~is_null.to_numpy()] = values if isinstance(values, list) else values.to_numpy(dtype=object)
+    return pd.Series(fields, index=series.index)
+
+
+def write_table_tsv(frame: pd.DataFrame, column_types: dict, columns, path: Path) -> int:
+    """frame의 columns를 TSV로 저장하고 행 수를 반환"""
+    fields = [tsv_column(frame[column], column_types[column]).tolist() for column in columns]
+    lines = list(map('\t'.join, zip(*fields)))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\t'.join(columns) + '\n')
+        if len(lines) > 0:
+            f.write('\n'.join(lines) + '\n')
+    return len(lines)
+
+
+def load_data_statement(table: str, columns, tsv_path: str) -> str:
+    """TSV 한 개를 적재하는 LOAD DATA LOCAL INFILE 문"""
+    return "\n".join([
+        f"LOAD DATA LOCAL INFILE '{tsv_path}'",
+        f"INTO TABLE {table}",
+        "CHARACTER SET utf8mb4",
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'",
+        "LINES TERMINATED BY '\\n'",
+        "IGNORE 1 LINES",
+        f"({', '.join(columns)});",
+    ])
+
+
+def build_load_data_script(statements) -> str:
+    """LOAD DATA 문 목록을 외래키/유니크 검사 해제 구간으로 감싼 로더 SQL"""
+    lines = [
+        "-- Comeet LOAD DATA Import",
+        "-- Generated by scripts/5_generate_sql.py",
+        "-- 프로젝트 루트에서 실행: mysql --local-infile=1 -u <user> -p <database> < sql/tsv/load_data.sql",
+        "",
+        "SET FOREIGN_KEY_CHECKS = 0;",
+        "SET UNIQUE_CHECKS = 0;",
+        "",
+    ]
+    for statement in statements:
+        lines.append(statement)
+        lines.append("")
+    lines.append("SET UNIQUE_CHECKS = 1;")
+    lines.append("SET FOREIGN_KEY_CHECKS = 1;")
+    return "\n".join(lines) + "\n"
+
+
+def read_load_data_tsv(path: Path) -> pd.DataFrame:
+    """
+    LOAD DATA 기본 규칙으로 TSV를 읽습니다. (검증용)
+
+    Returns:
+        헤더 컬럼의 DataFrame (값은 문자열, NULL은 None)
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        lines = f.read().split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    columns = lines[0].split('\t')
+
+    fields = pd.Series(lines[1:], dtype=object).str.split('\t', expand=True, regex=False)
+    frame = pd.DataFrame(index=range(len(lines) - 1))
+    for i, column in enumerate(columns):
+        values = fields[i] if i in fields.columns else pd.Series(None, index=frame.index, dtype=object)
+        unescaped = values.str.replace(_ESCAPE_SEQUENCE, lambda m: TSV_UNESCAPES.get(m.group(1), m.group(1)),
+                                       regex=True)
+        frame[column] = unescaped.astype(object).mask(values == TSV_NULL, None)
+    return frame
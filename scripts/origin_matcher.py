@@ -0,0 +1,337 @@
+"""
+원산지 키워드 근사(fuzzy) 매칭 모듈
+
+COUNTRY_ALIASES는 정확한 한글 표기만 잡기 때문에 "Ethiopia Guji", "ETH 구지",
+"코스타 리카", "콜럼비아" 같은 메뉴명은 매핑되지 않습니다.
+국가/지역/품종 키워드(ALL_TERMS)에 대해 다음 정규화 계층을 둡니다.
+
+    - 한글 토큰: 자모 분해 후 편집 거리 비교 ("예가채프" → 예가체프)
+    - 영문 토큰: 국어의 로마자 표기법으로 자동 생성한 표기(구지 → guji)
+      + LATIN_NAMES의 영문 표기(yirgacheffe 등)와 편집 거리 비교
+    - 약어(ORIGIN_ABBREVIATIONS)는 정확히 일치할 때만 ("eth" → 에티오피아)
+    - 띄어쓰기 변형: 인접 토큰 2~3개를 붙인 문자열도 후보로 비교
+
+편집 거리 검색은 삭제 이웃(symmetric delete) 인덱스로 합니다. 키워드에서 문자를 최대
+MAX_EDIT_DISTANCE개 지운 변형을 미리 색인해 두면, 질의도 같은 방식으로 지운 변형의 dict 조회만으로
+후보를 얻고 후보만 편집 거리로 검증합니다. (짧은 자모 문자열에서는 BK-tree보다 비교 횟수가 훨씬 적음)
+같은 토큰은 한 번만 계산하도록 LRU 캐시(MATCH_CACHE_SIZE개)에 두고, 짧은 토큰은 오탐이 많으므로 길이에 따라 허용 거리를 줄입니다.
+"""
+
+import re
+import unicodedata
+from collections import OrderedDict
+
+from keyword_trie import build_trie_pattern
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+# 한글 키워드 → 영문 표기 (로마자 자동 표기로 안 잡히는 것만)
+LATIN_NAMES = {
+    '에티오피아': ['ethiopia', 'ethiopian'],
+    '콜롬비아': ['colombia', 'columbia'],
+    '케냐': ['kenya'],
+    '과테말라': ['guatemala'],
+    '코스타리카': ['costa rica'],
+    '파나마': ['panama'],
+    '인도네시아': ['indonesia'],
+    '하와이': ['hawaii'],
+    '브라질': ['brazil', 'brasil'],
+    '르완다': ['rwanda'],
+    '페루': ['peru'],
+    '에콰도르': ['ecuador'],
+    '엘살바도르': ['el salvador'],
+    '온두라스': ['honduras'],
+    '예멘': ['yemen'],
+    '멕시코': ['mexico'],
+    '니카라과': ['nicaragua'],
+    '베트남': ['vietnam'],
+    '부룬디': ['burundi'],
+    '타이완': ['taiwan'],
+    '예가체프': ['yirgacheffe', 'yirgachefe', 'yirga cheffe'],
+    '시다모': ['sidamo'],
+    '시다마': ['sidama'],
+    '구지': ['guji'],
+    '하라르': ['harrar', 'harar'],
+    '함벨라': ['hambela'],
+    '수마트라': ['sumatra'],
+    '만델링': ['mandheling', 'mandailing'],
+    '자바': ['java'],
+    '발리': ['bali'],
+    '술라웨시': ['sulawesi'],
+    '토라자': ['toraja'],
+    '아체': ['aceh'],
+    '가요': ['gayo'],
+    '타라주': ['tarrazu'],
+    '안티구아': ['antigua'],
+    '아카테낭고': ['acatenango'],
+    '나리뇨': ['narino'],
+    '보케테': ['boquete'],
+    '세라도': ['cerrado'],
+    '코나': ['kona'],
+    '게이샤': ['geisha'],
+    '게샤': ['gesha'],
+    '파카마라': ['pacamara'],
+    '부르봉': ['bourbon'],
+    '피베리': ['peaberry'],
+    '내추럴': ['natural'],
+    '워시드': ['washed'],
+    '허니': ['honey'],
+    '아네로빅': ['anaerobic'],
+}
+
+# 정확히 일치할 때만 인정하는 약어
+ORIGIN_ABBREVIATIONS = {
+    'eth': '에티오피아',
+    'col': '콜롬비아',
+    'ken': '케냐',
+    'gtm': '과테말라',
+    'idn': '인도네시아',
+}
+
+# 로마자 자동 표기에서 제외할 키워드 (일반 단어와 겹쳐 오탐이 많은 것)
+NO_ROMANIZE_TERMS = {'모카', '핑크'}
+
+MAX_NGRAM = 3          # 띄어쓰기 변형 비교 시 붙여 볼 최대 토큰 수
+MAX_EDIT_DISTANCE = 2  # 삭제 이웃 인덱스 깊이 (max_distance의 최댓값)
+MATCH_CACHE_SIZE = 100_000  # 토큰 매칭 결과 LRU 캐시 크기 (100만 메뉴 규모에서도 메모리 상한)
+
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z]+')
+
+# ============================================================================
+# 한글 자모 분해 / 로마자 표기
+# ============================================================================
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_END = 0xD7A3
+_INITIAL_JAMO = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_MEDIAL_JAMO = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_FINAL_JAMO = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+               'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 국어의 로마자 표기법 (음운 변화는 ㄹㄹ → ll만 반영)
+_INITIAL_ROMAN = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj',
+                  'ch', 'k', 't', 'p', 'h']
+_MEDIAL_ROMAN = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo',
+                 'u', 'wo', 'we', 'wi', 'yu', 'eu', 'ui', 'i']
+_FINAL_ROMAN = ['', 'k', 'k', 'k', 'n', 'n', 'n', 't', 'l', 'k', 'm', 'l', 'l', 'l', 'p', 'l',
+                'm', 'p', 'p', 't', 't', 'ng', 't', 't', 'k', 't', 'p', 't']
+
+
+def _syllable_parts(char: str):
+    code = ord(char)
+    if not _HANGUL_BASE <= code <= _HANGUL_END:
+        return None
+    code -= _HANGUL_BASE
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 ("구지" → "ㄱㅜㅈㅣ")"""
+    result = []
+    for char in text:
+        parts = _syllable_parts(char)
+        if parts is None:
+            result.append(char)
+        else:
+            initial, medial, final = parts
+            result.append(_INITIAL_JAMO[initial] + _MEDIAL_JAMO[medial] + _FINAL_JAMO[final])
+    return ''.join(result)
+
+
+def romanize(text: str) -> str:
+    """한글을 로마자로 표기 ("구지" → "guji", "콜롬비아" → "kollombia")"""
+    result = []
+    previous_final = ''
+    for char in text:
+        parts = _syllable_parts(char)
+        if parts is None:
+            result.append(char.lower())
+            previous_final = ''
+            continue
+        initial, medial, final = parts
+        initial_roman = _INITIAL_ROMAN[initial]
+        if initial_roman == 'r' and previous_final == 'l':
+            initial_roman = 'l'
+        previous_final = _FINAL_ROMAN[final]
+        result.append(initial_roman + _MEDIAL_ROMAN[medial] + previous_final)
+    return ''.join(result)
+
+
+# ============================================================================
+# 편집 거리 / 삭제 이웃 인덱스
+# ============================================================================
+
+def levenshtein(a: str, b: str, max_distance: int = None) -> int:
+    """편집 거리 (max_distance를 넘는 것이 확실해지면 max_distance + 1 반환)"""
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def deletion_variants(key: str, depth: int) -> set:
+    """문자를 최대 depth개 지운 모든 변형 (원본 포함)"""
+    variants = {key}
+    frontier = {key}
+    for _ in range(depth):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+def index_insert(index: dict, key: str, term: str, depth: int = MAX_EDIT_DISTANCE):
+    """삭제 이웃 인덱스에 키 추가. index: {'variants': {변형: {키}}, 'terms': {키: {term}}}"""
+    index.setdefault('terms', {}).setdefault(key, set()).add(term)
+    index['max_length'] = max(index.get('max_length', 0), len(key))
+    variants = index.setdefault('variants', {})
+    for variant in deletion_variants(key, depth):
+        variants.setdefault(variant, set()).add(key)
+
+
+def index_search(index: dict, key: str, max_distance: int) -> list:
+    """거리 max_distance 이내의 (거리, 키, terms) 목록"""
+    # 가장 긴 키보다 max_distance 넘게 길면 후보가 있을 수 없음 (긴 n-gram 대부분이 여기서 걸러짐)
+    if not index or len(key) - max_distance > index['max_length']:
+        return []
+    variants = index['variants']
+    candidates = set()
+    for variant in deletion_variants(key, max_distance):
+        candidates |= variants.get(variant, set())
+
+    found = []
+    for candidate in candidates:
+        distance = levenshtein(key, candidate, max_distance)
+        if distance <= max_distance:
+            found.append((distance, candidate, index['terms'][candidate]))
+    return found
+
+
+# ============================================================================
+# 매처
+# ============================================================================
+
+def max_distance(key: str, hangul: bool) -> int:
+    """키 길이별 허용 편집 거리 (한글은 음절 수 기준, 자모 거리로 비교)"""
+    if hangul:
+        syllables = len(key)
+        return 0 if syllables <= 2 else 1 if syllables <= 4 else MAX_EDIT_DISTANCE
+    return 0 if len(key) <= 4 else 1 if len(key) <= 7 else MAX_EDIT_DISTANCE
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def build_origin_matcher(terms, latin_names: dict = LATIN_NAMES,
+                         abbreviations: dict = ORIGIN_ABBREVIATIONS) -> dict:
+    """
+    키워드 목록으로 근사 매처를 구성합니다.
+
+    Returns:
+        exact (정확 일치 키 → terms), jamo_index / latin_index (삭제 이웃 인덱스),
+        term_pattern (토큰 안에 키워드가 그대로 있는지 확인용), cache (토큰 → 키워드 LRU)
+    """
+    exact = {}
+    latin_index, jamo_index = {}, {}
+
+    def add(key, term, index=None, index_key=None):
+        exact.setdefault(key, set()).add(term)
+        if index is not None:
+            index_insert(index, index_key or key, term)
+
+    for term in terms:
+        key = normalize_text(term).replace(' ', '')
+        if key.isascii():
+            add(key, term, latin_index)
+            continue
+        # 한글 편집 거리는 자모 단위로 계산
+        add(key, term, jamo_index, decompose_jamo(key))
+        if term not in NO_ROMANIZE_TERMS:
+            add(romanize(key), term, latin_index)
+        for latin in latin_names.get(term, []):
+            add(normalize_text(latin).replace(' ', ''), term, latin_index)
+
+    for abbreviation, term in abbreviations.items():
+        add(abbreviation, term)
+
+    return {
+        'exact': exact,
+        'jamo_index': jamo_index,
+        'latin_index': latin_index,
+        'term_pattern': build_trie_pattern([normalize_text(t) for t in terms]),
+        'cache': OrderedDict(),
+    }
+
+
+def match_key(matcher: dict, key: str) -> frozenset:
+    """토큰(또는 붙인 n-gram) 하나를 키워드 집합으로 (정확 일치 우선, 없으면 가장 가까운 키)"""
+    cache = matcher['cache']
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    if key in matcher['exact']:
+        result = frozenset(matcher['exact'][key])
+    else:
+        hangul = not key.isascii()
+        limit = max_distance(key, hangul)
+        found = []
+        if limit > 0:
+            index = matcher['jamo_index'] if hangul else matcher['latin_index']
+            query = decompose_jamo(key) if hangul else key
+            found = index_search(index, query, limit)
+        if found:
+            best = min(distance for distance, _, _ in found)
+            result = frozenset().union(*(terms for distance, _, terms in found if distance == best))
+        else:
+            result = frozenset()
+
+    cache[key] = result
+    if len(cache) > MATCH_CACHE_SIZE:
+        cache.popitem(last=False)  # 가장 오래 쓰지 않은 토큰부터 제거
+    return result
+
+
+def match_origin_terms(matcher: dict, text) -> set:
+    """
+    텍스트에서 근사 매칭된 키워드 집합을 찾습니다.
+
+    키워드가 그대로 들어 있는 한글 토큰은 정확 매칭(trie)에 맡기고,
+    그런 토큰을 포함하는 n-gram도 근사 비교하지 않습니다.
+    """
+    if not isinstance(text, str) or not text:
+        return set()
+
+    tokens = _TOKEN_PATTERN.findall(normalize_text(text))
+    has_exact = [not token.isascii() and matcher['term_pattern'].search(token) is not None for token in tokens]
+
+    found = set()
+    for start in range(len(tokens)):
+        for size in range(1, MAX_NGRAM + 1):
+            end = start + size
+            if end > len(tokens) or any(has_exact[start:end]):
+                break
+            window = tokens[start:end]
+            # 한글/영문이 섞인 n-gram은 비교하지 않음
+            if size > 1 and len({token.isascii() for token in window}) > 1:
+                break
+            found |= match_key(matcher, ''.join(window))
+    return found
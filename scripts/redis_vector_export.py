@@ -0,0 +1,576 @@
+"""
+Redis 벡터 인덱스 내보내기 (idx:beans)
+
+sql/scores_and_preferences.sql의 Redis Vector Index 설계(FT.CREATE idx:beans)에 맞춰
+bean_scores_import.csv와 flavor_embeddings.py 임베딩을 bean:{bean_id} Hash로 적재합니다.
+
+    - 숫자 필드 (bean_id, acidity ... total_score), roast_level TAG, flavor_tags TEXT ("fruity,berry"),
+      flavor_embedding (float32 little-endian blob, 임베딩이 없는 원두는 필드 생략)
+    - HSET 명령을 미리 만들어 두고 PIPELINE_BATCH개씩 파이프라인으로 전송 (배치당 왕복 1번)
+    - 적재 후 SCAN으로 bean:* 키를 훑어 이번에 적재하지 않은 원두(이전 내보내기의 잔여 키)는 DEL
+    - --verify: 하이브리드 필터 + KNN 질의를 FT.SEARCH로 보내고, 원본 배열로 계산한 참조 결과와 비교
+
+--local을 주면 Redis 대신 같은 명령(HSET / FT.CREATE / FT.SEARCH 등)의 부분 집합을
+프로세스 안에서 처리하는 LocalRedis를 사용합니다. (적재 / 질의 경로는 동일, 결과는 저장되지 않음)
+
+사전 준비: python scripts/flavor_embeddings.py (data/processed/embeddings/)
+
+사용법:
+    python scripts/redis_vector_export.py             # REDIS_HOST / REDIS_PORT (연결 실패 시 종료 코드 1)
+    python scripts/redis_vector_export.py --verify    # 적재 후 질의 결과 검증
+    python scripts/redis_vector_export.py --local     # LocalRedis로 적재 / 질의 경로만 확인 (Redis에 쓰지 않음)
+"""
+
+import fnmatch
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bean_recommender import BEAN_SCORES_PATH, ROAST_LEVELS, parse_flavor_tags
+from flavor_embeddings import OUTPUT_DIR as EMBEDDINGS_DIR, load_index
+from flavor_hierarchy import parse_flavor_sql
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+INDEX_NAME = 'idx:beans'
+KEY_PREFIX = 'bean:'
+
+# FT.CREATE SCHEMA 순서 (NUMERIC SORTABLE)
+NUMERIC_FIELDS = ['bean_id', 'acidity', 'body', 'sweetness', 'bitterness',
+                  'aroma', 'flavor', 'aftertaste', 'total_score']
+VECTOR_FIELD = 'flavor_embedding'
+
+# 파이프라인 한 번에 보낼 HSET 수 (1이면 명령마다 왕복)
+PIPELINE_BATCH = 500
+
+# 잔여 키 정리 시 SCAN 한 번에 훑을 키 수 (COUNT 힌트)
+SCAN_COUNT = 1000
+
+# 검증 질의 수 / KNN k / 거리 허용 오차 (Redis는 float32로 계산)
+VERIFY_QUERIES = 50
+VERIFY_K = 10
+DISTANCE_TOLERANCE = 1e-4
+# HNSW는 근사 검색이므로 재현율이 이 값 이상이면 통과 (LocalRedis는 정확 검색이라 항상 1.0)
+MIN_RECALL = 0.95
+
+
+# ============================================================================
+# 원두 데이터 → HSET 명령
+# ============================================================================
+
+def flavor_tag_codes(tags: pd.Series) -> pd.Series:
+    """flavor_tags ("[80103, 80401]") → 소문자 code를 쉼표로 이은 문자열 ("berry,blueberry"), 없으면 ''"""
+    flavors = parse_flavor_sql()
+    codes = dict(zip(flavors['id'].tolist(), flavors['code'].str.lower().tolist()))
+    notes = parse_flavor_tags(tags)
+    names = [codes.get(flavor_id, str(flavor_id)) for flavor_id in notes['flavor_id'].tolist()]
+    joined = pd.Series(names, index=notes['row'].to_numpy(), dtype=object).groupby(level=0).agg(','.join)
+    return joined.reindex(range(len(tags)), fill_value='')
+
+
+def bean_arrays(scores: pd.DataFrame, index: dict) -> dict:
+    """
+    bean_scores + 임베딩 인덱스 → 적재 / 참조 검색에 쓰는 열 배열
+
+    Returns:
+        {'bean_ids', 'numeric' [n, 9], 'roast_level', 'flavor_tags', 'vectors' [n, dim] float32, 'has_vector'}
+    """
+    scores = scores.reset_index(drop=True)
+    bean_ids = scores['bean_id'].to_numpy(dtype=np.int64)
+
+    # 임베딩 인덱스의 bean_ids는 오름차순 → 이진 탐색으로 행 위치 매칭
+    index_ids = index['bean_ids']
+    positions = np.minimum(np.searchsorted(index_ids, bean_ids), max(len(index_ids) - 1, 0))
+    has_vector = (index_ids[positions] == bean_ids) if len(index_ids) else np.zeros(len(bean_ids), dtype=bool)
+    vectors = np.zeros((len(scores), index['meta']['dim']), dtype='<f4')
+    vectors[has_vector] = index['vectors'][positions[has_vector]]
+    has_vector &= vectors.any(axis=1)  # 영벡터는 코사인 거리가 정의되지 않으므로 제외
+
+    return {
+        'bean_ids': bean_ids,
+        'numeric': scores[NUMERIC_FIELDS].to_numpy(dtype=np.int64),
+        'roast_level': scores['roast_level'].fillna('').astype(str).to_numpy(),
+        'flavor_tags': flavor_tag_codes(scores['flavor_tags']).to_numpy(),
+        'vectors': vectors,
+        'has_vector': has_vector,
+    }
+
+
+def hset_commands(arrays: dict, prefix: str = KEY_PREFIX) -> list:
+    """원두마다 ('HSET', key, field, value, ...) 명령 튜플 (숫자는 문자열, 임베딩은 bytes)"""
+    numeric = [[str(value) for value in column] for column in arrays['numeric'].T.tolist()]
+    commands = []
+    for i, bean_id in enumerate(arrays['bean_ids'].tolist()):
+        command = ['HSET', f"{prefix}{bean_id}"]
+        for field, column in zip(NUMERIC_FIELDS, numeric):
+            command += [field, column[i]]
+        command += ['roast_level', arrays['roast_level'][i], 'flavor_tags', arrays['flavor_tags'][i]]
+        if arrays['has_vector'][i]:
+            command += [VECTOR_FIELD, arrays['vectors'][i].tobytes()]
+        commands.append(tuple(command))
+    return commands
+
+
+def index_create_args(dim: int, index_name: str = INDEX_NAME, prefix: str = KEY_PREFIX) -> list:
+    """scores_and_preferences.sql Step 2의 FT.CREATE 인자 (DIM은 임베딩 차원)"""
+    schema = []
+    for field in NUMERIC_FIELDS:
+        schema += [field, 'NUMERIC', 'SORTABLE']
+    schema += ['roast_level', 'TAG', 'SEPARATOR', ',',
+               'flavor_tags', 'TEXT', 'WEIGHT', '1.0',
+               VECTOR_FIELD, 'VECTOR', 'HNSW', '6', 'TYPE', 'FLOAT32', 'DIM', str(dim), 'DISTANCE_METRIC', 'COSINE']
+    return ['FT.CREATE', index_name, 'ON', 'HASH', 'PREFIX', '1', prefix, 'SCHEMA', *schema]
+
+
+# ============================================================================
+# 적재
+# ============================================================================
+
+def create_index(client, dim: int, index_name: str = INDEX_NAME, prefix: str = KEY_PREFIX):
+    """같은 이름의 인덱스가 있으면 지우고 (문서는 유지) 다시 생성"""
+    existing = [name.decode() if isinstance(name, bytes) else name for name in client.execute_command('FT._LIST')]
+    if index_name in existing:
+        client.execute_command('FT.DROPINDEX', index_name)
+    client.execute_command(*index_create_args(dim, index_name, prefix))
+
+
+def write_commands(client, commands: list, batch_size: int = PIPELINE_BATCH) -> float:
+    """
+    HSET 명령 전송
+
+    batch_size > 1이면 batch_size개씩 파이프라인(transaction=False)으로 묶어 배치당 왕복 1번,
+    1이면 명령마다 execute_command (비교 기준)
+
+    Returns:
+        소요 시간 (초)
+    """
+    start = time.perf_counter()
+    if batch_size <= 1:
+        for command in commands:
+            client.execute_command(*command)
+    else:
+        for begin in range(0, len(commands), batch_size):
+            pipe = client.pipeline(transaction=False)
+            for command in commands[begin:begin + batch_size]:
+                pipe.execute_command(*command)
+            pipe.execute()
+    return time.perf_counter() - start
+
+
+def delete_keys(client, keys: list, batch_size: int = PIPELINE_BATCH) -> int:
+    """keys를 batch_size개씩 DEL로 묶어 파이프라인으로 전송하고 삭제된 키 수를 반환"""
+    if not keys:
+        return 0
+    pipe = client.pipeline(transaction=False)
+    for begin in range(0, len(keys), batch_size):
+        pipe.execute_command('DEL', *keys[begin:begin + batch_size])
+    return sum(pipe.execute())
+
+
+def scan_keys(client, pattern: str, count: int = SCAN_COUNT) -> list:
+    """SCAN 커서를 끝까지 돌며 pattern에 맞는 키 목록 (KEYS와 달리 서버를 오래 막지 않음)"""
+    keys, cursor = [], b'0'
+    while True:
+        cursor, batch = client.execute_command('SCAN', cursor, 'MATCH', pattern, 'COUNT', count)
+        keys += batch
+        if int(cursor) == 0:
+            return list(dict.fromkeys(keys))  # SCAN은 같은 키를 두 번 돌려줄 수 있음
+
+
+def remove_stale_keys(client, current_keys, prefix: str = KEY_PREFIX) -> int:
+    """
+    prefix로 시작하지만 current_keys에 없는 키(이전 내보내기에만 있던 원두)를 삭제
+
+    새 Hash를 모두 쓴 뒤에 호출하므로 적재 도중에도 현재 원두는 항상 인덱스에 있습니다.
+
+    Returns:
+        삭제된 키 수
+    """
+    current = {_bytes(key) for key in current_keys}
+    stale = [key for key in scan_keys(client, f"{prefix}*") if _bytes(key) not in current]
+    return delete_keys(client, stale)
+
+
+# ============================================================================
+# 하이브리드 질의 (필터 + KNN)
+# ============================================================================
+
+def query_string(query: dict) -> str:
+    """
+    {'ranges': {field: (lo, hi)}, 'roast_levels': [...], 'k': k} → FT.SEARCH 질의 문자열
+    예: (@acidity:[5 8] @roast_level:{LIGHT|MEDIUM})=>[KNN 10 @flavor_embedding $query_vec AS similarity]
+    """
+    filters = [f"@{field}:[{lo} {hi}]" for field, (lo, hi) in query.get('ranges', {}).items()]
+    if query.get('roast_levels'):
+        filters.append(f"@roast_level:{{{'|'.join(query['roast_levels'])}}}")
+    prefilter = f"({' '.join(filters)})" if filters else '*'
+    return f"{prefilter}=>[KNN {query['k']} @{VECTOR_FIELD} $query_vec AS similarity]"
+
+
+def search_args(query: dict, index_name: str = INDEX_NAME) -> list:
+    """scores_and_preferences.sql Step 3-1 형식의 FT.SEARCH 인자"""
+    return ['FT.SEARCH', index_name, query_string(query),
+            'PARAMS', '2', 'query_vec', np.asarray(query['vector'], dtype='<f4').tobytes(),
+            'RETURN', '2', 'bean_id', 'similarity',
+            'SORTBY', 'similarity', 'ASC',
+            'LIMIT', '0', str(query['k']),
+            'DIALECT', '2']
+
+
+def parse_search_reply(reply) -> list:
+    """FT.SEARCH 응답 [total, key, [field, value, ...], ...] → [(bean_id, 코사인 거리), ...]"""
+    results = []
+    for fields in reply[2::2]:
+        values = {_text(name): _text(value) for name, value in zip(fields[::2], fields[1::2])}
+        results.append((int(values['bean_id']), float(values['similarity'])))
+    return results
+
+
+def cosine_distances(arrays: dict, vector: np.ndarray) -> np.ndarray:
+    """모든 원두와의 코사인 거리 (1 - cos, Redis COSINE과 같은 정의), 임베딩 없는 원두는 inf"""
+    vectors = arrays['vectors'].astype(np.float64)
+    vector = np.asarray(vector, dtype=np.float64)
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(vector)
+    distances = np.full(len(vectors), np.inf)
+    valid = arrays['has_vector'] & (norms > 0)
+    distances[valid] = 1 - (vectors[valid] @ vector) / norms[valid]
+    return distances
+
+
+def filter_mask(arrays: dict, query: dict) -> np.ndarray:
+    mask = np.ones(len(arrays['bean_ids']), dtype=bool)
+    for field, (lo, hi) in query.get('ranges', {}).items():
+        column = arrays['numeric'][:, NUMERIC_FIELDS.index(field)]
+        mask &= (column >= float(lo)) & (column <= float(hi))
+    if query.get('roast_levels'):
+        mask &= np.isin(arrays['roast_level'], query['roast_levels'])
+    return mask
+
+
+def reference_search(arrays: dict, query: dict) -> list:
+    """원본 배열에서 같은 질의를 정확 검색 (필터 통과 + 임베딩 있는 원두 중 거리 오름차순, 동점은 bean_id 순)"""
+    distances = cosine_distances(arrays, query['vector'])
+    candidates = np.flatnonzero(filter_mask(arrays, query) & np.isfinite(distances))
+    order = candidates[np.lexsort((arrays['bean_ids'][candidates], distances[candidates]))][:query['k']]
+    return [(int(arrays['bean_ids'][p]), float(distances[p])) for p in order]
+
+
+def random_queries(arrays: dict, flavor_vectors: np.ndarray, n: int = VERIFY_QUERIES,
+                   k: int = VERIFY_K, seed: int = 42) -> list:
+    """user_preferences 형태의 무작위 하이브리드 질의 (감각 속성 범위 0-2개, 배전도 필터, 향미 벡터)"""
+    rng = np.random.default_rng(seed)
+    queries = []
+    for _ in range(n):
+        ranges = {}
+        for field in rng.choice(['acidity', 'body', 'sweetness', 'bitterness'], size=int(rng.integers(0, 3)),
+                                replace=False):
+            lo = int(rng.integers(1, 8))
+            ranges[str(field)] = (lo, int(rng.integers(lo + 2, 11)))
+        roast_levels = [level for level in ROAST_LEVELS if rng.random() < 0.6]
+        queries.append({'ranges': ranges, 'roast_levels': roast_levels, 'k': k,
+                        'vector': np.asarray(flavor_vectors[rng.integers(len(flavor_vectors))], dtype=np.float32)})
+    return queries
+
+
+def verify_queries(client, arrays: dict, queries: list, index_name: str = INDEX_NAME) -> dict:
+    """
+    FT.SEARCH 결과를 reference_search와 비교
+
+    반환된 원두가 필터를 통과하고 거리가 참조 거리와 같으며 참조 k번째 거리 이내면 적중으로 셉니다.
+    (동점 원두는 어느 쪽이 나와도 적중)
+
+    Returns:
+        {'queries', 'recall', 'mismatches': [(질의 번호, bean_id, 반환 거리, 참조 거리)], 'seconds'}
+    """
+    bean_positions = {bean_id: i for i, bean_id in enumerate(arrays['bean_ids'].tolist())}
+    hits, expected_total, mismatches, seconds = 0, 0, [], 0.0
+    for q, query in enumerate(queries):
+        start = time.perf_counter()
+        actual = parse_search_reply(client.execute_command(*search_args(query, index_name)))
+        seconds += time.perf_counter() - start
+
+        expected = reference_search(arrays, query)
+        distances = np.where(filter_mask(arrays, query), cosine_distances(arrays, query['vector']), np.inf)
+        cutoff = expected[-1][1] + DISTANCE_TOLERANCE if expected else -np.inf
+        expected_total += len(expected)
+        for bean_id, distance in actual:
+            reference = distances[bean_positions[bean_id]] if bean_id in bean_positions else np.inf
+            if abs(distance - reference) > DISTANCE_TOLERANCE:
+                mismatches.append((q, bean_id, distance, float(reference)))
+            elif reference <= cutoff:
+                hits += 1
+    return {'queries': len(queries), 'recall': hits / expected_total if expected_total else 1.0,
+            'mismatches': mismatches, 'seconds': seconds}
+
+
+# ============================================================================
+# LocalRedis (redis-py 부분 집합 stand-in)
+# ============================================================================
+
+class LocalResponseError(Exception):
+    """LocalRedis가 처리할 수 없는 명령 / 인자 (redis.ResponseError에 해당)"""
+
+
+def _bytes(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return (value if isinstance(value, str) else repr(value) if isinstance(value, float) else str(value)).encode()
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+_NUMERIC_FILTER = re.compile(r'@(\w+):\[(\S+) (\S+)\]')
+_TAG_FILTER = re.compile(r'@(\w+):\{([^}]*)\}')
+_KNN = re.compile(r'\[KNN (\d+) @(\w+) \$(\w+) AS (\w+)\]')
+
+
+class LocalRedis:
+    """
+    Redis Stack 없이 적재 / 질의 경로를 실행하기 위한 프로세스 내 stand-in
+
+    redis-py 클라이언트의 execute_command() / pipeline(transaction=False)만 흉내 내며,
+    HSET, HGETALL, EXISTS, DEL, DBSIZE, SCAN (MATCH / COUNT), FT.CREATE, FT.DROPINDEX, FT._LIST, 이 모듈이 만드는 형식의 FT.SEARCH
+    (숫자 범위 / 태그 필터 + KNN, 벡터 필드는 FLAT 정확 검색)를 지원합니다. 값은 Redis처럼 bytes로 저장합니다.
+
+    Args:
+        round_trip: 왕복 한 번(명령 1개 또는 파이프라인 execute 1번)마다 기다릴 초 (네트워크 지연 모의)
+    """
+
+    def __init__(self, round_trip: float = 0.0):
+        self.round_trip = round_trip
+        self.hashes = {}
+        self.indexes = {}
+
+    def execute_command(self, *args):
+        if self.round_trip:
+            time.sleep(self.round_trip)
+        return self._execute(args)
+
+    def pipeline(self, transaction=False):
+        return LocalPipeline(self)
+
+    def _execute(self, args):
+        name = _text(args[0]).upper()
+        if name == 'HSET':
+            fields = self.hashes.setdefault(_bytes(args[1]), {})
+            before = len(fields)
+            for field, value in zip(args[2::2], args[3::2]):
+                fields[_bytes(field)] = _bytes(value)
+            return len(fields) - before
+        if name == 'HGETALL':
+            return dict(self.hashes.get(_bytes(args[1]), {}))
+        if name == 'EXISTS':
+            return sum(_bytes(key) in self.hashes for key in args[1:])
+        if name == 'DEL':
+            return sum(self.hashes.pop(_bytes(key), None) is not None for key in args[1:])
+        if name == 'DBSIZE':
+            return len(self.hashes)
+        if name == 'SCAN':
+            return self._scan(args)
+        if name == 'FT._LIST':
+            return [name.encode() for name in self.indexes]
+        if name == 'FT.DROPINDEX':
+            if self.indexes.pop(_text(args[1]), None) is None:
+                raise LocalResponseError('Unknown Index name')
+            return b'OK'
+        if name == 'FT.CREATE':
+            return self._create(args)
+        if name == 'FT.SEARCH':
+            return self._search(args)
+        raise LocalResponseError(f"unknown command '{name}'")
+
+    def _scan(self, args):
+        """커서 = 키 목록에서의 위치, COUNT개를 훑어 MATCH에 맞는 키만 반환 (끝나면 커서 0)"""
+        cursor = int(_text(args[1]))
+        options = {_text(option).upper(): _text(value) for option, value in zip(args[2::2], args[3::2])}
+        count = int(options.get('COUNT', 10))
+        keys = list(self.hashes)[cursor:cursor + count]
+        if 'MATCH' in options:
+            keys = [key for key in keys if fnmatch.fnmatchcase(key.decode(), options['MATCH'])]
+        next_cursor = cursor + count if cursor + count < len(self.hashes) else 0
+        return [str(next_cursor).encode(), keys]
+
+    def _create(self, args):
+        args = [_text(arg) for arg in args]
+        index_name = args[1]
+        if index_name in self.indexes:
+            raise LocalResponseError('Index already exists')
+        prefix_count = int(args[args.index('PREFIX') + 1])
+        prefixes = args[args.index('PREFIX') + 2:args.index('PREFIX') + 2 + prefix_count]
+        schema = args[args.index('SCHEMA') + 1:]
+        vector = schema.index('VECTOR')
+        options = dict(zip(schema[vector + 3::2], schema[vector + 4:vector + 3 + 2 * int(schema[vector + 2]):2]))
+        self.indexes[index_name] = {'prefixes': [prefix.encode() for prefix in prefixes],
+                                    'vector_field': schema[vector - 1].encode(), 'dim': int(options['DIM'])}
+        return b'OK'
+
+    def _search(self, args):
+        index = self.indexes.get(_text(args[1]))
+        if index is None:
+            raise LocalResponseError('Unknown Index name')
+        query = _text(args[2])
+        options = args[3:]
+        params, returns, limit = {}, None, None
+        i = 0
+        while i < len(options):
+            option = _text(options[i]).upper()
+            if option == 'PARAMS':
+                count = int(options[i + 1])
+                pairs = options[i + 2:i + 2 + count]
+                params = {_text(key): value for key, value in zip(pairs[::2], pairs[1::2])}
+                i += 2 + count
+            elif option == 'RETURN':
+                count = int(options[i + 1])
+                returns = [_text(field) for field in options[i + 2:i + 2 + count]]
+                i += 2 + count
+            elif option == 'LIMIT':
+                limit = (int(options[i + 1]), int(options[i + 2]))
+                i += 3
+            elif option == 'SORTBY':
+                i += 3  # KNN 결과는 항상 거리 오름차순으로 반환
+            elif option == 'DIALECT':
+                i += 2
+            else:
+                raise LocalResponseError(f"unsupported FT.SEARCH option '{option}'")
+
+        knn = _KNN.search(query)
+        if knn is None:
+            raise LocalResponseError('LocalRedis는 KNN 질의만 지원합니다')
+        k, field, param, alias = int(knn.group(1)), knn.group(2).encode(), knn.group(3), knn.group(4)
+        prefilter = query[:query.index('=>')].strip()
+        ranges = [(name.encode(), float(lo), float(hi)) for name, lo, hi in _NUMERIC_FILTER.findall(prefilter)]
+        tags = [(name.encode(), {tag.strip().encode() for tag in values.split('|')})
+                for name, values in _TAG_FILTER.findall(prefilter)]
+
+        vector = np.frombuffer(params[param], dtype='<f4').astype(np.float64)
+        matches = []
+        for key, fields in self.hashes.items():
+            if not any(key.startswith(prefix) for prefix in index['prefixes']) or field not in fields:
+                continue
+            if any(name not in fields or not lo <= float(fields[name]) <= hi for name, lo, hi in ranges):
+                continue
+            if any(fields.get(name) not in values for name, values in tags):
+                continue
+            candidate = np.frombuffer(fields[field], dtype='<f4').astype(np.float64)
+            norm = np.linalg.norm(candidate) * np.linalg.norm(vector)
+            if norm > 0:
+                matches.append((float(1 - candidate @ vector / norm), key))
+        matches.sort()
+        matches = matches[:k]
+        if limit is not None:
+            matches = matches[limit[0]:limit[0] + limit[1]]
+
+        reply = [len(matches)]
+        for distance, key in matches:
+            fields = {**self.hashes[key], alias.encode(): repr(distance).encode()}
+            names = returns if returns is not None else [_text(name) for name in fields]
+            reply += [key, [value for name in names if name.encode() in fields
+                            for value in (name.encode(), fields[name.encode()])]]
+        return reply
+
+
+class LocalPipeline:
+    """LocalRedis.pipeline(): execute()까지 명령을 모았다가 왕복 한 번에 실행"""
+
+    def __init__(self, client: LocalRedis):
+        self.client = client
+        self.commands = []
+
+    def execute_command(self, *args):
+        self.commands.append(args)
+        return self
+
+    def execute(self):
+        if self.client.round_trip:
+            time.sleep(self.client.round_trip)
+        results = [self.client._execute(args) for args in self.commands]
+        self.commands = []
+        return results
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+
+def connect_redis():
+    """REDIS_HOST / REDIS_PORT 환경변수로 연결 (응답 bytes 그대로)"""
+    if not HAS_REDIS:
+        raise ImportError("redis 패키지가 설치되지 않았습니다. pip install redis")
+    client = redis.Redis(host=os.environ.get('REDIS_HOST', 'localhost'),
+                         port=int(os.environ.get('REDIS_PORT', '6379')))
+    client.ping()
+    return client
+
+
+def load_export_arrays(scores_path: Path = BEAN_SCORES_PATH, index_dir: Path = EMBEDDINGS_DIR):
+    """(bean_arrays, 임베딩 인덱스), 임베딩 인덱스가 없으면 FileNotFoundError"""
+    if not (index_dir / 'meta.json').exists():
+        raise FileNotFoundError(f"임베딩 인덱스가 없습니다: {index_dir} (python scripts/flavor_embeddings.py 먼저 실행)")
+    index = load_index(index_dir)
+    return bean_arrays(pd.read_csv(scores_path), index), index
+
+
+def main():
+    verify = '--verify' in sys.argv
+    local = '--local' in sys.argv
+
+    print("=== Redis 벡터 인덱스 내보내기 ===\n")
+
+    print("1. 원두 데이터 + 임베딩 로드 중...")
+    arrays, index = load_export_arrays()
+    dim = index['meta']['dim']
+    print(f"   -> 원두 {len(arrays['bean_ids'])}개, 임베딩 {int(arrays['has_vector'].sum())}개 "
+          f"({index['meta']['backend']}, {dim}차원)")
+
+    print("\n2. Redis 연결 중...")
+    if local:
+        client = LocalRedis()
+        print("   -> LocalRedis (프로세스 내 stand-in, Redis에는 쓰지 않음)")
+    else:
+        try:
+            client = connect_redis()
+        except Exception as e:
+            # 적재 없이 성공으로 끝나지 않도록 중단 (LocalRedis는 --local로만)
+            print(f"   ✗ 연결 실패 ({e})")
+            print("     (Redis 없이 적재 / 질의 경로만 확인하려면 --local)")
+            sys.exit(1)
+        print(f"   -> Redis {os.environ.get('REDIS_HOST', 'localhost')}:{os.environ.get('REDIS_PORT', '6379')}")
+
+    print(f"\n3. {INDEX_NAME} 생성 + bean:{{id}} 적재 중 (파이프라인 {PIPELINE_BATCH}개 단위)...")
+    create_index(client, dim)
+    commands = hset_commands(arrays)
+    seconds = write_commands(client, commands)
+    print(f"   -> {len(commands)}개 Hash, {seconds:.2f}s ({len(commands) / max(seconds, 1e-9):,.0f} keys/s)")
+    removed = remove_stale_keys(client, [command[1] for command in commands])
+    print(f"   -> 이전 적재에만 있던 {KEY_PREFIX}* 키 {removed}개 삭제")
+
+    if verify:
+        print(f"\n4. 하이브리드 질의 검증 중 ({VERIFY_QUERIES}개, KNN {VERIFY_K})...")
+        report = verify_queries(client, arrays, random_queries(arrays, index['flavor_vectors']))
+        print(f"   -> 재현율 {report['recall']:.3f}, 거리 불일치 {len(report['mismatches'])}건, "
+              f"질의 평균 {report['seconds'] / report['queries'] * 1000:.2f}ms")
+        for q, bean_id, distance, reference in report['mismatches'][:10]:
+            print(f"      질의 {q}: bean {bean_id} 거리 {distance:.6f} (참조 {reference:.6f})")
+        if report['mismatches'] or report['recall'] < MIN_RECALL:
+            print("\n✗ 검증 실패")
+            sys.exit(1)
+        print("\n✓ 검증 완료")
+
+
+if __name__ == '__main__':
+    main()
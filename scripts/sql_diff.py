@@ -0,0 +1,119 @@
+"""
+차분 SQL 생성용 스냅샷 비교 모듈
+
+5_generate_sql.py가 마지막으로 SQL을 생성한 시점의 테이블 상태를 행 다이제스트로 저장해 두고,
+다음 실행에서 바뀐 행만 골라냅니다.
+
+    {"version": 1, "tables": {테이블: {"columns": [...], "rows": {키 리터럴: 행 다이제스트}}}}
+
+    - 키는 SQL 리터럴 그대로 저장 ("12", "3, 80101") → DELETE 문에 바로 사용
+    - 행 다이제스트는 INSERT에 들어가는 리터럴 전체의 64비트 해시 (값 하나만 바뀌어도 변경으로 감지)
+    - 컬럼 목록이 바뀌면 (예: confidence 추가) 모든 행이 변경으로 잡힘
+    - 테이블을 여러 청크로 나눠 다이제스트를 만든 뒤 합쳐서 비교할 수 있음
+
+생성 직후의 스냅샷은 대기 파일(sql_snapshot.pending.json)에만 저장하고,
+SQL을 DB에 적용했다고 확인(promote_pending_snapshot)해야 비교 기준 스냅샷으로 교체합니다.
+적용 전에 --diff를 다시 실행하면 이전 기준과 비교하므로 바뀐 행이 누락되지 않습니다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_PATH = Path(__file__).parent.parent / 'data' / 'processed' / 'sql_snapshot.json'
+PENDING_SNAPSHOT_PATH = SNAPSHOT_PATH.with_name('sql_snapshot.pending.json')
+
+# 다이제스트 방식 / 파일 형식을 바꾸면 올려서 기존 스냅샷을 무시 (다음 --diff는 전체 SQL)
+SNAPSHOT_VERSION = 1
+
+# 기본키(id) 대신 자연 키로 비교하는 테이블
+# (bean_flavor_notes는 CSV에 id가 없고, menu_bean_mappings의 id는 매 실행 1부터 다시 매겨짐)
+DIFF_KEYS = {
+    'bean_flavor_notes': ['bean_id', 'flavor_id'],
+    'menu_bean_mappings': ['menu_id', 'bean_id'],
+}
+
+
+def diff_key_columns(table) -> list:
+    return DIFF_KEYS.get(table, ['id'])
+
+
+def row_digests(literals: pd.DataFrame, key_columns) -> pd.Series:
+    """SQL 리터럴 DataFrame → 키 리터럴을 인덱스로 하는 행 다이제스트 Series (16자리 16진수)"""
+    keys = [", ".join(row) for row in zip(*[literals[column].tolist() for column in key_columns])]
+    hashes = pd.util.hash_pandas_object(literals, index=False).tolist()
+    return pd.Series([f"{value:016x}" for value in hashes], index=keys, dtype=object)
+
+
+def previous_digests(previous: dict, columns) -> pd.Series:
+    """이전 스냅샷 항목 → 키별 다이제스트 (없으면 빈 Series, 컬럼 구성이 바뀌었으면 모두 변경으로 취급)"""
+    rows = (previous or {}).get('rows', {})
+    rows = pd.Series(list(rows.values()), index=list(rows.keys()), dtype=object)
+    if previous and previous.get('columns') != list(columns):
+        rows = rows.map(lambda _: '')
+    return rows
+
+
+def changed_rows(digests: pd.Series, previous_rows: pd.Series) -> np.ndarray:
+    """이전에 없거나 다이제스트가 다른 행 (추가 + 변경) 마스크"""
+    return digests.to_numpy() != previous_rows.reindex(digests.index).to_numpy()
+
+
+def diff_table(digests: pd.Series, columns, previous: dict = None) -> dict:
+    """
+    현재 테이블 다이제스트와 이전 스냅샷을 비교합니다.
+
+    Args:
+        digests: row_digests() 결과 (여러 청크를 이어 붙인 것도 가능, 행 순서 유지)
+        columns: 다이제스트에 쓴 컬럼 목록
+        previous: 이전 스냅샷의 {"columns", "rows"} (없으면 모든 행이 추가)
+
+    Returns:
+        {"inserted": 추가 행 마스크, "updated": 변경 행 마스크, "deleted": 삭제된 키 리터럴 목록,
+         "snapshot": 현재 상태 스냅샷}
+    """
+    if digests.index.has_duplicates:
+        duplicated = digests.index[digests.index.duplicated()].unique().tolist()[:5]
+        raise ValueError(f"차분 키가 중복된 행이 있습니다: {duplicated}")
+
+    previous_rows = previous_digests(previous, columns)
+    known = digests.index.isin(previous_rows.index)
+    deleted = previous_rows.index[~previous_rows.index.isin(digests.index)].tolist()
+
+    return {
+        'inserted': ~known,
+        'updated': known & changed_rows(digests, previous_rows),
+        'deleted': deleted,
+        'snapshot': {'columns': list(columns), 'rows': dict(zip(digests.index.tolist(), digests.tolist()))},
+    }
+
+
+def load_snapshot(path: Path = SNAPSHOT_PATH):
+    """저장된 테이블별 스냅샷 (없거나 SNAPSHOT_VERSION이 다르면 None)"""
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot['tables']
+
+
+def save_snapshot(tables: dict, path: Path = SNAPSHOT_PATH):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 스냅샷 보존)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': SNAPSHOT_VERSION, 'tables': tables}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def promote_pending_snapshot(pending_path: Path = PENDING_SNAPSHOT_PATH, path: Path = SNAPSHOT_PATH) -> bool:
+    """적용 확인된 대기 스냅샷을 비교 기준으로 교체 (대기 스냅샷이 없으면 False)"""
+    if not pending_path.exists():
+        return False
+    os.replace(pending_path, path)
+    return True
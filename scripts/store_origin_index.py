@@ -0,0 +1,207 @@
+"""
+가게 설명 → 원산지/품종/가공법 인덱스 모듈
+
+가게 description은 여러 문단인 경우가 많아 매 실행마다 전체를 다시 스캔하면
+근사 매칭(origin_matcher.py)까지 포함해 가게 수에 비례한 비용이 듭니다.
+이 모듈은 설명 텍스트의 sha256을 키로 추출 결과를 캐시하여,
+설명이 바뀐 가게만 다시 분석합니다.
+
+    {설명 해시: {"keywords": [...], "countries": [...], "varieties": [...], "processing_methods": [...]}}
+
+    - 같은 설명을 쓰는 가게(프랜차이즈 지점 등)는 한 번만 분석
+    - 키워드 목록/추출 규칙 표(별칭 → 국가, 근사 매칭 표)/INDEX_VERSION이 바뀌면 캐시 전체 무효화
+    - 현재 가게에 없는 해시는 저장 시 제거
+
+같은 인덱스로 가게 검색/필터(filter_stores, store_facets)도 제공합니다.
+
+사용법:
+    python scripts/store_origin_index.py                                  # 필드별 가게 수 (국가/품종/가공법)
+    python scripts/store_origin_index.py --country 에티오피아 --process 내추럴,허니   # 조건에 맞는 가게 목록
+    python scripts/store_origin_index.py --variety 게이샤 [stores.csv]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pandas as pd
+
+from origin_matcher import LATIN_NAMES, NO_ROMANIZE_TERMS, ORIGIN_ABBREVIATIONS
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+CACHE_PATH = Path(__file__).parent.parent / 'data' / 'processed' / 'store_origin_index.json'
+STORES_PATH = Path(__file__).parent.parent / 'data' / 'final' / 'stores.csv'
+
+# 추출 규칙(근사 매칭 포함)을 바꾸면 올려서 기존 캐시를 무효화
+INDEX_VERSION = 1
+
+FIELDS = ('keywords', 'countries', 'varieties', 'processing_methods')
+
+# CLI 필터 옵션 → filter_stores 인자
+FILTER_OPTIONS = {'--country': 'countries', '--variety': 'varieties', '--process': 'processing_methods'}
+# 필드별 가게 수 출력 시 상위 몇 개까지
+FACET_TOP = 10
+
+
+def description_hash(text) -> str:
+    """가게 설명 텍스트의 sha256 (결측값은 빈 문자열)"""
+    text = text if isinstance(text, str) else ''
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def index_signature(terms, rules: dict = None) -> str:
+    """
+    키워드 목록 + 추출 규칙 표 + 근사 매칭 표 + INDEX_VERSION의 sha256 (캐시 전체 유효성 확인용)
+
+    rules는 extract가 참조하는 표(별칭 → 국가 등)로, 키워드 목록이 같아도
+    매핑 값만 바뀐 경우를 잡아냅니다. 근사 매칭 표(origin_matcher.py)는 항상 포함합니다.
+    """
+    matcher_tables = [LATIN_NAMES, ORIGIN_ABBREVIATIONS, sorted(NO_ROMANIZE_TERMS)]
+    digest = hashlib.sha256(f'v{INDEX_VERSION}'.encode('utf-8'))
+    digest.update(json.dumps([list(dict.fromkeys(terms)), rules or {}, matcher_tables],
+                             ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_store_origin_index(stores: pd.DataFrame, extract, entries: dict = None) -> tuple[pd.DataFrame, dict]:
+    """
+    가게별 원산지 인덱스를 생성합니다.
+
+    Args:
+        stores: stores.csv (id, description)
+        extract: 설명 텍스트 → {필드: [값...]} 함수 (FIELDS 키를 모두 포함)
+        entries: 이전에 추출한 {설명 해시: 필드 dict}. 여기 있는 해시는 다시 분석하지 않음
+
+    Returns:
+        (index_df, entries): store_id + FIELDS 리스트 컬럼, 현재 가게 기준으로 갱신된 entries
+    """
+    cached = entries or {}
+    hashes = stores['description'].map(description_hash)
+    texts = dict(zip(hashes, stores['description']))
+
+    entries = {}
+    for text_hash, text in texts.items():
+        entries[text_hash] = cached[text_hash] if text_hash in cached else extract(text)
+
+    index_df = pd.DataFrame({'store_id': stores['id'].to_numpy(), 'description_hash': hashes.to_numpy()})
+    for field in FIELDS:
+        index_df[field] = [entries[text_hash][field] for text_hash in index_df['description_hash']]
+    return index_df, entries
+
+
+def load_store_origin_index(stores: pd.DataFrame, extract, terms, rules: dict = None,
+                            cache_path: Path = CACHE_PATH) -> pd.DataFrame:
+    """
+    캐시된 추출 결과를 재사용하여 인덱스를 만들고, 바뀐 내용이 있으면 캐시를 저장합니다.
+
+    Args:
+        extract: 설명 텍스트 → {필드: [값...]} 함수
+        terms: 추출에 쓰는 키워드 목록 (바뀌면 캐시 전체 무효화)
+        rules: extract가 참조하는 표 {이름: 표} (JSON 직렬화 가능, 바뀌면 캐시 전체 무효화)
+    """
+    signature = index_signature(terms, rules)
+    entries = {}
+    if cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('signature') == signature:
+            entries = cached['entries']
+
+    index_df, updated = build_store_origin_index(stores, extract, entries)
+    parsed = len(set(updated) - set(entries))
+    print(f"  - 가게 원산지 인덱스: 설명 {len(updated)}개 중 캐시 {len(updated) - parsed}개, 새로 분석 {parsed}개")
+
+    if updated.keys() != entries.keys():
+        # 임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 캐시 보존)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'entries': updated}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    return index_df
+
+
+# ============================================================================
+# 가게 검색 / 필터
+# ============================================================================
+
+def filter_stores(index_df: pd.DataFrame, countries=(), varieties=(), processing_methods=()) -> pd.DataFrame:
+    """
+    조건을 모두 만족하는 가게 행을 반환합니다. (각 조건 안에서는 하나라도 포함되면 일치)
+
+    예: filter_stores(index_df, countries=['에티오피아'], processing_methods=['내추럴', '허니'])
+    """
+    mask = pd.Series(True, index=index_df.index)
+    for field, values in [('countries', countries), ('varieties', varieties),
+                          ('processing_methods', processing_methods)]:
+        if not values:
+            continue
+        exploded = index_df[field].explode()
+        matched = exploded[exploded.isin(values)].index.unique()
+        mask &= index_df.index.isin(matched)
+    return index_df[mask]
+
+
+def store_facets(index_df: pd.DataFrame) -> dict:
+    """필터 UI용 필드별 값 → 가게 수 (가게 수 내림차순)"""
+    facets = {}
+    for field in ('countries', 'varieties', 'processing_methods'):
+        counts = index_df[['store_id', field]].explode(field).dropna().drop_duplicates()[field].value_counts()
+        facets[field] = counts.to_dict()
+    return facets
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+
+def parse_filter_args(args) -> tuple[dict, list]:
+    """["--country", "에티오피아,케냐", "stores.csv"] → ({"countries": [...]}, 나머지 인자)"""
+    filters, rest = {}, []
+    i = 0
+    while i < len(args):
+        if args[i] in FILTER_OPTIONS and i + 1 < len(args):
+            values = [value.strip() for value in args[i + 1].split(',') if value.strip()]
+            filters.setdefault(FILTER_OPTIONS[args[i]], []).extend(values)
+            i += 2
+        else:
+            rest.append(args[i])
+            i += 1
+    return filters, rest
+
+
+def main():
+    # 추출 규칙은 4_map_menu_beans.py와 같은 것을 써야 캐시를 공유
+    map_menu_beans = import_module('4_map_menu_beans')
+    filters, rest = parse_filter_args(sys.argv[1:])
+    stores_path = Path(rest[0]) if rest else STORES_PATH
+
+    print("=== 가게 원산지 인덱스 ===\n")
+    stores = pd.read_csv(stores_path)
+    index_df = load_store_origin_index(stores, map_menu_beans.extract_store_origins, map_menu_beans.ALL_TERMS,
+                                       map_menu_beans.STORE_ORIGIN_RULES)
+    names = dict(zip(stores['id'], stores['name'])) if 'name' in stores else {}
+
+    if not filters:
+        for field, counts in store_facets(index_df).items():
+            top = ', '.join(f"{value} {count}" for value, count in list(counts.items())[:FACET_TOP])
+            print(f"  - {field} ({len(counts)}종): {top or '없음'}")
+        return
+
+    matched = filter_stores(index_df, **filters)
+    conditions = ', '.join(f"{field}={'|'.join(values)}" for field, values in filters.items())
+    print(f"\n{conditions}: 가게 {len(matched)}개 / 전체 {len(index_df)}개")
+    for row in matched.itertuples(index=False):
+        values = [getattr(row, field) for field in ('countries', 'varieties', 'processing_methods')]
+        details = ' / '.join(', '.join(value) for value in values if value)
+        print(f"  - [{row.store_id}] {names.get(row.store_id, '')}: {details}")
+
+
+if __name__ == '__main__':
+    main()
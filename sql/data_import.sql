@@ -4377,8 +4377,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (1, 70103),
 (1, 70201),
 (1, 80103),
-(1, 80401),
-(1, 90101),
 (2, 10101),
 (2, 10402),
 (2, 70202),
@@ -4448,7 +4446,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (16, 10307),
 (16, 70102),
 (16, 40104),
-(17, 50101),
 (17, 70103),
 (17, 70201),
 (17, 80103),
@@ -4507,7 +4504,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (28, 20105),
 (28, 20101),
 (28, 10201),
-(28, 80401),
 (29, 20201),
 (29, 10302),
 (29, 20105),
@@ -4587,8 +4583,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (45, 40104),
 (45, 40107),
 (45, 40201),
-(45, 80401),
-(45, 80301),
 (46, 60302),
 (46, 10307),
 (46, 70201),
@@ -4632,7 +4626,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (54, 10202),
 (54, 30305),
 (54, 20105),
-(54, 80401),
 (55, 10303),
 (55, 70202),
 (55, 80103),
@@ -4664,7 +4657,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (61, 70102),
 (61, 801),
 (61, 80101),
-(61, 90102),
 (61, 10402),
 (61, 80104),
 (62, 10403),
@@ -4751,12 +4743,10 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (78, 70103),
 (78, 20105),
 (79, 10201),
-(79, 10601),
 (79, 20105),
 (79, 70202),
 (79, 70103),
 (80, 10103),
-(80, 10205),
 (80, 20101),
 (80, 70202),
 (80, 80101),
@@ -4834,8 +4824,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (96, 90203),
 (96, 70201),
 (96, 20105),
-(97, 60101),
-(97, 90103),
 (97, 10404),
 (97, 70201),
 (97, 70202),
@@ -4990,7 +4978,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (128, 90202),
 (129, 70103),
 (129, 80101),
-(129, 10408),
 (129, 70201),
 (129, 20105),
 (130, 10305),
@@ -5085,7 +5072,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (148, 501),
 (149, 90201),
 (149, 90202),
-(149, 80201),
 (149, 70201),
 (149, 20105),
 (149, 201),
@@ -5258,7 +5244,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (184, 10201),
 (184, 70201),
 (184, 90203),
-(185, 90103),
 (185, 70103),
 (185, 101),
 (185, 40107),
@@ -5388,7 +5373,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (211, 10401),
 (211, 70202),
 (211, 40104),
-(211, 60101),
 (212, 10202),
 (212, 80101),
 (212, 80102),
@@ -5596,7 +5580,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (253, 70201),
 (253, 80104),
 (254, 20105),
-(254, 10105),
 (254, 10103),
 (254, 70202),
 (254, 20201),
@@ -5854,7 +5837,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (307, 80104),
 (308, 10402),
 (308, 70201),
-(308, 70301),
 (308, 10302),
 (308, 20105),
 (309, 80104),
@@ -5879,7 +5861,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (312, 70201),
 (313, 10301),
 (313, 10401),
-(313, 106),
 (313, 20106),
 (313, 70103),
 (314, 10101),
@@ -6138,7 +6119,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (366, 70201),
 (367, 70201),
 (367, 70101),
-(367, 904),
 (367, 10306),
 (368, 70202),
 (368, 701),
@@ -6153,7 +6133,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (370, 10101),
 (370, 20105),
 (370, 70202),
-(370, 80201),
 (370, 90201),
 (371, 10102),
 (371, 70201),
@@ -6174,7 +6153,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (374, 70201),
 (374, 20105),
 (374, 104),
-(374, 10000),
 (375, 10403),
 (375, 10303),
 (375, 20105),
@@ -6201,7 +6179,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (379, 80104),
 (380, 10305),
 (380, 20103),
-(380, 80201),
 (380, 701),
 (380, 70201),
 (381, 10102),
@@ -6241,7 +6218,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (388, 10303),
 (388, 20105),
 (388, 30301),
-(388, 90302),
 (389, 90201),
 (389, 70103),
 (389, 104),
@@ -6275,7 +6251,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (395, 90201),
 (395, 10403),
 (395, 10306),
-(395, 40301),
 (396, 10402),
 (396, 10201),
 (396, 20105),
@@ -6300,7 +6275,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (400, 10102),
 (400, 70202),
 (400, 80103),
-(400, 80301),
 (400, 90202),
 (401, 10103),
 (401, 20105),
@@ -6602,7 +6576,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (463, 80103),
 (463, 70201),
 (463, 40104),
-(464, 50101),
 (464, 40107),
 (464, 40201),
 (464, 10402),
@@ -6646,7 +6619,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (472, 70202),
 (472, 90202),
 (472, 802),
-(472, 108),
 (473, 10402),
 (473, 20105),
 (473, 10302),
@@ -6716,7 +6688,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (486, 20105),
 (486, 40104),
 (486, 80103),
-(487, 90103),
 (487, 80103),
 (487, 10307),
 (487, 20105),
@@ -6726,7 +6697,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (488, 10402),
 (488, 90203),
 (489, 70201),
-(489, 70304),
 (489, 20105),
 (489, 20101),
 (489, 80104),
@@ -6771,7 +6741,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (498, 10402),
 (498, 80101),
 (498, 80102),
-(498, 10208),
 (498, 20105),
 (499, 70103),
 (499, 80103),
@@ -6874,7 +6843,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (518, 10201),
 (519, 20105),
 (519, 80103),
-(519, 60201),
 (519, 80101),
 (519, 10402),
 (519, 80104),
@@ -7083,7 +7051,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (562, 70102),
 (562, 20105),
 (562, 20101),
-(562, 30103),
 (563, 70102),
 (563, 70201),
 (563, 80104),
@@ -7114,11 +7081,9 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (568, 10202),
 (568, 70201),
 (568, 20105),
-(569, 80201),
 (569, 70202),
 (569, 20105),
 (569, 20101),
-(569, 10106),
 (570, 70202),
 (570, 801),
 (570, 40107),
@@ -7197,7 +7162,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (585, 10201),
 (585, 70202),
 (585, 70102),
-(585, 403),
 (585, 40201),
 (585, 10402),
 (586, 10101),
@@ -7225,7 +7189,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (590, 40104),
 (590, 80103),
 (591, 80103),
-(591, 105),
 (591, 50402),
 (591, 40104),
 (591, 20202),
@@ -7283,7 +7246,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (602, 20103),
 (602, 70201),
 (602, 70202),
-(602, 70301),
 (602, 90202),
 (603, 10201),
 (603, 80101),
@@ -7372,13 +7334,11 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (621, 70202),
 (621, 60303),
 (621, 60301),
-(621, 40302),
 (621, 10302),
 (622, 80103),
 (622, 70101),
 (622, 10308),
 (622, 20105),
-(622, 30103),
 (623, 10402),
 (623, 10303),
 (623, 70201),
@@ -7386,7 +7346,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (623, 30305),
 (624, 70102),
 (624, 70201),
-(624, 10205),
 (624, 20105),
 (625, 10201),
 (625, 20105),
@@ -7411,7 +7370,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (629, 20105),
 (629, 70201),
 (629, 80104),
-(629, 80201),
 (630, 10402),
 (630, 90201),
 (630, 70201),
@@ -7490,7 +7448,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (646, 70103),
 (646, 70201),
 (646, 80104),
-(646, 10409),
 (646, 60302),
 (647, 70202),
 (647, 20105),
@@ -7627,7 +7584,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (675, 70103),
 (675, 20105),
 (675, 90202),
-(676, 10107),
 (676, 20105),
 (676, 70103),
 (676, 80104),
@@ -7763,7 +7719,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (703, 10402),
 (704, 80102),
 (704, 90201),
-(704, 70301),
 (704, 80103),
 (704, 40104),
 (705, 10403),
@@ -7810,7 +7765,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (713, 70202),
 (713, 20105),
 (713, 90203),
-(713, 40302),
 (714, 70102),
 (714, 70201),
 (714, 10302),
@@ -8005,7 +7959,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (753, 70101),
 (753, 70201),
 (753, 40104),
-(754, 10405),
 (754, 70202),
 (754, 80104),
 (754, 90201),
@@ -8244,7 +8197,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (803, 70201),
 (803, 70103),
 (803, 20105),
-(803, 90301),
 (803, 40104),
 (804, 70201),
 (804, 90201),
@@ -8335,7 +8287,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (821, 801),
 (821, 80101),
 (822, 10402),
-(822, 70302),
 (822, 20105),
 (822, 90201),
 (822, 10201),
@@ -8412,7 +8363,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (837, 90201),
 (838, 10403),
 (838, 90203),
-(838, 70301),
 (838, 70201),
 (839, 10201),
 (839, 10402),
@@ -8600,7 +8550,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (875, 80103),
 (875, 80104),
 (875, 60301),
-(875, 60201),
 (876, 90201),
 (876, 90202),
 (876, 802),
@@ -8620,12 +8569,9 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (879, 80103),
 (879, 80104),
 (879, 801),
-(879, 30203),
 (880, 10102),
 (880, 20203),
 (880, 20105),
-(880, 30205),
-(880, 80301),
 (881, 10302),
 (881, 70202),
 (881, 80104),
@@ -8829,7 +8775,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (923, 20105),
 (923, 90203),
 (923, 80102),
-(923, 80202),
 (924, 90201),
 (924, 20201),
 (924, 80104),
@@ -8862,7 +8807,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (929, 104),
 (929, 20105),
 (930, 10404),
-(930, 70301),
 (930, 20105),
 (930, 70201),
 (931, 70202),
@@ -8879,7 +8823,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (933, 20105),
 (933, 10102),
 (933, 40104),
-(933, 60201),
 (934, 10102),
 (934, 20201),
 (934, 80104),
@@ -8919,7 +8862,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (942, 70102),
 (942, 70202),
 (942, 90201),
-(942, 90101),
 (942, 60303),
 (943, 10305),
 (943, 70103),
@@ -8952,7 +8894,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (949, 902),
 (949, 20105),
 (949, 201),
-(949, 40301),
 (950, 10401),
 (950, 90201),
 (950, 80104),
@@ -8990,7 +8931,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (957, 10401),
 (957, 20105),
 (957, 90202),
-(957, 50101),
 (957, 50303),
 (958, 10101),
 (958, 10401),
@@ -9031,7 +8971,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (965, 10302),
 (965, 80102),
 (965, 80101),
-(966, 10105),
 (966, 20101),
 (966, 70202),
 (966, 80101),
@@ -9117,7 +9056,6 @@ INSERT INTO bean_flavor_notes (bean_id, flavor_id) VALUES
 (983, 70201),
 (983, 10202),
 (983, 70103),
-(983, 30103),
 (984, 10307),
 (984, 902),
 (984, 10302),
@@ -9553,7 +9491,7 @@ INSERT INTO bean_scores (
     (74, 8, 9, 7, 3, 8, 9, 8, 92, 'LIGHT'),
     (75, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (76, 8, 9, 5, 7, 8, 9, 8, 92, 'MEDIUM'),
-    (77, 8, 8, 7, 2, 9, 9, 8, 92, 'LIGHT'),
+    (77, 8, 8, 7, 3, 9, 9, 8, 92, 'LIGHT'),
     (78, 9, 8, 6, 2, 9, 9, 8, 93, 'LIGHT'),
     (79, 9, 9, 6, 3, 9, 9, 8, 94, 'LIGHT'),
     (80, 9, 9, 6, 6, 9, 9, 8, 94, 'MEDIUM'),
@@ -10067,7 +10005,7 @@ INSERT INTO bean_scores (
     (588, 9, 9, 6, 2, 9, 9, 9, 95, 'LIGHT'),
     (589, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (590, 7, 8, 7, 3, 8, 8, 7, 88, 'LIGHT'),
-    (591, 8, 9, 7, 2, 8, 8, 8, 91, 'LIGHT'),
+    (591, 8, 9, 7, 3, 8, 8, 8, 91, 'LIGHT'),
     (592, 8, 8, 6, 6, 9, 9, 8, 92, 'MEDIUM'),
     (593, 9, 9, 7, 3, 9, 9, 8, 94, 'LIGHT'),
     (594, 9, 8, 7, 3, 9, 9, 8, 93, 'LIGHT'),
@@ -0,0 +1,282 @@
+-- 향미 계층 closure (조상 → 자손, 자기 자신은 depth 0)
+-- Generated by scripts/flavor_hierarchy.py from sql/flavor_prod.sql
+
+INSERT INTO flavor_closure (ancestor_id, descendant_id, depth)
+VALUES (1, 1, 0),
+       (1, 101, 1),
+       (1, 102, 1),
+       (1, 103, 1),
+       (1, 104, 1),
+       (1, 10101, 2),
+       (1, 10102, 2),
+       (1, 10103, 2),
+       (1, 10104, 2),
+       (1, 10201, 2),
+       (1, 10202, 2),
+       (1, 10301, 2),
+       (1, 10302, 2),
+       (1, 10303, 2),
+       (1, 10304, 2),
+       (1, 10305, 2),
+       (1, 10306, 2),
+       (1, 10307, 2),
+       (1, 10308, 2),
+       (1, 10401, 2),
+       (1, 10402, 2),
+       (1, 10403, 2),
+       (1, 10404, 2),
+       (2, 2, 0),
+       (2, 201, 1),
+       (2, 202, 1),
+       (2, 20101, 2),
+       (2, 20102, 2),
+       (2, 20103, 2),
+       (2, 20104, 2),
+       (2, 20105, 2),
+       (2, 20106, 2),
+       (2, 20201, 2),
+       (2, 20202, 2),
+       (2, 20203, 2),
+       (2, 20204, 2),
+       (3, 3, 0),
+       (3, 301, 1),
+       (3, 302, 1),
+       (3, 303, 1),
+       (3, 304, 1),
+       (3, 30201, 2),
+       (3, 30202, 2),
+       (3, 30301, 2),
+       (3, 30302, 2),
+       (3, 30303, 2),
+       (3, 30304, 2),
+       (3, 30305, 2),
+       (4, 4, 0),
+       (4, 401, 1),
+       (4, 402, 1),
+       (4, 40101, 2),
+       (4, 40102, 2),
+       (4, 40103, 2),
+       (4, 40104, 2),
+       (4, 40105, 2),
+       (4, 40106, 2),
+       (4, 40107, 2),
+       (4, 40108, 2),
+       (4, 40201, 2),
+       (4, 40202, 2),
+       (4, 40203, 2),
+       (4, 40204, 2),
+       (4, 40205, 2),
+       (4, 40206, 2),
+       (5, 5, 0),
+       (5, 501, 1),
+       (5, 502, 1),
+       (5, 503, 1),
+       (5, 504, 1),
+       (5, 50301, 2),
+       (5, 50302, 2),
+       (5, 50303, 2),
+       (5, 50304, 2),
+       (5, 50401, 2),
+       (5, 50402, 2),
+       (6, 6, 0),
+       (6, 601, 1),
+       (6, 602, 1),
+       (6, 603, 1),
+       (6, 60301, 2),
+       (6, 60302, 2),
+       (6, 60303, 2),
+       (6, 60304, 2),
+       (7, 7, 0),
+       (7, 701, 1),
+       (7, 702, 1),
+       (7, 70101, 2),
+       (7, 70102, 2),
+       (7, 70103, 2),
+       (7, 70201, 2),
+       (7, 70202, 2),
+       (8, 8, 0),
+       (8, 801, 1),
+       (8, 802, 1),
+       (8, 803, 1),
+       (8, 804, 1),
+       (8, 805, 1),
+       (8, 80101, 2),
+       (8, 80102, 2),
+       (8, 80103, 2),
+       (8, 80104, 2),
+       (9, 9, 0),
+       (9, 901, 1),
+       (9, 902, 1),
+       (9, 90201, 2),
+       (9, 90202, 2),
+       (9, 90203, 2),
+       (101, 101, 0),
+       (101, 10101, 1),
+       (101, 10102, 1),
+       (101, 10103, 1),
+       (101, 10104, 1),
+       (102, 102, 0),
+       (102, 10201, 1),
+       (102, 10202, 1),
+       (103, 103, 0),
+       (103, 10301, 1),
+       (103, 10302, 1),
+       (103, 10303, 1),
+       (103, 10304, 1),
+       (103, 10305, 1),
+       (103, 10306, 1),
+       (103, 10307, 1),
+       (103, 10308, 1),
+       (104, 104, 0),
+       (104, 10401, 1),
+       (104, 10402, 1),
+       (104, 10403, 1),
+       (104, 10404, 1),
+       (201, 201, 0),
+       (201, 20101, 1),
+       (201, 20102, 1),
+       (201, 20103, 1),
+       (201, 20104, 1),
+       (201, 20105, 1),
+       (201, 20106, 1),
+       (202, 202, 0),
+       (202, 20201, 1),
+       (202, 20202, 1),
+       (202, 20203, 1),
+       (202, 20204, 1),
+       (301, 301, 0),
+       (302, 302, 0),
+       (302, 30201, 1),
+       (302, 30202, 1),
+       (303, 303, 0),
+       (303, 30301, 1),
+       (303, 30302, 1),
+       (303, 30303, 1),
+       (303, 30304, 1),
+       (303, 30305, 1),
+       (304, 304, 0),
+       (401, 401, 0),
+       (401, 40101, 1),
+       (401, 40102, 1),
+       (401, 40103, 1),
+       (401, 40104, 1),
+       (401, 40105, 1),
+       (401, 40106, 1),
+       (401, 40107, 1),
+       (401, 40108, 1),
+       (402, 402, 0),
+       (402, 40201, 1),
+       (402, 40202, 1),
+       (402, 40203, 1),
+       (402, 40204, 1),
+       (402, 40205, 1),
+       (402, 40206, 1),
+       (501, 501, 0),
+       (502, 502, 0),
+       (503, 503, 0),
+       (503, 50301, 1),
+       (503, 50302, 1),
+       (503, 50303, 1),
+       (503, 50304, 1),
+       (504, 504, 0),
+       (504, 50401, 1),
+       (504, 50402, 1),
+       (601, 601, 0),
+       (602, 602, 0),
+       (603, 603, 0),
+       (603, 60301, 1),
+       (603, 60302, 1),
+       (603, 60303, 1),
+       (603, 60304, 1),
+       (701, 701, 0),
+       (701, 70101, 1),
+       (701, 70102, 1),
+       (701, 70103, 1),
+       (702, 702, 0),
+       (702, 70201, 1),
+       (702, 70202, 1),
+       (801, 801, 0),
+       (801, 80101, 1),
+       (801, 80102, 1),
+       (801, 80103, 1),
+       (801, 80104, 1),
+       (802, 802, 0),
+       (803, 803, 0),
+       (804, 804, 0),
+       (805, 805, 0),
+       (901, 901, 0),
+       (902, 902, 0),
+       (902, 90201, 1),
+       (902, 90202, 1),
+       (902, 90203, 1),
+       (10101, 10101, 0),
+       (10102, 10102, 0),
+       (10103, 10103, 0),
+       (10104, 10104, 0),
+       (10201, 10201, 0),
+       (10202, 10202, 0),
+       (10301, 10301, 0),
+       (10302, 10302, 0),
+       (10303, 10303, 0),
+       (10304, 10304, 0),
+       (10305, 10305, 0),
+       (10306, 10306, 0),
+       (10307, 10307, 0),
+       (10308, 10308, 0),
+       (10401, 10401, 0),
+       (10402, 10402, 0),
+       (10403, 10403, 0),
+       (10404, 10404, 0),
+       (20101, 20101, 0),
+       (20102, 20102, 0),
+       (20103, 20103, 0),
+       (20104, 20104, 0),
+       (20105, 20105, 0),
+       (20106, 20106, 0),
+       (20201, 20201, 0),
+       (20202, 20202, 0),
+       (20203, 20203, 0),
+       (20204, 20204, 0),
+       (30201, 30201, 0),
+       (30202, 30202, 0),
+       (30301, 30301, 0),
+       (30302, 30302, 0),
+       (30303, 30303, 0),
+       (30304, 30304, 0),
+       (30305, 30305, 0),
+       (40101, 40101, 0),
+       (40102, 40102, 0),
+       (40103, 40103, 0),
+       (40104, 40104, 0),
+       (40105, 40105, 0),
+       (40106, 40106, 0),
+       (40107, 40107, 0),
+       (40108, 40108, 0),
+       (40201, 40201, 0),
+       (40202, 40202, 0),
+       (40203, 40203, 0),
+       (40204, 40204, 0),
+       (40205, 40205, 0),
+       (40206, 40206, 0),
+       (50301, 50301, 0),
+       (50302, 50302, 0),
+       (50303, 50303, 0),
+       (50304, 50304, 0),
+       (50401, 50401, 0),
+       (50402, 50402, 0),
+       (60301, 60301, 0),
+       (60302, 60302, 0),
+       (60303, 60303, 0),
+       (60304, 60304, 0),
+       (70101, 70101, 0),
+       (70102, 70102, 0),
+       (70103, 70103, 0),
+       (70201, 70201, 0),
+       (70202, 70202, 0),
+       (80101, 80101, 0),
+       (80102, 80102, 0),
+       (80103, 80103, 0),
+       (80104, 80104, 0),
+       (90201, 90201, 0),
+       (90202, 90202, 0),
+       (90203, 90203, 0);
@@ -94,6 +94,17 @@ CREATE TABLE IF NOT EXISTS flavors
     updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
+CREATE TABLE IF NOT EXISTS flavor_closure
+(
+    ancestor_id   BIGINT NOT NULL,
+    descendant_id BIGINT NOT NULL,
+    depth         TINYINT NOT NULL COMMENT '계층 거리 (0: 자기 자신)',
+    PRIMARY KEY (ancestor_id, descendant_id),
+    KEY idx_descendant (descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES flavors (id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES flavors (id) ON DELETE CASCADE
+);
+
 
 CREATE TABLE IF NOT EXISTS tasting_notes
 (
@@ -177,8 +188,10 @@ CREATE TABLE IF NOT EXISTS menu_bean_mappings
     menu_id    BIGINT  NOT NULL,
     bean_id    BIGINT  NOT NULL,
     is_blended BOOLEAN NOT NULL DEFAULT FALSE,
+    confidence DECIMAL(3, 2)   DEFAULT NULL COMMENT '매핑 신뢰도 (메뉴명 > 가게 설명, NULL: 신뢰도 없이 적재된 매핑)',
     created_at TIMESTAMP        DEFAULT CURRENT_TIMESTAMP,
     UNIQUE KEY uk_menu_bean (menu_id, bean_id),
+    KEY idx_bean_confidence (bean_id, confidence),
     FOREIGN KEY (menu_id) REFERENCES menus (id) ON DELETE CASCADE,
     FOREIGN KEY (bean_id) REFERENCES beans (id) ON DELETE CASCADE
 );